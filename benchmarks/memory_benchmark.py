@@ -0,0 +1,56 @@
+"""
+Per-citizen memory: standalone Citizen objects vs the columnar PopulationStore.
+
+Usage:
+    python benchmarks/memory_benchmark.py [--sizes 100000,1000000] [--object-sample 100000]
+
+Citizen objects are measured with tracemalloc on a sample (building a million
+of them takes a while) and extrapolated; the store is measured at full size.
+"""
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from models.citizen import Citizen
+from models.population import PopulationStore
+
+def measure_objects(count: int) -> int:
+    """Bytes allocated for `count` Citizen objects"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    citizens = [Citizen(random.randint(0, 90), random.choice(['Male', 'Female']),
+                        f"Region_{random.randint(1, 10)}") for _ in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del citizens
+    return allocated
+
+def measure_store(count: int) -> int:
+    """Bytes of column storage for `count` citizens, trimmed to size"""
+    store = PopulationStore(capacity=count)
+    store.add_random(count, np.random.default_rng(0))
+    return sum(column[:len(store)].nbytes for column in store.columns.values())
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='100000,1000000', help="Comma-separated population sizes")
+    parser.add_argument('--object-sample', type=int, default=100_000,
+                        help="Largest number of Citizen objects to actually build")
+    args = parser.parse_args()
+
+    print(f"{'citizens':>10} {'objects MB':>12} {'store MB':>10} {'B/obj':>8} {'B/row':>7} {'ratio':>6}")
+    for size in (int(value) for value in args.sizes.split(',')):
+        sample = min(size, args.object_sample)
+        object_bytes = measure_objects(sample) / sample
+        store_bytes = measure_store(size) / size
+        print(f"{size:>10,} {object_bytes * size / 2**20:>12.1f} {store_bytes * size / 2**20:>10.1f} "
+              f"{object_bytes:>8.0f} {store_bytes:>7.0f} {object_bytes / store_bytes:>6.1f}x")
+
+if __name__ == '__main__':
+    main()
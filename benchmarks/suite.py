@@ -0,0 +1,216 @@
+"""
+Hot-path timings of every subsystem across population sizes.
+
+Usage:
+    python benchmarks/suite.py [--sizes 1000,10000,100000,1000000] [--output output/benchmarks.json]
+                               [--only news_cycle,...] [--calls 25]
+                               [--compare benchmarks/baseline.json] [--threshold 0.2]
+                               [--save-baseline benchmarks/baseline.json]
+
+For each population size a seeded Simulation is set up, then each
+benchmark below is timed over a fixed number of calls and reported as the
+median seconds per call.
+
+The results file is JSON: machine details, then for every benchmark the
+seconds per call at each size. A baseline is a results file with a
+'threshold' entry; --compare exits with status 1 when any benchmark runs
+more than `threshold` (default 20%) slower than its baseline at the same
+size. Timings only compare on the same machine, so save a baseline on the
+machine that runs the comparison.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from config import MEDIA_INFLUENCE_PASSES
+from models.legislative import Legislation
+from models.referendum import ReferendumSystem
+from models.society import SocietySystem
+from simulation import Simulation
+
+FORMAT = 'technocratia-benchmarks'
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_THRESHOLD = 0.2
+SEED = 7
+
+def _society_create(simulation: Simulation) -> Callable[[], None]:
+    size = simulation.initial_population
+    return lambda: SocietySystem(size, rng=np.random.default_rng(SEED))
+
+def _update_population(simulation: Simulation) -> Callable[[], None]:
+    return simulation.society.update_population
+
+def _satisfaction_score(simulation: Simulation) -> Callable[[], None]:
+    return simulation.society.get_satisfaction_score
+
+def _social_tensions(simulation: Simulation) -> Callable[[], None]:
+    return lambda: simulation.society.calculate_social_tensions(
+        simulation.economy,
+        media_influence=simulation.media_landscape.get_tension_impact(),
+        policy_effects=simulation.parliament.get_active_legislation())
+
+def _news_cycle(simulation: Simulation) -> Callable[[], None]:
+    return simulation._news_cycle
+
+def _fused_sweep(simulation: Simulation) -> Callable[[], None]:
+    # The citizen update and a news cycle in one chunked sweep (Simulation(fused_sweep=True))
+    society = simulation.society
+    news_cycle = simulation.media_landscape.simulate_news_cycle()
+    return lambda: society.for_each_chunk([
+        society.update_engine.kernel({'growth': 0.01}, {'cohesion': 0.5}, {'stability': 0.6}),
+        simulation.media_engine.kernel(news_cycle, MEDIA_INFLUENCE_PASSES)])
+
+def _referendum_vote(simulation: Simulation) -> Callable[[], None]:
+    # The cast path of Simulation.close_referendum, repeated on one active referendum
+    referendum = simulation.open_referendum("Benchmark referendum", "Benchmark referendum")
+    system = simulation.parliament.referendum_system
+    system.start_referendum(referendum)
+    coverage = simulation.media_landscape.get_referendum_coverage(referendum)
+    positions = simulation.political_system.get_party_positions(referendum)
+    return lambda: system.cast_bulk(referendum, simulation.society.get_voter_columns(ReferendumSystem.VOTER_COLUMNS),
+                                    coverage, positions)
+
+def _parliament_vote(simulation: Simulation) -> Callable[[], None]:
+    parliament = simulation.parliament
+
+    def vote() -> None:
+        legislation = Legislation("Benchmark act", "benchmark", "")
+        parliament.proposed_legislation.append(legislation)
+        parliament.vote_on_legislation(legislation, ignore_quorum=True)
+    return vote
+
+def _economy_month(simulation: Simulation) -> Callable[[], None]:
+    return simulation.economy.simulate_month
+
+# Name -> factory returning the timed call for a set-up simulation
+BENCHMARKS: Dict[str, Callable[[Simulation], Callable[[], None]]] = {
+    'society_create': _society_create,
+    'update_population': _update_population,
+    'satisfaction_score': _satisfaction_score,
+    'social_tensions': _social_tensions,
+    'news_cycle': _news_cycle,
+    'fused_sweep': _fused_sweep,
+    'referendum_vote': _referendum_vote,
+    'parliament_vote': _parliament_vote,
+    'economy_month': _economy_month,
+}
+
+# A dropped SocietySystem is a reference cycle (store <-> listeners) that the
+# collector rarely reaches in a tight loop; at 1M rows they would exhaust memory
+COLLECT_BETWEEN_CALLS = {'society_create'}
+
+def time_call(call: Callable[[], None], calls: int = 25, collect: bool = False) -> float:
+    """
+    Median seconds per call over `calls` individually timed calls.
+
+    The call count is fixed rather than sized to a time budget, so stateful
+    benchmarks (the population grows, the economy compounds) walk through
+    the same states on every run and the timings stay comparable.
+
+    Args:
+        call: Benchmark body
+        calls: Timed calls
+        collect: Run the garbage collector (untimed) before each call
+    """
+    call()  # Warm-up
+    timings = []
+    for _ in range(calls):
+        if collect:
+            gc.collect()
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+def run_suite(sizes: Sequence[int] = DEFAULT_SIZES, names: Optional[Sequence[str]] = None,
+              calls: int = 25, log: Callable[[str], None] = print) -> Dict:
+    """
+    Time the benchmarks at every size.
+
+    Returns:
+        Results dict: {'format', 'machine', 'sizes', 'results': {benchmark: {size: seconds}}}
+    """
+    names = list(names or BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+    results: Dict[str, Dict[str, float]] = {name: {} for name in names}
+    for size in sizes:
+        simulation = Simulation(seed=SEED, initial_population=size, quiet=True, workers=1)
+        simulation.setup()
+        try:
+            for name in names:
+                seconds = time_call(BENCHMARKS[name](simulation), calls, name in COLLECT_BETWEEN_CALLS)
+                results[name][str(size)] = seconds
+                log(f"{name:<20} {size:>10,} {seconds * 1e3:>12.3f} ms")
+        finally:
+            simulation.cleanup()
+    return {
+        'format': FORMAT,
+        'machine': {'python': platform.python_version(), 'numpy': np.__version__,
+                    'platform': platform.platform(), 'cpus': os.cpu_count()},
+        'sizes': list(sizes),
+        'results': results,
+    }
+
+def compare(results: Dict, baseline: Dict, threshold: Optional[float] = None) -> List[str]:
+    """
+    Regressions of `results` against `baseline`: one message per benchmark and
+    size that is more than `threshold` (default: the baseline's) slower.
+    Benchmarks or sizes missing from either side are not compared.
+    """
+    if threshold is None:
+        threshold = baseline.get('threshold', DEFAULT_THRESHOLD)
+    regressions = []
+    for name, timings in results['results'].items():
+        for size, seconds in timings.items():
+            reference = baseline['results'].get(name, {}).get(size)
+            if reference and seconds > reference * (1 + threshold):
+                regressions.append(f"{name} at {int(size):,}: {seconds * 1e3:.3f} ms vs "
+                                   f"{reference * 1e3:.3f} ms baseline (+{seconds / reference - 1:.0%})")
+    return regressions
+
+def _write(path: str, data: Dict) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as handle:
+        json.dump(data, handle, indent=2)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help="Comma-separated population sizes")
+    parser.add_argument('--only', help="Comma-separated benchmark names (default: all)")
+    parser.add_argument('--calls', type=int, default=25, help="Timed calls per benchmark; the median is kept")
+    parser.add_argument('--output', default='output/benchmarks.json', help="Results file")
+    parser.add_argument('--compare', help="Baseline results file to check for regressions")
+    parser.add_argument('--threshold', type=float, help="Allowed slowdown as a fraction (default: the baseline's, or 0.2)")
+    parser.add_argument('--save-baseline', help="Also write the results as a baseline file")
+    args = parser.parse_args()
+
+    sizes = [int(value) for value in args.sizes.split(',')]
+    results = run_suite(sizes, args.only.split(',') if args.only else None, args.calls)
+    _write(args.output, results)
+    if args.save_baseline:
+        threshold = args.threshold if args.threshold is not None else DEFAULT_THRESHOLD
+        _write(args.save_baseline, {**results, 'threshold': threshold})
+    if args.compare:
+        with open(args.compare) as handle:
+            regressions = compare(results, json.load(handle), args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions")
+
+if __name__ == '__main__':
+    main()
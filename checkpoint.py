@@ -0,0 +1,169 @@
+"""
+Checkpoints of a running Simulation.
+
+A checkpoint is a directory:
+
+    manifest.json     format name and version, population size and the
+                      column table (dtype and encoding of each column)
+    columns/<name>    one file per population column, rows [0, size) only
+    state.pickle.z    zlib-compressed pickle of everything else: economy,
+                      bank, parliament, referendums, media, parties, orgs,
+                      history and the SimulationRNG streams, plus the global
+                      random/Faker states and the category code tables
+
+Columns are columnar binary. Integer, bool and uint8 category columns
+compress well and are stored zlib-compressed (`.npy.z`). Float columns are
+near-incompressible and are stored as raw `.npy` files. A restore maps
+those files copy-on-write (mmap mode 'c'), so several branches restored
+from one checkpoint share every page until they write to it. Pass
+compress=True to compress every column instead. This is smaller but saves
+more slowly and gives up the shared pages.
+
+Writes go to a temporary directory that then replaces `path`. A branch
+still mapping an older checkpoint at the same path keeps its files.
+"""
+import io
+import json
+import os
+import pickle
+import random
+import shutil
+import zlib
+from typing import Any, Dict, Tuple
+import numpy as np
+
+from models.legislative import fake
+from models.population import PopulationStore, category_state, restore_categories
+from sharding import ShardedExecutor
+
+FORMAT = 'technocratia-checkpoint'
+VERSION = 1
+
+def _compressible(dtype: np.dtype) -> bool:
+    return dtype.kind in 'biu'
+
+class _StatePickler(pickle.Pickler):
+    """Pickles the run state with population columns and process resources stored by reference"""
+    def __init__(self, file, store: PopulationStore, owner: Any = None):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._columns = {id(column): name for name, column in store.columns.items()}
+        self._owner = owner
+
+    def persistent_id(self, obj):
+        if obj is self._owner and obj is not None:
+            return ('owner',)  # e.g. the Simulation behind scheduled bound methods
+        if isinstance(obj, np.ndarray) and id(obj) in self._columns:
+            return ('column', self._columns[id(obj)])
+        if isinstance(obj, ShardedExecutor):
+            return ('executor',)  # Process pool; the restoring Simulation starts its own
+        return None
+
+class _StateUnpickler(pickle.Unpickler):
+    def __init__(self, file, columns: Dict[str, np.ndarray], owner: Any = None):
+        super().__init__(file)
+        self._columns = columns
+        self._owner = owner
+
+    def persistent_load(self, pid):
+        if pid[0] == 'owner':
+            return self._owner
+        if pid[0] == 'column':
+            return self._columns[pid[1]]
+        if pid[0] == 'executor':
+            return None
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+def module_state() -> Dict[str, Any]:
+    """Process-wide state a run depends on besides its own objects"""
+    return {
+        'random': random.getstate(),
+        'faker': fake.random.getstate(),
+        'categories': category_state(),
+    }
+
+def apply_module_state(saved: Dict[str, Any]) -> None:
+    """Restore the random and Faker states saved by module_state() (after SimulationRNG.bind_modules)"""
+    random.setstate(saved['random'])
+    fake.random.setstate(saved['faker'])
+
+def write_checkpoint(path: str, state: Dict[str, Any], store: PopulationStore, compress: bool = False,
+                     owner: Any = None) -> None:
+    """
+    Save `state` (attribute name -> object) with the columns of `store` split out.
+
+    Args:
+        path: Checkpoint directory (replaced if it exists)
+        state: Objects to save; `store` must be reachable from them
+        store: Population store whose columns are written as column files
+        compress: Compress float columns too (smaller, slower, no copy-on-write restore)
+        owner: Object that `state` belongs to; references to it are saved as a
+            placeholder and resolve to the restoring object
+    """
+    staging = f"{path}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(os.path.join(staging, 'columns'))
+
+    table = {}
+    for name, column in store.columns.items():
+        rows = column[:store.size]
+        if compress or _compressible(rows.dtype):
+            with open(os.path.join(staging, 'columns', f"{name}.npy.z"), 'wb') as handle:
+                handle.write(zlib.compress(np.ascontiguousarray(rows).data, 1))
+            encoding = 'zlib'
+        else:
+            np.save(os.path.join(staging, 'columns', f"{name}.npy"), rows)
+            encoding = 'npy'
+        table[name] = {'dtype': rows.dtype.str, 'encoding': encoding}
+
+    buffer = io.BytesIO()
+    _StatePickler(buffer, store, owner).dump({'state': state, 'modules': module_state()})
+    with open(os.path.join(staging, 'state.pickle.z'), 'wb') as handle:
+        handle.write(zlib.compress(buffer.getbuffer(), 1))
+
+    manifest = {'format': FORMAT, 'version': VERSION, 'size': store.size, 'columns': table}
+    with open(os.path.join(staging, 'manifest.json'), 'w') as handle:
+        json.dump(manifest, handle, indent=2)
+
+    # Swap directories rather than overwrite files that a restored branch may still map
+    retired = f"{path}.old"
+    shutil.rmtree(retired, ignore_errors=True)
+    if os.path.exists(path):
+        os.replace(path, retired)
+    os.replace(staging, path)
+    shutil.rmtree(retired, ignore_errors=True)
+
+def read_checkpoint(path: str, owner: Any = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Load a checkpoint written by write_checkpoint(); saved references to the
+    writer's owner resolve to `owner`.
+
+    Returns:
+        (state, module state): pass the second to apply_module_state() once
+        the restored SimulationRNG is bound
+    """
+    with open(os.path.join(path, 'manifest.json')) as handle:
+        manifest = json.load(handle)
+    if manifest.get('format') != FORMAT:
+        raise ValueError(f"{path} is not a simulation checkpoint")
+    if manifest['version'] > VERSION:
+        raise ValueError(f"Checkpoint version {manifest['version']} is newer than supported ({VERSION})")
+
+    size = manifest['size']
+    columns = {}
+    for name, entry in manifest['columns'].items():
+        dtype = np.dtype(entry['dtype'])
+        if entry['encoding'] == 'zlib':
+            with open(os.path.join(path, 'columns', f"{name}.npy.z"), 'rb') as handle:
+                column = np.frombuffer(zlib.decompress(handle.read()), dtype=dtype).copy()
+        else:
+            # Copy-on-write map: pages stay shared with the file until written
+            column = np.asarray(np.load(os.path.join(path, 'columns', f"{name}.npy"), mmap_mode='c' if size else None))
+        if len(column) != size:
+            raise ValueError(f"Checkpoint column '{name}' has {len(column)} rows, expected {size}")
+        columns[name] = column
+
+    with open(os.path.join(path, 'state.pickle.z'), 'rb') as handle:
+        payload = zlib.decompress(handle.read())
+    saved = _StateUnpickler(io.BytesIO(payload), columns, owner).load()
+    restore_categories(saved['modules']['categories'])
+    return saved['state'], saved['modules']
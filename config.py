@@ -4,6 +4,9 @@ DEBUG_MODE = False
 # Simulation Control
 SIMULATION_MONTHS = 48  # 4 years default
 RANDOM_SEED = None  # For reproducible results
+RNG_SHARD_SIZE = 65_536  # Rows per random-number shard; fixed so results don't depend on worker count
+SIMULATION_WORKERS = 1  # Processes for the per-citizen phases; >1 shards the population (see sharding.py)
+DAYS_PER_MONTH = 30  # Simulated days per month; the event scheduler counts time in days
 
 # Population Settings
 INITIAL_POPULATION = 10_000
@@ -14,6 +17,13 @@ POPULATION_GROWTH_CHANCE = 0.2  # 20% chance for population growth
 POPULATION_DECLINE_CHANCE = 0.1  # 10% chance for population decline
 POPULATION_GROWTH_FACTOR = 0.1  # 10% growth batch
 POPULATION_DECLINE_FACTOR = 0.05  # 5% decline batch
+MORTALITY_AGE_SLOPE = 0.085  # Gompertz slope: mortality roughly doubles every 8 years of age
+POPULATION_MODE = 'agents'  # 'agents' (one row per citizen), 'cohorts' (grouped citizens, see models/cohorts.py) or 'hybrid'
+COHORT_AGE_EDGES = (16, 30, 45, 60, 75, 90)  # Cohort age bands; must include the voting age and the 30/60 tension bands
+COHORT_EDUCATION_BANDS = 3  # Equal-width education bands per cohort key
+COHORT_IDEOLOGY_BUCKETS = 5  # Equal-width political ideology buckets per cohort key
+COHORT_POPULATION_HEADROOM = 2.0  # Cohort/hybrid populations are capped at this multiple of their initial size (or MAX_POPULATION if larger)
+BALLOT_AUDIT_SAMPLE = 1_000  # Voters materialized from cohorts per referendum to audit their ballots (hybrid mode)
 
 # Political System
 PARLIAMENT_TOTAL_SEATS = 300
@@ -24,6 +34,7 @@ INITIAL_PARTY_FUNDS = 10_000.0
 MAX_PARTY_MEMBERS = 100
 CAMPAIGN_POPULARITY_FACTOR = 0.1
 CAMPAIGN_COST_FACTOR = 1000
+REFERENDUM_CAMPAIGN_DAYS = 14  # Campaign period between a referendum's proposal and its vote
 
 # Government
 MAX_ADVISORS = 12
@@ -34,6 +45,10 @@ MAX_MINISTRY_EFFICIENCY = 1.0
 AUSTERITY_BUDGET_CUT = 0.2  # 20% budget reduction
 AUSTERITY_APPROVAL_PENALTY = 15.0
 
+# Media
+MEDIA_INFLUENCE_PASSES = 2  # Times each monthly news cycle is applied to citizens
+FUSED_POPULATION_SWEEP = False  # Apply the news cycle in the population update's sweep (news moves to the start of the month)
+
 # Economic Parameters
 INITIAL_GDP = 1_000_000_000_000  # 1 trillion
 INITIAL_LABOR_FORCE = 50_000_000
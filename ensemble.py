@@ -0,0 +1,167 @@
+"""
+Monte Carlo ensembles of independent Simulation replicas.
+
+Each replica gets its own seed, derived from the ensemble seed with
+SeedSequence.spawn, so replicas are statistically independent and the whole
+ensemble is reproducible. Replicas run on a process pool. Each one runs
+quietly and returns only its monthly indicator matrix. The coordinator
+writes each matrix into a preallocated (replica, month, metric) array as
+it arrives.
+"""
+import math
+import multiprocessing
+import os
+import warnings
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from config import *
+
+from simulation import Simulation
+
+# Indicators collected per replica and month (keys of Simulation.monthly_indicators)
+METRICS = ('population', 'overall_stability', 'crisis', 'government_approval', 'gdp', 'referendums',
+           'referendum_support')
+
+def _run_replica(task: Tuple[int, int, int, int]) -> Tuple[int, np.ndarray]:
+    """Run one replica and return (index, months x METRICS array)"""
+    index, seed, months, initial_population = task
+    simulation = Simulation(seed=seed, months=months, initial_population=initial_population, quiet=True)
+    try:
+        simulation.setup()
+        values = np.empty((months, len(METRICS)))
+        for month in range(months):
+            indicators = simulation.step(month)
+            values[month] = [indicators[metric] for metric in METRICS]
+    finally:
+        simulation.cleanup()
+    return index, values
+
+class EnsembleResult:
+    """Monthly indicators of every replica, with summary statistics across replicas"""
+    def __init__(self, values: np.ndarray, seeds: Sequence[int]):
+        self.values = values  # (replica, month, metric)
+        self.seeds = list(seeds)
+
+    @property
+    def replicas(self) -> int:
+        return self.values.shape[0]
+
+    @property
+    def months(self) -> int:
+        return self.values.shape[1]
+
+    def metric(self, name: str) -> np.ndarray:
+        """(replica, month) values of one metric"""
+        return self.values[:, :, METRICS.index(name)]
+
+    def mean(self, name: str) -> np.ndarray:
+        """Mean per month across replicas. Replicas with no value (NaN) are skipped."""
+        return _nan_reduce(np.nanmean, self.metric(name))
+
+    def quantiles(self, name: str, q: Sequence[float] = (0.05, 0.5, 0.95)) -> np.ndarray:
+        """(len(q), month) quantiles across replicas"""
+        return _nan_reduce(np.nanquantile, self.metric(name), q)
+
+    def confidence_band(self, name: str, level: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Normal-approximation confidence band for the monthly mean.
+
+        Args:
+            name: Metric name
+            level: Two-sided confidence level
+
+        Returns:
+            (lower, upper) arrays, one value per month
+        """
+        values = self.metric(name)
+        counts = np.sum(~np.isnan(values), axis=0)
+        mean = self.mean(name)
+        std = _nan_reduce(np.nanstd, values, ddof=1) if self.replicas > 1 else np.zeros(self.months)
+        z = math.sqrt(2) * _erfinv(level)
+        half_width = z * std / np.sqrt(np.maximum(counts, 1))
+        return mean - half_width, mean + half_width
+
+    def summary(self, metrics: Sequence[str] = ('overall_stability', 'government_approval', 'gdp',
+                                                 'referendum_support'),
+                level: float = 0.95) -> Dict[str, Dict[str, float]]:
+        """Final-month mean, 5/50/95% quantiles and confidence band per metric"""
+        report = {}
+        for name in metrics:
+            q05, q50, q95 = self.quantiles(name)[:, -1]
+            lower, upper = self.confidence_band(name, level)
+            report[name] = {'mean': float(self.mean(name)[-1]), 'q05': float(q05), 'median': float(q50),
+                            'q95': float(q95), 'ci_lower': float(lower[-1]), 'ci_upper': float(upper[-1])}
+        # Share of replicas whose referendums, over the whole run, mostly passed
+        support = self.metric('referendum_support')
+        held = ~np.all(np.isnan(support), axis=1)
+        if held.any():
+            passed = _nan_reduce(np.nanmean, support[held], axis=1) > 0.5
+            report['referendum_outcomes'] = {'replicas_with_referendums': int(held.sum()),
+                                             'share_mostly_passed': float(passed.mean())}
+        return report
+
+    def rows(self) -> List[Dict[str, float]]:
+        """Long-format rows: one dict per (replica, month)"""
+        return [{'replica': replica, 'seed': self.seeds[replica], 'month': month + 1,
+                 **dict(zip(METRICS, self.values[replica, month].tolist()))}
+                for replica in range(self.replicas) for month in range(self.months)]
+
+class EnsembleRunner:
+    """
+    Runs N independent Simulation replicas on a process pool.
+
+    Example:
+        result = EnsembleRunner(1000, seed=42).run()
+        lower, upper = result.confidence_band('overall_stability')
+    """
+    def __init__(self, replicas: int, seed: Optional[int] = RANDOM_SEED, workers: Optional[int] = None,
+                 months: int = SIMULATION_MONTHS, initial_population: int = INITIAL_POPULATION):
+        """
+        Args:
+            replicas: Number of replicas to run
+            seed: Ensemble seed; replica seeds are spawned from it (None for fresh entropy)
+            workers: Pool size (default os.cpu_count(); 1 runs in-process)
+            months: Months per replica
+            initial_population: Starting population of each replica
+        """
+        self.replicas = replicas
+        self.months = months
+        self.initial_population = initial_population
+        self.workers = workers or os.cpu_count() or 1
+        sequence = np.random.SeedSequence(seed)
+        self.seeds = [int(child.generate_state(1)[0]) for child in sequence.spawn(replicas)]
+
+    def run(self) -> EnsembleResult:
+        values = np.full((self.replicas, self.months, len(METRICS)), np.nan)
+        tasks = [(index, seed, self.months, self.initial_population) for index, seed in enumerate(self.seeds)]
+        if self.workers == 1 or self.replicas == 1:
+            for task in tasks:
+                index, replica_values = _run_replica(task)
+                values[index] = replica_values
+        else:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+            # Replicas share no state, so they are handed out in small chunks and
+            # each result is stored as it arrives rather than gathered at the end
+            chunksize = max(1, self.replicas // (self.workers * 8))
+            with context.Pool(min(self.workers, self.replicas)) as pool:
+                for index, replica_values in pool.imap_unordered(_run_replica, tasks, chunksize):
+                    values[index] = replica_values
+        return EnsembleResult(values, self.seeds)
+
+def _nan_reduce(function, values: np.ndarray, *args, axis: int = 0, **kwargs) -> np.ndarray:
+    # All-NaN columns (e.g. months without referendums) reduce to NaN without a warning
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return function(values, *args, axis=axis, **kwargs)
+
+def _erfinv(level: float) -> float:
+    # Inverse error function by bisection (avoids a scipy dependency)
+    low, high = 0.0, 6.0
+    for _ in range(60):
+        middle = (low + high) / 2
+        if math.erf(middle) < level:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
@@ -1,6 +1,7 @@
 import sys
 import random
 
+from config import RANDOM_SEED, FUSED_POPULATION_SWEEP, POPULATION_MODE
 from simulation import run_simulation
 
 def plot_results():
@@ -8,4 +9,35 @@ def plot_results():
 
 if __name__ == "__main__":
     debug_mode = "--debug" in sys.argv
-    run_simulation(debug_mode=debug_mode)
+    seed = int(sys.argv[sys.argv.index("--seed") + 1]) if "--seed" in sys.argv else RANDOM_SEED
+    if "--ensemble" in sys.argv:
+        from ensemble import EnsembleRunner
+        replicas = int(sys.argv[sys.argv.index("--ensemble") + 1])
+        result = EnsembleRunner(replicas, seed=seed).run()
+        for metric, stats in result.summary().items():
+            print(f"{metric}: " + ", ".join(f"{key}={value:.4g}" for key, value in stats.items()))
+    elif "--profile" in sys.argv:
+        from profiling import PhaseProfiler
+        from simulation import Simulation
+        profiler = PhaseProfiler(memory="--memory" in sys.argv)
+        simulation = Simulation(debug_mode=debug_mode, seed=seed, profiler=profiler)
+        try:
+            simulation.run()
+        finally:
+            simulation.cleanup()
+        profiler.write_table('output/profile.csv')
+        profiler.write_collapsed('output/profile.collapsed')
+        print(profiler.report())
+    elif "--record" in sys.argv:
+        from recorder import TimeSeriesRecorder
+        from simulation import Simulation
+        simulation = Simulation(debug_mode=debug_mode, seed=seed, recorder=TimeSeriesRecorder('output/timeseries'))
+        try:
+            simulation.run()
+        finally:
+            simulation.cleanup()
+    else:
+        population_file = sys.argv[sys.argv.index("--population-file") + 1] if "--population-file" in sys.argv else None
+        run_simulation(debug_mode=debug_mode, seed=seed, json_logs="--json-logs" in sys.argv,
+                       population_file=population_file, fused_sweep="--fused-sweep" in sys.argv or FUSED_POPULATION_SWEEP,
+                       population_mode=next((mode for mode in ('cohorts', 'hybrid') if f"--{mode}" in sys.argv), POPULATION_MODE))
@@ -1,6 +1,7 @@
 from enum import Enum
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 import random
+import numpy as np
 from config import *
 
 MIN_LEGAL_VOTING_AGE = 16
@@ -14,6 +15,8 @@ media = importlib.import_module(".media", package=__package__)
 #     from .media import NewsCategory
 
 from .political_party import Ideology, IdeologyScore
+from .kernels import ColumnKernel
+from .rng import ShardedStream, batch_generator
 
 class CitizenshipStatus(Enum):
     CITIZEN = "Citizen"
@@ -50,6 +53,22 @@ class RegionType(Enum):
     RURAL = "Rural"
 
 class Citizen:
+    # Fixed attribute set, no per-instance __dict__. Whole populations live in
+    # population.PopulationStore; standalone objects are for code that needs them.
+    __slots__ = (
+        'id', 'electronic_signature',
+        'age', 'sex', 'region', 'citizenship_status', 'is_immigrant', 'years_in_country',
+        'income', 'wealth', 'savings', 'debt', 'socioeconomic_rating',
+        'education_level', 'health', 'happiness', 'social_capital', 'trust_in_institutions',
+        'employment_status', 'job_satisfaction', 'work_life_balance',
+        'political_leaning', 'political_ideology', 'civic_engagement', 'environmental_concern',
+        'consumption', 'media_usage', 'leisure_activities',
+        'ethnicity', 'religion', 'region_type',
+        'economic_satisfaction', 'social_satisfaction',
+        'social_mobility', 'community_involvement', 'political_engagement',
+        'trust_in_government', 'satisfaction_level',
+    )
+
     def __init__(self, age: int, sex: str, region: str):
         # Electronic identity
         self.id = random.randint(10_000_000, 99_999_999)  # Simplified ID, should be a CNP
@@ -105,6 +124,8 @@ class Citizen:
         self.happiness = random.uniform(40, 80)
         self.trust_in_institutions = random.uniform(30, 70)
         self.socioeconomic_rating = random.uniform(20, 80)
+        self.economic_satisfaction = 50  # Neutral; moved by ECONOMY policies
+        self.social_satisfaction = 50    # Neutral; moved by SOCIAL_WELFARE policies
                 
         # Social interaction factors
         self.social_mobility = random.uniform(0, 1)
@@ -140,25 +161,19 @@ class Citizen:
         self.community_involvement = max(0, min(1, self.community_involvement))
         self.political_engagement = max(0, min(1, self.political_engagement))
 
-    def _update_economic_status(self, economy) -> None:
-    #def _update_economic_status(self, economy: 'EconomyModel') -> None:
-        # Update income, savings, and debt based on economic conditions
+    @staticmethod
+    def _economic_impact(economy) -> float:
         # Check if economy is an instance of EconomicModel or a dict
         if hasattr(economy, 'simulate_month'):
             economy.simulate_month()
             # Use direct economy model data
-            economic_impact = economy.get_gdp_growth()
-        else:
-            # Handle dictionary case
-            # Use the economic indicators from the state dictionary
-            economic_impact = (economy.get('gdp_growth', 0) 
-                             if isinstance(economy, dict) else 0)
+            return economy.get_gdp_growth()
+        # Handle dictionary case
+        # Use the economic indicators from the state dictionary
+        return economy.get('gdp_growth', 0) if isinstance(economy, dict) else 0
 
-        # Update happiness and socioeconomic rating based on economic conditions
-        self.happiness += random.uniform(-5, 5) + (economic_impact * 10)
-        self.socioeconomic_rating += random.uniform(-2, 2) + (economic_impact * 5)
-        
-    def _update_social_factors(self, social_environment) -> None:
+    @staticmethod
+    def _social_impact(social_environment) -> float:
         # Handle both dictionary and object cases
         if isinstance(social_environment, dict):
             # Extract values from dictionary
@@ -170,9 +185,32 @@ class Citizen:
             society_satisfaction = social_environment.get_satisfaction_score()
             social_cohesion = getattr(social_environment, 'social_cohesion', 0)
             media_trust = getattr(social_environment, 'media_trust', 0)
+        return (society_satisfaction + social_cohesion + media_trust) / 3
+
+    @staticmethod
+    def _policy_terms(policies) -> List[Tuple[str, float]]:
+        terms = []
+        for policy in policies:
+            # Handle both string and Policy object cases
+            if isinstance(policy, str):
+                terms.append((policy, 0.5))  # Default strength if not provided
+            else:
+                policy_area = policy.area.value if hasattr(policy.area, 'value') else policy.area
+                terms.append((policy_area, policy.strength))
+        return terms
+
+    def _update_economic_status(self, economy) -> None:
+    #def _update_economic_status(self, economy: 'EconomyModel') -> None:
+        # Update income, savings, and debt based on economic conditions
+        economic_impact = self._economic_impact(economy)
 
+        # Update happiness and socioeconomic rating based on economic conditions
+        self.happiness += random.uniform(-5, 5) + (economic_impact * 10)
+        self.socioeconomic_rating += random.uniform(-2, 2) + (economic_impact * 5)
+        
+    def _update_social_factors(self, social_environment) -> None:
         # Update citizen's social attributes
-        social_impact = (society_satisfaction + social_cohesion + media_trust) / 3
+        social_impact = self._social_impact(social_environment)
         self.happiness += random.uniform(-3, 3) + (social_impact * 5)
         #self.social_satisfaction += random.uniform(-2, 2) + (social_impact * 3)
 
@@ -180,15 +218,7 @@ class Citizen:
         if not policies:
             return
 
-        for policy in policies:
-            # Handle both string and Policy object cases
-            if isinstance(policy, str):
-                policy_area = policy
-                policy_strength = 0.5  # Default strength if not provided
-            else:
-                policy_area = policy.area.value if hasattr(policy.area, 'value') else policy.area
-                policy_strength = policy.strength
-
+        for policy_area, policy_strength in self._policy_terms(policies):
             # Apply effects based on policy area
             if policy_area == 'ECONOMY':
                 self.happiness += random.uniform(-2, 2) + (policy_strength * 3)
@@ -260,3 +290,100 @@ class Citizen:
         support_likelihood += random.uniform(-0.1, 0.1)
         
         return random.random() < max(0, min(1, support_likelihood))
+
+
+class CitizenUpdateEngine:
+    """
+    Batched equivalent of Citizen.update for a whole population.
+
+    Applies _update_economic_status, _update_social_factors, _apply_policy_effects
+    and _age to population columns with a handful of array operations. Each
+    citizen gets independent draws from the same distributions as the scalar
+    path, so results match it statistically. The economy and social environment
+    are read once per batch (an EconomicModel is advanced once, not once per
+    citizen).
+    """
+    # Columns touched by update_columns
+    COLUMNS = ('happiness', 'socioeconomic_rating', 'trust_in_institutions', 'economic_satisfaction',
+               'social_satisfaction', 'health', 'age', 'community_involvement', 'political_engagement')
+
+    def __init__(self, rng: Union[np.random.Generator, ShardedStream]):
+        self.rng = rng  # A ShardedStream gives each row shard its own reproducible draws
+
+    @staticmethod
+    def impacts(economy, policies, social_environment) -> Tuple[Optional[float], Optional[float],
+                                                                Optional[List[Tuple[str, float]]]]:
+        """Reduce the update inputs to the scalar terms update_columns takes (advances an EconomicModel)"""
+        economic_impact = Citizen._economic_impact(economy) if economy else None
+        social_impact = Citizen._social_impact(social_environment) if social_environment else None
+        policy_terms = Citizen._policy_terms(policies) if policies else None
+        return economic_impact, social_impact, policy_terms
+
+    def kernel(self, economy, policies, social_environment) -> 'CitizenUpdateKernel':
+        """The update as a sweep step (see PopulationStore.for_each_chunk), e.g. to fuse it with other phases"""
+        return CitizenUpdateKernel(self.rng, self.impacts(economy, policies, social_environment))
+
+    def apply(self, store, economy, policies, social_environment) -> None:
+        """Update every citizen in `store` (same argument order as Citizen.update)"""
+        store.for_each_chunk([self.kernel(economy, policies, social_environment)])
+
+    @staticmethod
+    def update_columns(columns: Dict[str, np.ndarray], rng: np.random.Generator,
+                       economic_impact: Optional[float],
+                       social_impact: Optional[float],
+                       policy_terms: Optional[List[Tuple[str, float]]]) -> None:
+        """
+        Update column arrays in place.
+
+        Args:
+            columns: Column name -> array (all the same length), see COLUMNS
+            rng: Generator for the per-citizen random draws
+            economic_impact: GDP growth signal, or None to skip the economic step
+            social_impact: Averaged social signal, or None to skip the social step
+            policy_terms: (area, strength) pairs, or None to skip policy effects
+        """
+        happiness = columns['happiness']
+        n = len(happiness)
+
+        if economic_impact is not None:
+            happiness += rng.uniform(-5, 5, n) + economic_impact * 10
+            columns['socioeconomic_rating'] += rng.uniform(-2, 2, n) + economic_impact * 5
+
+        if social_impact is not None:
+            happiness += rng.uniform(-3, 3, n) + social_impact * 5
+
+        if policy_terms is not None:
+            for policy_area, policy_strength in policy_terms:
+                if policy_area == 'ECONOMY':
+                    happiness += rng.uniform(-2, 2, n) + policy_strength * 3
+                    columns['economic_satisfaction'] += rng.uniform(-1, 1, n) + policy_strength * 2
+                elif policy_area == 'SOCIAL_WELFARE':
+                    happiness += rng.uniform(-1, 3, n) + policy_strength * 4
+                    columns['social_satisfaction'] += rng.uniform(0, 2, n) + policy_strength * 3
+                elif policy_area == 'HEALTHCARE':
+                    happiness += rng.uniform(0, 2, n) + policy_strength * 2
+                    columns['health'] += rng.uniform(-1, 1, n) + policy_strength * 2
+            columns['trust_in_institutions'] += rng.uniform(-3, 3, n)
+
+        columns['age'] += 1/12
+
+        # Same bounds as Citizen.update
+        np.clip(happiness, 0, 100, out=happiness)
+        np.clip(columns['trust_in_institutions'], 0, 100, out=columns['trust_in_institutions'])
+        np.clip(columns['socioeconomic_rating'], 0, 100, out=columns['socioeconomic_rating'])
+        np.clip(columns['community_involvement'], 0, 1, out=columns['community_involvement'])
+        np.clip(columns['political_engagement'], 0, 1, out=columns['political_engagement'])
+
+class CitizenUpdateKernel(ColumnKernel):
+    """CitizenUpdateEngine.update_columns with its scalar terms reduced once per month"""
+    COLUMNS = UPDATES = CitizenUpdateEngine.COLUMNS
+
+    def __init__(self, rng: Union[np.random.Generator, ShardedStream], terms: Tuple):
+        super().__init__(rng)
+        self.terms = terms  # CitizenUpdateEngine.impacts
+
+    def run(self, columns: Dict[str, np.ndarray], rng: np.random.Generator) -> None:
+        CitizenUpdateEngine.update_columns(columns, rng, *self.terms)
+
+    def apply_cohorts(self, cohorts) -> None:
+        cohorts.update(batch_generator(self.rng), *self.terms)
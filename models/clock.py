@@ -0,0 +1,45 @@
+from typing import Optional
+from config import *
+
+DAYS_PER_YEAR = 12 * DAYS_PER_MONTH  # One calendar with the scheduler's months, so a year is exactly 12 of them
+
+class SimulationClock:
+    """
+    Simulated calendar: an integer count of days since the start of the run.
+
+    Models take the active clock when they are created (see current_clock)
+    and stamp dates as plain ints, so terms, emergencies and elections
+    expire as simulated time advances, however fast the run executes.
+    """
+    def __init__(self, day: int = 0):
+        self.day = day
+
+    def today(self) -> int:
+        return self.day
+
+    def advance_to(self, day: int) -> None:
+        if day < self.day:
+            raise ValueError(f"Cannot move the clock back from day {self.day} to {day}")
+        self.day = day
+
+    @staticmethod
+    def days(years: int = 0, months: int = 0, days: int = 0) -> int:
+        """Length of a period in simulated days"""
+        return years * DAYS_PER_YEAR + months * DAYS_PER_MONTH + days
+
+    def __repr__(self) -> str:
+        return f"SimulationClock(day={self.day})"
+
+# Clock handed to models created without an explicit one; Simulation
+# activates its own clock with use_clock() before building its models.
+_active = SimulationClock()
+
+def current_clock() -> SimulationClock:
+    return _active
+
+def use_clock(clock: Optional[SimulationClock]) -> SimulationClock:
+    """Make `clock` (a fresh one if None) the active clock; returns the previous one"""
+    global _active
+    previous = _active
+    _active = clock if clock is not None else SimulationClock()
+    return previous
@@ -0,0 +1,610 @@
+"""
+Cohort (aggregate-agent) representation of a population.
+
+Citizens are grouped by (age band, region, ethnicity, religion, education
+band, ideology bucket). A cohort stores its head count and, for each
+attribute in CohortTable.MOMENTS, the mean and variance of its members'
+values. The cohort-level versions of the per-citizen steps move those
+moments the way the individual steps move a whole cohort:
+
+- update: each uniform draw adds its mean and variance, and clipping to
+  [0, 100] uses the moments of a clipped normal
+- ageing: a month moves 1/(12 * band width) of each age band up a band,
+  assuming ages are uniform within a band
+- process_media_influence: each news item adds the mean and variance of
+  its impact at the cohort's education moments, then clips
+- decide_referendum_vote: the support probability is the ideology-aligned
+  share (ideology is uniform within a bucket) plus the undecided share
+  times the clipped-normal mean of their support likelihood
+- births, deaths and the random growth and decline batches use the same
+  rates and Gompertz weights as DemographicEngine, drawn per cohort
+
+A month costs O(cohorts), whatever the head count. The default table has
+7 * 10 * 6 * 6 * 3 * 5 = 37,800 cohorts in a few megabytes, so a 20M
+country takes the same time and memory as a 20,000-person one.
+
+Error bound against the individual-agent mode: the approximation is that
+within a cohort each attribute is normal (for clipping) and independent of
+education (for media impact). Starting both modes from the same population
+(CohortTable.from_store) and applying the same 48 monthly updates and news
+cycles, the cohort population means stay close to the agents' means
+(0-100 scale):
+
+- happiness: within 2 points. Its monthly noise piles members up at 0 and
+  100, which a normal does not capture.
+- trust in government and satisfaction: within 1.5 points
+- the other attributes: within 0.1 points
+- referendum support: within 0.5 percentage points
+
+tests/test_cohorts.py checks these bounds.
+
+HybridSociety keeps the cohorts but turns members into individual citizens
+when they are sampled or their ballots audited. Their attributes are drawn
+from the cohort distributions, and from then on they are updated as agents.
+"""
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from config import *
+
+from .citizen import Citizen, MIN_LEGAL_VOTING_AGE
+from .population import (PopulationStore, PopulationAggregates, DemographicSnapshot, CATEGORIES, AGE_BANDS,
+                         AGE_BAND_EDGES)
+from .referendum import ReferendumSystem
+from .society import SocietySystem
+
+OPEN_BAND_YEARS = 15  # Assumed width of the open top age band, for its mortality
+IDEOLOGY_GRID = 512   # Points per ideology bucket when measuring party alignment
+CLIP_SIGMAS = 8       # Distributions this many standard deviations inside a bound are left as they are
+
+# Bounds applied after each step, as in Citizen.update and process_media_influence
+UPDATE_BOUNDS = ('happiness', 'trust_in_institutions', 'socioeconomic_rating')
+MEDIA_BOUNDS = ('trust_in_government', 'satisfaction_level')
+
+def _normal_cdf(z: np.ndarray) -> np.ndarray:
+    # Abramowitz & Stegun 7.1.26 for erf (absolute error below 1.5e-7); NumPy has no erf
+    x = np.abs(z) / np.sqrt(2)
+    t = 1 / (1 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1 - poly * np.exp(-x * x)
+    return 0.5 * (1 + np.sign(z) * erf)
+
+def _normal_pdf(z: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * z * z) / np.sqrt(2 * np.pi)
+
+def clipped_moments(mean: np.ndarray, variance: np.ndarray, low: float, high: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Mean and variance of a normal with the given moments after clipping to [low, high]"""
+    sigma = np.sqrt(np.maximum(variance, 0))
+    point = sigma < 1e-9
+    sigma = np.where(point, 1.0, sigma)
+    alpha, beta = (low - mean) / sigma, (high - mean) / sigma
+    below, above = _normal_cdf(alpha), 1 - _normal_cdf(beta)
+    inside = 1 - below - above
+    pdf_alpha, pdf_beta = _normal_pdf(alpha), _normal_pdf(beta)
+    first = low * below + high * above + mean * inside + sigma * (pdf_alpha - pdf_beta)
+    second = (low * low * below + high * high * above + (mean * mean + sigma * sigma) * inside
+              + 2 * mean * sigma * (pdf_alpha - pdf_beta) + sigma * sigma * (alpha * pdf_alpha - beta * pdf_beta))
+    clipped_variance = np.maximum(second - first * first, 0)
+    return (np.where(point, np.clip(mean, low, high), first),
+            np.where(point, 0.0, clipped_variance))
+
+def clip_in_place(mean: np.ndarray, variance: np.ndarray, low: float, high: float, rows: np.ndarray) -> None:
+    """clipped_moments for the `rows` whose distribution reaches past a bound (the rest are unchanged)"""
+    reach = CLIP_SIGMAS * np.sqrt(np.maximum(variance[rows], 0))
+    outside = rows[(mean[rows] - reach < low) | (mean[rows] + reach > high)]
+    if len(outside):
+        mean[outside], variance[outside] = clipped_moments(mean[outside], variance[outside], low, high)
+
+class CohortTable:
+    """
+    Head counts and attribute moments of every cohort, as flat arrays over the
+    full key grid (empty cohorts have a zero count).
+
+    Everyone in a cohort table is a citizen, as in every generated population;
+    from_store counts other residents as citizens too.
+    """
+    DIMENSIONS = ('age_band', 'region', 'ethnicity', 'religion', 'education_band', 'ideology_bucket')
+    MOMENTS = ('happiness', 'trust_in_institutions', 'socioeconomic_rating', 'economic_satisfaction',
+               'social_satisfaction', 'health', 'trust_in_government', 'satisfaction_level', 'education_level')
+
+    def __init__(self, age_edges: Sequence[float] = COHORT_AGE_EDGES,
+                 education_bands: int = COHORT_EDUCATION_BANDS, ideology_buckets: int = COHORT_IDEOLOGY_BUCKETS):
+        missing = {MIN_LEGAL_VOTING_AGE, *AGE_BAND_EDGES} - set(age_edges)
+        if missing:
+            raise ValueError(f"Cohort age edges must include {sorted(missing)} (voting age and tension bands)")
+        self.age_edges = np.array(sorted(age_edges), dtype=np.float64)
+        self.education_bands = education_bands
+        self.ideology_buckets = ideology_buckets
+        self.shape = (len(self.age_edges) + 1, len(CATEGORIES['region']), len(CATEGORIES['ethnicity']),
+                      len(CATEGORIES['religion']), education_bands, ideology_buckets)
+        self.size = int(np.prod(self.shape))
+        self.counts = np.zeros(self.size, dtype=np.int64)
+        self.means = {name: np.zeros(self.size) for name in self.MOMENTS}
+        self.variances = {name: np.zeros(self.size) for name in self.MOMENTS}
+        self._coordinates: Dict[str, np.ndarray] = {}
+
+    def __getstate__(self) -> Dict[str, object]:
+        state = dict(vars(self))
+        state['_coordinates'] = {}  # Derived from the shape
+        return state
+
+    def __len__(self) -> int:
+        """Head count"""
+        return int(self.counts.sum())
+
+    @property
+    def age_lows(self) -> np.ndarray:
+        return np.concatenate([[0.0], self.age_edges])
+
+    @property
+    def age_highs(self) -> np.ndarray:
+        return np.concatenate([self.age_edges, [self.age_edges[-1] + OPEN_BAND_YEARS]])
+
+    def coordinate(self, dimension: str) -> np.ndarray:
+        """Per-cohort index along one of DIMENSIONS"""
+        if not self._coordinates:
+            grid = np.unravel_index(np.arange(self.size), self.shape)
+            self._coordinates = dict(zip(self.DIMENSIONS, grid))
+        return self._coordinates[dimension]
+
+    def occupied(self) -> int:
+        """Number of non-empty cohorts"""
+        return int(np.count_nonzero(self.counts))
+
+    def mean(self, name: str) -> float:
+        """Population average of an attribute"""
+        total = self.counts.sum()
+        return float(self.counts @ self.means[name] / total) if total else 0.0
+
+    # Keys of individual citizens
+    def age_band(self, ages: np.ndarray) -> np.ndarray:
+        return np.searchsorted(self.age_edges, ages, side='right')
+
+    def education_band(self, education: np.ndarray) -> np.ndarray:
+        return np.clip((np.asarray(education) / 100 * self.education_bands).astype(np.intp), 0, self.education_bands - 1)
+
+    def ideology_bucket(self, ideology: np.ndarray) -> np.ndarray:
+        return np.clip(((np.asarray(ideology) + 1) / 2 * self.ideology_buckets).astype(np.intp), 0, self.ideology_buckets - 1)
+
+    def keys(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Cohort index of each citizen in population columns (age, region, ethnicity, ...)"""
+        dimensions = (self.age_band(columns['age']), columns['region'], columns['ethnicity'], columns['religion'],
+                      self.education_band(columns['education_level']), self.ideology_bucket(columns['political_ideology']))
+        for name, values, size in zip(self.DIMENSIONS[1:4], dimensions[1:4], self.shape[1:4]):
+            if len(values) and int(values.max()) >= size:
+                raise ValueError(f"Category code {int(values.max())} of '{name}' is outside the cohort table")
+        return np.ravel_multi_index(dimensions, self.shape)
+
+    # Adding and removing members
+    def _merge(self, counts: np.ndarray, sums: Dict[str, np.ndarray], squares: Dict[str, np.ndarray]) -> None:
+        """Pool members with the given per-cohort counts, value sums and sums of squares into the table"""
+        joining = np.flatnonzero(counts)
+        total = self.counts[joining] + counts[joining]
+        for name in self.MOMENTS:
+            mean, variance = self.means[name][joining], self.variances[name][joining]
+            first = (self.counts[joining] * mean + sums[name][joining]) / total
+            second = (self.counts[joining] * (variance + mean * mean) + squares[name][joining]) / total
+            self.means[name][joining] = first
+            self.variances[name][joining] = np.maximum(second - first * first, 0)
+        self.counts[joining] = total
+
+    def add_store(self, store: PopulationStore, slots: Optional[np.ndarray] = None, chunk_rows: int = 1 << 20) -> None:
+        """Fold citizens of a PopulationStore (all, or those at `slots`) into their cohorts"""
+        names = ('age', 'region', 'ethnicity', 'religion', 'political_ideology') + self.MOMENTS
+        rows = np.arange(len(store)) if slots is None else np.asarray(slots)
+        counts = np.zeros(self.size, dtype=np.int64)
+        sums = {name: np.zeros(self.size) for name in self.MOMENTS}
+        squares = {name: np.zeros(self.size) for name in self.MOMENTS}
+        for start in range(0, len(rows), chunk_rows):
+            chunk = rows[start:start + chunk_rows]
+            columns = {name: store.column(name)[chunk] for name in dict.fromkeys(names)}
+            keys = self.keys(columns)
+            counts += np.bincount(keys, minlength=self.size)
+            for name in self.MOMENTS:
+                values = columns[name]
+                sums[name] += np.bincount(keys, weights=values, minlength=self.size)
+                squares[name] += np.bincount(keys, weights=values * values, minlength=self.size)
+        self._merge(counts, sums, squares)
+
+    @classmethod
+    def from_store(cls, store: PopulationStore, **options) -> 'CohortTable':
+        """Cohorts of every citizen in a PopulationStore"""
+        table = cls(**options)
+        table.add_store(store)
+        return table
+
+    def add_random(self, count: int, rng: np.random.Generator, age: Optional[float] = None) -> None:
+        """Add `count` citizens drawn like PopulationStore.add_random (random ages 0-90 unless `age` is given)"""
+        if count <= 0:
+            return
+        lows, highs = self.age_lows, self.age_highs
+        if age is None:
+            ages = np.arange(91)  # add_random draws whole years 0-90
+            band_shares = np.bincount(self.age_band(ages), minlength=self.shape[0]) / len(ages)
+        else:
+            band_shares = np.zeros(self.shape[0])
+            band_shares[self.age_band(np.array([age]))[0]] = 1.0
+        # Every other key is uniform and independent
+        shares = band_shares[self.coordinate('age_band')] / np.prod(self.shape[1:])
+        counts = rng.multinomial(count, shares / shares.sum())
+
+        width = 100 / self.education_bands
+        education_low = self.coordinate('education_band') * width
+        uniforms = {
+            'happiness': (40, 80), 'trust_in_institutions': (30, 70), 'socioeconomic_rating': (20, 80),
+            'trust_in_government': (30, 70), 'satisfaction_level': (40, 60),
+            'education_level': (education_low, education_low + width),
+        }
+        constants = {'economic_satisfaction': 50.0, 'social_satisfaction': 50.0, 'health': 100.0}
+        sums, squares = {}, {}
+        for name in self.MOMENTS:
+            if name in uniforms:
+                low, high = uniforms[name]
+                mean, variance = (low + high) / 2, (np.subtract(high, low) ** 2) / 12
+            else:
+                mean, variance = constants[name], 0.0
+            sums[name] = counts * mean
+            squares[name] = counts * (variance + np.square(mean))
+        self._merge(counts, sums, squares)
+
+    def remove(self, count: int, rng: np.random.Generator, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Remove `count` citizens, each cohort losing members in proportion to
+        its head count times its per-member `weights` (e.g. mortality; equal if None).
+
+        Returns:
+            np.ndarray: Number removed from each cohort (at most the head count in total)
+        """
+        remaining = min(count, len(self))
+        removed = np.zeros(self.size, dtype=np.int64)
+        while remaining > 0:
+            pressure = self.counts if weights is None else self.counts * weights
+            draw = np.minimum(rng.multinomial(remaining, pressure / pressure.sum()), self.counts)
+            self.counts -= draw
+            removed += draw
+            remaining -= int(draw.sum())
+        return removed
+
+    def sample_members(self, cohorts: np.ndarray, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """
+        Draw individual attribute values for one member of each of `cohorts`
+        (cohort indices, repeated for several members).
+
+        Keys come from the cohort: ages, education and ideology are uniform
+        within its band or bucket and region, ethnicity and religion are its
+        codes. The MOMENTS attributes are normal with the cohort's mean and
+        variance, clipped to their bounds (education to its band).
+
+        Returns:
+            Dict[str, np.ndarray]: Column name -> values, e.g. overrides for PopulationStore.add_random
+        """
+        count = len(cohorts)
+        coordinates = {name: self.coordinate(name)[cohorts] for name in self.DIMENSIONS}
+        band = coordinates['age_band']
+        lows, highs = self.age_lows[band], self.age_highs[band]
+        bucket_width = 2 / self.ideology_buckets
+        values = {
+            'age': lows + (highs - lows) * rng.random(count),
+            'region': coordinates['region'].astype(np.uint8),
+            'ethnicity': coordinates['ethnicity'].astype(np.uint8),
+            'religion': coordinates['religion'].astype(np.uint8),
+            'political_ideology': -1 + bucket_width * (coordinates['ideology_bucket'] + rng.random(count)),
+        }
+        education_width = 100 / self.education_bands
+        education_low = coordinates['education_band'] * education_width
+        bounds = {name: (0, 100) for name in UPDATE_BOUNDS + MEDIA_BOUNDS}
+        bounds['education_level'] = (education_low, education_low + education_width)
+        for name in self.MOMENTS:
+            draws = rng.normal(self.means[name][cohorts], np.sqrt(self.variances[name][cohorts]))
+            values[name] = np.clip(draws, *bounds[name]) if name in bounds else draws
+        return values
+
+    def mortality_weights(self, mortality: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """Per-cohort average of a relative mortality function of age, with ages uniform in each band"""
+        lows, highs = self.age_lows, self.age_highs
+        steps = (np.arange(64) + 0.5) / 64
+        band_weights = mortality(lows[:, None] + (highs - lows)[:, None] * steps).mean(axis=1)
+        return band_weights[self.coordinate('age_band')]
+
+    def apply_vital_statistics(self, rng: np.random.Generator, birth_rate: float, death_rate: float,
+                               mortality: Callable[[np.ndarray], np.ndarray], months: float = 1.0,
+                               max_population: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Natural births and deaths over `months`, as DemographicEngine.apply_vital_statistics;
+        births stop at `max_population` (MAX_POPULATION if None).
+
+        Returns:
+            Tuple[int, int]: Number of births and deaths
+        """
+        population = len(self)
+        deaths = 0
+        if population:
+            weights = self.mortality_weights(mortality)
+            scale = death_rate * months / 12 * population / float(self.counts @ weights)
+            died = rng.binomial(self.counts, np.minimum(weights * scale, 1.0))
+            self.counts -= died
+            deaths = int(died.sum())
+        births = int(rng.binomial(population, min(1.0, birth_rate * months / 12)))
+        cap = MAX_POPULATION if max_population is None else max_population
+        births = min(births, max(0, cap - population + deaths))
+        self.add_random(births, rng, age=0)
+        return births, deaths
+
+    def age(self, rng: np.random.Generator, months: float = 1.0) -> None:
+        """Move members up an age band as `months` pass"""
+        stride = self.size // self.shape[0]
+        widths = (self.age_highs - self.age_lows)[:-1]
+        rates = np.minimum(months / 12 / widths, 1.0)
+        rising = slice(0, self.size - stride)  # Every band but the open top one
+        movers = np.zeros(self.size, dtype=np.int64)
+        movers[rising] = rng.binomial(self.counts[rising], np.repeat(rates, stride))
+        self.counts -= movers
+        arrivals = np.roll(movers, stride)
+        self._merge(arrivals, {name: arrivals * np.roll(self.means[name], stride) for name in self.MOMENTS},
+                    {name: arrivals * np.roll(self.variances[name] + self.means[name] ** 2, stride)
+                     for name in self.MOMENTS})
+
+    # Cohort-level versions of the per-citizen steps
+    def _add_uniform(self, name: str, low: float, high: float, offset: float = 0.0) -> None:
+        """Each member's value += uniform(low, high) + offset"""
+        self.means[name] += (low + high) / 2 + offset
+        self.variances[name] += (high - low) ** 2 / 12
+
+    def _clip(self, name: str, rows: np.ndarray, low: float = 0.0, high: float = 100.0) -> None:
+        # Only occupied cohorts: the moments of an empty one are replaced when members join
+        clip_in_place(self.means[name], self.variances[name], low, high, rows)
+
+    def update(self, rng: np.random.Generator, economic_impact: Optional[float], social_impact: Optional[float],
+               policy_terms: Optional[List[Tuple[str, float]]]) -> None:
+        """Cohort version of CitizenUpdateEngine.update_columns (terms from CitizenUpdateEngine.impacts)"""
+        if economic_impact is not None:
+            self._add_uniform('happiness', -5, 5, economic_impact * 10)
+            self._add_uniform('socioeconomic_rating', -2, 2, economic_impact * 5)
+        if social_impact is not None:
+            self._add_uniform('happiness', -3, 3, social_impact * 5)
+        if policy_terms is not None:
+            for policy_area, policy_strength in policy_terms:
+                if policy_area == 'ECONOMY':
+                    self._add_uniform('happiness', -2, 2, policy_strength * 3)
+                    self._add_uniform('economic_satisfaction', -1, 1, policy_strength * 2)
+                elif policy_area == 'SOCIAL_WELFARE':
+                    self._add_uniform('happiness', -1, 3, policy_strength * 4)
+                    self._add_uniform('social_satisfaction', 0, 2, policy_strength * 3)
+                elif policy_area == 'HEALTHCARE':
+                    self._add_uniform('happiness', 0, 2, policy_strength * 2)
+                    self._add_uniform('health', -1, 1, policy_strength * 2)
+            self._add_uniform('trust_in_institutions', -3, 3)
+        self.age(rng)
+        occupied = np.flatnonzero(self.counts)
+        for name in UPDATE_BOUNDS:
+            self._clip(name, occupied)
+
+    def process_media_influence(self, sentiments: np.ndarray, passes: int = 1) -> None:
+        """Cohort version of MediaInfluenceEngine.influence_columns"""
+        # Influence factor min(1, education * 0.007 + 0.3) is linear below education 100
+        factor_mean = self.means['education_level'] * 0.007 + 0.3
+        factor_square = factor_mean ** 2 + self.variances['education_level'] * 0.007 ** 2
+        random_square = 1 + 0.4 ** 2 / 12  # Second moment of uniform(0.8, 1.2)
+        impact_spread = factor_square * random_square - factor_mean ** 2
+        occupied = np.flatnonzero(self.counts)
+        for _ in range(passes):
+            for sentiment in sentiments:
+                scale = sentiment * 20
+                for name, share in (('trust_in_government', 1.0), ('satisfaction_level', 0.8)):
+                    self.means[name] += share * scale * factor_mean
+                    self.variances[name] += (share * scale) ** 2 * impact_spread
+                    self._clip(name, occupied)
+
+    def ideology_shares(self, party_terms: List[Tuple[float, bool]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Per ideology bucket: the share of members an aligned party carries to a
+        yes vote, and the share aligned with no party (ReferendumSystem.decide_columns)
+        """
+        width = 2 / self.ideology_buckets
+        points = -1 + width * (np.arange(self.ideology_buckets)[:, None] + (np.arange(IDEOLOGY_GRID) + 0.5) / IDEOLOGY_GRID)
+        undecided = np.ones(points.shape, dtype=bool)
+        support = np.zeros(points.shape, dtype=bool)
+        for score, supports in party_terms:
+            aligned = undecided & (np.abs(points - score) < 0.3)
+            support |= aligned & supports
+            undecided &= ~aligned
+        return support.mean(axis=1), undecided.mean(axis=1)
+
+    def decide_referendum_vote(self, party_terms: List[Tuple[float, bool]], media_influence: float,
+                               affects_economic: bool, affects_social: bool) -> np.ndarray:
+        """Cohort version of ReferendumSystem.decide_columns: each cohort's probability of a vote in favour"""
+        likelihood = 0.5 + media_influence * (1 - self.means['education_level'] / 100) * 0.3
+        spread = (media_influence * 0.003) ** 2 * self.variances['education_level'] + 0.2 ** 2 / 12
+        if affects_economic:
+            likelihood = likelihood + (self.means['economic_satisfaction'] - 50) / 100 * 0.2
+            spread = spread + 0.002 ** 2 * self.variances['economic_satisfaction']
+        if affects_social:
+            likelihood = likelihood + (self.means['social_satisfaction'] - 50) / 100 * 0.2
+            spread = spread + 0.002 ** 2 * self.variances['social_satisfaction']
+        undecided_support, _ = clipped_moments(likelihood, spread, 0.0, 1.0)
+        aligned_support, undecided = self.ideology_shares(party_terms)
+        bucket = self.coordinate('ideology_bucket')
+        return aligned_support[bucket] + undecided[bucket] * undecided_support
+
+    def voters(self) -> np.ndarray:
+        """Per-cohort number of citizens with voting rights"""
+        return np.where(self.age_lows[self.coordinate('age_band')] >= MIN_LEGAL_VOTING_AGE, self.counts, 0)
+
+    def snapshot(self, aggregates: Optional[PopulationAggregates] = None) -> DemographicSnapshot:
+        """
+        Demographic counts behind the social tension metrics (see DemographicSnapshot),
+        plus the citizens counted by `aggregates` if given (e.g. those taken out of cohorts)
+        """
+        def totals(dimension: str) -> np.ndarray:
+            counts = np.bincount(self.coordinate(dimension), weights=self.counts, minlength=self.shape[self.DIMENSIONS.index(dimension)])
+            if aggregates is None or dimension not in aggregates.histograms:
+                return counts  # Age bands are added below
+            histogram = aggregates.histograms[dimension]
+            size = max(len(counts), len(histogram))
+            return np.pad(counts, (0, size - len(counts))) + np.pad(histogram, (0, size - len(histogram)))
+
+        bands = totals('age_band')
+        tension_band = np.searchsorted(AGE_BAND_EDGES, self.age_lows, side='right')
+        regions = totals('region')
+        age_bands = {name: int(bands[tension_band == index].sum()) for index, name in enumerate(AGE_BANDS)}
+        if aggregates is not None:
+            age_bands = {name: count + int(aggregates.age_bands[name]) for name, count in age_bands.items()}
+        return DemographicSnapshot(
+            population=len(self) + (aggregates.count if aggregates is not None else 0),
+            ethnic_groups=int(np.count_nonzero(totals('ethnicity'))),
+            religious_groups=int(np.count_nonzero(totals('religion'))),
+            age_bands=age_bands,
+            urban_count=sum(int(regions[code]) for code, region in enumerate(CATEGORIES['region'].values[:len(regions)])
+                            if str(region).startswith('Urban')),
+        )
+
+class CohortSociety(SocietySystem):
+    """
+    SocietySystem over a CohortTable instead of one row per citizen.
+
+    The simulation-facing interface is the same: update_population,
+    for_each_chunk with kernels that have a cohort version (see
+    ColumnKernel.apply_cohorts), satisfaction and tension metrics, voter
+    counts and cast_votes. Per-citizen accessors (citizens, store,
+    get_voter_columns) see an empty population.
+    """
+    def _create_population(self, initial_population: int, population_file: Optional[str]) -> None:
+        if population_file is not None:
+            raise ValueError("Cohort mode keeps no per-citizen population file")
+        # MAX_POPULATION is sized for agents; cohorts exist to go far beyond it
+        self.max_population = max(MAX_POPULATION, int(initial_population * COHORT_POPULATION_HEADROOM))
+        self._attach_store(PopulationStore())
+        self.cohorts = CohortTable()
+        self.cohorts.add_random(initial_population, self.rng)
+
+    def __len__(self) -> int:
+        return len(self.cohorts)
+
+    def mean(self, name: str) -> float:
+        return self.cohorts.mean(name)
+
+    def voter_count(self) -> int:
+        return int(self.cohorts.voters().sum())
+
+    def cast_votes(self, system, referendum, media_coverage: Dict, party_positions: Dict) -> Tuple[int, int]:
+        return system.cast_cohorts(referendum, self.cohorts, media_coverage, party_positions)
+
+    def for_each_chunk(self, kernels, chunk_size: Optional[int] = None) -> None:
+        """Apply each kernel's cohort version, in order"""
+        for kernel in kernels:
+            kernel.apply_cohorts(self.cohorts)
+
+    def _grow(self, count: int) -> None:
+        self.cohorts.add_random(count, self.demographics.rng)
+
+    def _decline(self, count: int) -> None:
+        self.cohorts.remove(count, self.demographics.rng, self.cohorts.mortality_weights(self.demographics.mortality_weights))
+
+    def _apply_vital_statistics(self) -> Tuple[int, int]:
+        demographics = self.demographics
+        return self.cohorts.apply_vital_statistics(demographics.rng, demographics.birth_rate, demographics.death_rate,
+                                                   demographics.mortality_weights, max_population=self.max_population)
+
+    def _take_snapshot(self) -> DemographicSnapshot:
+        return self.cohorts.snapshot()
+
+class HybridSociety(CohortSociety):
+    """
+    Cohort population with individual citizens materialized on demand.
+
+    Most citizens live in the CohortTable. get_random_citizens and the
+    ballot audit of cast_votes take members out of their cohorts and give
+    them a row in the PopulationStore, with attributes drawn from the
+    cohort's distributions (CohortTable.sample_members). From then on they
+    are ordinary agents: the monthly sweep, media influence, deaths and
+    votes apply to them one by one, so a sampled citizen stays the same
+    person. Ballot audits reuse materialized voters, so memory stays that of
+    the cohorts plus the sampled citizens and one audit sample.
+    """
+    def __len__(self) -> int:
+        return len(self.cohorts) + len(self.store)
+
+    def mean(self, name: str) -> float:
+        population = len(self)
+        if not population:
+            return 0.0
+        return (len(self.cohorts) * self.cohorts.mean(name) + self.aggregates.sums[name]) / population
+
+    def voter_count(self) -> int:
+        return int(self.cohorts.voters().sum()) + len(self.voter_roll)
+
+    def materialize(self, count: int, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Turn `count` random cohort members into individual citizens.
+
+        Args:
+            count: Number of citizens
+            weights: Per-cohort relative chance of each member being picked (equal if None)
+
+        Returns:
+            np.ndarray: Store slots of the new citizens
+        """
+        removed = self.cohorts.remove(count, self.rng, weights)
+        members = np.repeat(np.arange(self.cohorts.size), removed)
+        return self.store.add_random(len(members), self.rng, overrides=self.cohorts.sample_members(members, self.rng))
+
+    def get_random_citizens(self, n: int) -> List[Citizen]:
+        # Each pick is an existing individual or a cohort member in proportion to their numbers
+        n = min(n, len(self))
+        existing = int(self.rng.hypergeometric(len(self.store), len(self.cohorts), n)) if n else 0
+        slots = self.rng.choice(len(self.store), size=existing, replace=False)
+        return self.store.views(np.concatenate([slots, self.materialize(n - existing)]))
+
+    def cast_votes(self, system, referendum, media_coverage: Dict, party_positions: Dict,
+                   audit: int = BALLOT_AUDIT_SAMPLE) -> Tuple[int, int]:
+        """
+        Cohort votes plus individual ballots of the materialized voters; the
+        ballots of `audit` individual voters are recorded in
+        referendum.audited_ballots (citizen id -> vote in favour). Voters are
+        audited from those already materialized first and only the shortfall
+        is materialized, so repeated referendums do not grow the store.
+        """
+        voters = self.cohorts.voters()
+        existing = self.get_voting_slots()
+        reused = self.rng.choice(existing, size=min(audit, len(existing)), replace=False)
+        fresh = self.materialize(min(audit - len(reused), int(voters.sum())), np.where(voters > 0, 1.0, 0.0))
+        audited = np.concatenate([reused, fresh])
+
+        votes_for, votes_against = system.cast_cohorts(referendum, self.cohorts, media_coverage, party_positions)
+        slots = self.get_voting_slots()
+        if len(slots):
+            ballot_for, ballot_against, ballots = system.cast_bulk(
+                referendum, self.get_voter_columns(ReferendumSystem.VOTER_COLUMNS), media_coverage, party_positions,
+                return_ballots=True)
+            votes_for, votes_against = votes_for + ballot_for, votes_against + ballot_against
+            ids = self.store.column('id')[slots]
+            audit_rows = np.isin(slots, audited)
+            referendum.audited_ballots.update(zip(ids[audit_rows].tolist(), ballots[audit_rows].tolist()))
+        return votes_for, votes_against
+
+    def for_each_chunk(self, kernels, chunk_size: Optional[int] = None) -> None:
+        """Apply each kernel to the cohorts and to the individual citizens"""
+        kernels = list(kernels)
+        super().for_each_chunk(kernels)
+        if len(self.store):
+            self.store.for_each_chunk(kernels, chunk_size)
+
+    def _decline(self, count: int) -> None:
+        # Split between individuals and cohort members in proportion to their numbers
+        count = min(count, len(self))
+        individuals = int(self.demographics.rng.hypergeometric(len(self.store), len(self.cohorts), count)) if count else 0
+        self.demographics.decline(self.store, individuals)
+        super()._decline(count - individuals)
+
+    def _apply_vital_statistics(self) -> Tuple[int, int]:
+        # Individuals die one by one; every birth goes into the cohorts
+        demographics = self.demographics
+        individuals = len(self.store)
+        deaths = demographics.apply_deaths(self.store)
+        cohort_births, cohort_deaths = super()._apply_vital_statistics()
+        births = int(demographics.rng.binomial(individuals, min(1.0, demographics.birth_rate / 12)))
+        births = min(births, max(0, self.max_population - len(self)))
+        self.cohorts.add_random(births, demographics.rng, age=0)
+        return cohort_births + births, cohort_deaths + deaths
+
+    def _take_snapshot(self) -> DemographicSnapshot:
+        return self.cohorts.snapshot(self.aggregates)
@@ -0,0 +1,125 @@
+from typing import Optional, Tuple
+import numpy as np
+from config import *
+
+from .population import PopulationStore
+
+class DemographicEngine:
+    """
+    Births and deaths over a PopulationStore, applied as whole-batch operations.
+
+    Growth batches are appended as one block of columns and deaths are
+    released through `PopulationStore.release`, which refills vacated slots
+    from the tail so storage is reused instead of reallocated.
+
+    Mortality is age-aware (Gompertz): a citizen's relative risk is
+    exp(MORTALITY_AGE_SLOPE * age), scaled so the population-wide rate
+    matches DEATH_RATE.
+
+    Per-citizen passes run over CHUNK_ROWS rows at a time, so their
+    temporaries stay bounded for very large (e.g. file-backed) populations.
+    Draws are taken in row order either way, so chunking does not change
+    which citizens die.
+    """
+    CHUNK_ROWS = 1 << 20
+
+    def __init__(self, rng: np.random.Generator, birth_rate: Optional[float] = None,
+                 death_rate: Optional[float] = None):
+        self.rng = rng
+        # Annual rates; the config defaults are read here so sweep overrides apply
+        self.birth_rate = BIRTH_RATE if birth_rate is None else birth_rate
+        self.death_rate = DEATH_RATE if death_rate is None else death_rate
+
+    @staticmethod
+    def mortality_weights(ages: np.ndarray) -> np.ndarray:
+        """Relative risk of death by age"""
+        return np.exp(MORTALITY_AGE_SLOPE * ages)
+
+    def _chunks(self, size: int):
+        return (slice(start, min(start + self.CHUNK_ROWS, size)) for start in range(0, size, self.CHUNK_ROWS))
+
+    def _death_scale(self, ages: np.ndarray, months: float) -> float:
+        """Factor turning mortality weights into probabilities that average to DEATH_RATE"""
+        total = sum(self.mortality_weights(ages[rows]).sum() for rows in self._chunks(len(ages)))
+        return self.death_rate * months / 12 * len(ages) / total
+
+    def death_probabilities(self, ages: np.ndarray, months: float = 1.0) -> np.ndarray:
+        """Per-citizen probability of dying within `months`, averaging to DEATH_RATE"""
+        if not len(ages):
+            return np.empty(0)
+        weights = self.mortality_weights(ages)
+        weights *= self._death_scale(ages, months)
+        return np.minimum(weights, 1.0, out=weights)
+
+    def grow(self, store: PopulationStore, count: int, age: Optional[float] = None) -> np.ndarray:
+        """Add a batch of `count` citizens (random ages unless `age` is given)"""
+        return store.add_random(max(0, count), self.rng, age=age)
+
+    def decline(self, store: PopulationStore, count: int) -> np.ndarray:
+        """
+        Remove exactly `count` citizens, older citizens being more likely to go.
+
+        Returns:
+            np.ndarray: Ids of the removed citizens
+        """
+        count = min(count, len(store))
+        if count <= 0:
+            return np.empty(0, dtype=np.int64)
+        # Weighted sampling without replacement: smallest Exp(1)/weight keys win.
+        # Keys are drawn per chunk and only the `count` best so far are kept.
+        ages = store.column('age')
+        best_keys = np.empty(0)
+        best_slots = np.empty(0, dtype=np.int64)
+        for rows in self._chunks(len(store)):
+            keys = self.rng.exponential(size=rows.stop - rows.start)
+            keys /= self.mortality_weights(ages[rows])
+            keys = np.concatenate([best_keys, keys])
+            slots = np.concatenate([best_slots, np.arange(rows.start, rows.stop)])
+            if len(keys) > count:
+                keep = np.argpartition(keys, count - 1)[:count]
+                keys, slots = keys[keep], slots[keep]
+            best_keys, best_slots = keys, slots
+        return self._release(store, np.sort(best_slots))
+
+    def apply_vital_statistics(self, store: PopulationStore, months: float = 1.0,
+                               max_population: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Natural births and deaths over `months` from BIRTH_RATE and DEATH_RATE;
+        births stop at `max_population` (MAX_POPULATION if None).
+
+        Returns:
+            Tuple[int, int]: Number of births and deaths
+        """
+        population = len(store)
+        deaths = self.apply_deaths(store, months)
+        births = int(self.rng.binomial(population, min(1.0, self.birth_rate * months / 12)))
+        cap = MAX_POPULATION if max_population is None else max_population
+        births = min(births, max(0, cap - population + deaths))
+        self.grow(store, births, age=0)
+        return births, deaths
+
+    def apply_deaths(self, store: PopulationStore, months: float = 1.0) -> int:
+        """
+        Natural deaths over `months` from DEATH_RATE, without births.
+
+        Returns:
+            int: Number of deaths
+        """
+        population = len(store)
+        if not population:
+            return 0
+        ages = store.column('age')
+        scale = self._death_scale(ages, months)
+        deaths = np.concatenate([
+            np.flatnonzero(self.rng.random(rows.stop - rows.start) <
+                           np.minimum(self.mortality_weights(ages[rows]) * scale, 1.0)) + rows.start
+            for rows in self._chunks(population)
+        ])
+        self._release(store, deaths)
+        return len(deaths)
+
+    @staticmethod
+    def _release(store: PopulationStore, slots: np.ndarray) -> np.ndarray:
+        ids = store.columns['id'][slots].copy()
+        store.release(slots)
+        return ids
@@ -219,6 +219,25 @@ class EconomicModel:
             'Money Supply': f"{self.money_supply:.2f}"
         }
 
+    def get_indicator_values(self) -> Dict[str, float]:
+        """Headline indicators as numbers (get_economic_indicators formats them for reports)"""
+        return {
+            'gdp': self.gdp,
+            'inflation_rate': self.inflation_rate,
+            'unemployment_rate': self.unemployment_rate,
+            'trade_balance': self.trade_balance,
+            'average_wage': self.average_wage,
+            'government_revenue': self.government_revenue,
+            'government_spending': self.government_spending,
+            'budget_balance': self.budget_balance,
+            'income_tax_rate': self.income_tax_rate,
+            'corporate_tax_rate': self.corporate_tax_rate,
+            'vat_rate': self.vat_rate,
+            'social_security_rate': self.social_security_rate,
+            'interest_rate': self.interest_rate,
+            'money_supply': self.money_supply
+        }
+
     def get_gdp_growth(self) -> float:
         """Returns the GDP growth rate"""
         # GDP growth is already calculated in simulate_month/year
@@ -1,5 +1,5 @@
 from enum import Enum
-from datetime import datetime, timedelta
+from .clock import SimulationClock, current_clock
 from typing import List, Dict, Optional, TYPE_CHECKING
 import random
 from config import *
@@ -114,13 +114,14 @@ class Ministry:
             self.efficiency = max(0.5, min(1.0, self.efficiency))
 
 class Government:
-    def __init__(self, prime_minister):
+    def __init__(self, prime_minister, clock: Optional[SimulationClock] = None):
         self.prime_minister = prime_minister
+        self.clock = clock or current_clock()
         self.ministries = {ministry_type: Ministry(ministry_type.value, ministry_type) for ministry_type in MinistryType}
         self.government_managers = []
         self.status = GovernmentStatus.ACTIVE
-        self.formation_date = datetime.now()
-        self.dissolution_date = self.formation_date + timedelta(days=3*365)
+        self.formation_date = self.clock.today()  # Simulated days
+        self.dissolution_date = self.formation_date + SimulationClock.days(years=3)
         self.emergency_end_date = None
         self.total_budget = 0.0
         self.current_revenue = 0.0
@@ -158,7 +159,7 @@ class Government:
         return random.random() > 0.5
 
     def check_dissolution(self) -> bool:
-        if datetime.now() >= self.dissolution_date:
+        if self.clock.today() >= self.dissolution_date:
             self.status = GovernmentStatus.DISSOLVED
             return True
         return False
@@ -166,12 +167,12 @@ class Government:
     def declare_emergency(self) -> bool:
         if self.status != GovernmentStatus.EMERGENCY:
             self.status = GovernmentStatus.EMERGENCY
-            self.emergency_end_date = datetime.now() + timedelta(days=120)
+            self.emergency_end_date = self.clock.today() + EMERGENCY_DURATION
             return True
         return False
 
     def check_emergency_status(self) -> bool:
-        if self.status == GovernmentStatus.EMERGENCY and datetime.now() >= self.emergency_end_date:
+        if self.status == GovernmentStatus.EMERGENCY and self.clock.today() >= self.emergency_end_date:
             self.status = GovernmentStatus.ACTIVE
             self.emergency_end_date = None
             return True
@@ -256,6 +257,15 @@ class Government:
         if influence_factor < -0.8:
             self.declare_emergency()
 
+    def run_emergency_operations(self) -> None:
+        """
+        Caretaker duties of a dissolved government until a new one is formed:
+        ministries keep running, but approval erodes while the transition lasts
+        """
+        for ministry in self.ministries.values():
+            ministry.update_efficiency()
+        self.approval_rating = max(0.0, self.approval_rating - GOVERNMENT_APPROVAL_DECAY)
+
     def implement_austerity(self) -> None:
         """
         Implements austerity measures during economic crisis:
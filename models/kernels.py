@@ -0,0 +1,76 @@
+"""
+Composable per-citizen kernels for chunked population sweeps.
+
+A ColumnKernel is one per-citizen step of a month (the citizen update, the
+media influence, ...). PopulationStore.for_each_chunk streams fixed-size row
+slices of the columns through a list of kernels: every kernel runs on a
+chunk while it is still in cache, and the running aggregates of the written
+columns are reduced from the same chunk. Fusing phases this way reads and
+writes each row once per sweep instead of once per phase, plus once per
+aggregate refresh.
+"""
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+
+from .rng import ShardedStream
+
+class ColumnKernel:
+    """
+    One step of a population sweep.
+
+    Subclasses name the columns they read (COLUMNS) and write (UPDATES) and
+    update a chunk of them in place in run(). Draws come from `rng`: a
+    ShardedStream gives each chunk its own (shard, step) generator, a plain
+    Generator is drawn from chunk after chunk and None means no draws.
+    """
+    COLUMNS: Tuple[str, ...] = ()
+    UPDATES: Tuple[str, ...] = ()
+
+    def __init__(self, rng: Optional[Union[np.random.Generator, ShardedStream]] = None):
+        self.rng = rng
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Sent to worker processes, which draw from their own copy of the streams
+        state = dict(vars(self))
+        state['rng'] = None
+        return state
+
+    def run(self, columns: Dict[str, np.ndarray], rng: Optional[np.random.Generator]) -> None:
+        """
+        Update one chunk in place.
+
+        Args:
+            columns: Column name -> chunk of rows (every column any kernel of the sweep uses)
+            rng: This kernel's generator for the chunk
+        """
+        raise NotImplementedError
+
+    def apply_cohorts(self, cohorts) -> None:
+        """
+        Cohort version of the step, for populations kept as a CohortTable
+        (see models/cohorts.py). Kernels without one cannot run in cohort mode.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no cohort version")
+
+def sweep_columns(kernels: List[ColumnKernel]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Columns read and columns written by a list of kernels, in first-use order"""
+    names = tuple(dict.fromkeys(name for kernel in kernels for name in kernel.COLUMNS + kernel.UPDATES))
+    updated = tuple(dict.fromkeys(name for kernel in kernels for name in kernel.UPDATES))
+    return names, updated
+
+def chunk_generators(rng: Optional[Union[np.random.Generator, ShardedStream]], chunks: int,
+                     chunk_size: int) -> List[Optional[np.random.Generator]]:
+    """
+    Generator for each of `chunks` consecutive chunks of one sweep.
+
+    A ShardedStream advances one step and keys chunk i on shard i, so the
+    chunks must be its shards; the draws then match shard_draws and the
+    multi-process executor.
+    """
+    if isinstance(rng, ShardedStream):
+        if chunk_size != rng.rng.shard_size:
+            raise ValueError(f"Chunks of {chunk_size} rows do not match the {rng.rng.shard_size}-row "
+                             f"shards of stream '{rng.name}'")
+        step = rng.next_step()
+        return [rng.rng.shard_generator(rng.name, shard, step) for shard in range(chunks)]
+    return [rng] * chunks
@@ -8,12 +8,15 @@ from faker import Faker
 #from .civil_society import *
 
 import importlib
+import logging
 referendum = importlib.import_module(".referendum", package=__package__)
 civil_society = importlib.import_module(".civil_society", package=__package__)
 
 # Initialize Faker for Romanian names
 fake = Faker('ro_RO')
 
+logger = logging.getLogger(__name__)
+
 from config import *
 
 class Law:
@@ -85,7 +88,7 @@ class Parliamentarian:
         else:
             self.status = ParliamentaryStatus.ACTIVE
         if DEBUG_MODE:
-            print(f"Member {self.id} status updated to {self.status}")
+            logger.debug("Member %s status updated to %s", self.id, self.status)
 
     def update_status(self) -> None:
         if self.government_role != GovernmentRole.NONE:
@@ -102,7 +105,7 @@ class Parliamentarian:
             self.status = ParliamentaryStatus.ACTIVE
 
         if DEBUG_MODE:
-            print(f"Member {self.id} status updated to {self.status}")    
+            logger.debug("Member %s status updated to %s", self.id, self.status)
 
     def get_activity_score(self) -> int:
         return self.activity_score.calculate()
@@ -155,7 +158,7 @@ class Parliament:
         self.deputy_seats = total_seats - self.senate_seats
         self.members = []
         self.admission_committee = []
-        self.quorum_percentage = 0.5  # 50% of members required for quorum
+        self.quorum_percentage = PARLIAMENT_QUORUM  # Share of seats required for quorum
         self.proposed_legislation = []
         self.passed_legislation = []
         self.failed_legislation = []
@@ -167,7 +170,7 @@ class Parliament:
             member.status = ParliamentaryStatus.ACTIVE
             self.members.append(member)
             if DEBUG_MODE:
-                print(f"Added member {member.id} to Parliament")
+                logger.debug("Added member %s to Parliament", member.id)
             return True
         return False
 
@@ -231,32 +234,32 @@ class Parliament:
             iteration += 1
 
             if iteration >= max_iterations:
-                print(f"Attention: Could not reach the minimum number of active members after {max_iterations} iterations.")
+                logger.warning("Attention: Could not reach the minimum number of active members after %d iterations.", max_iterations)
             break
     
     def propose_legislation(self, title: str, proposer: str, content: str, ignore_quorum: bool = False) -> bool:
         if not ignore_quorum and not self.has_quorum():
             if DEBUG_MODE:
-                print("Cannot propose legislation: No quorum")
+                logger.debug("Cannot propose legislation: No quorum")
             return False
         if random.random() <= 0.8:  # 80% chance of proposal acceptance
             legislation = Legislation(title, proposer, content)
             self.proposed_legislation.append(legislation)
             if DEBUG_MODE:
-                print(f"Proposed legislation: {title}")
+                logger.debug("Proposed legislation: %s", title)
             return True
         return False
     
     def process_external_legislation(self, organization, ignore_quorum: bool = False) -> bool:
         if not ignore_quorum and not self.has_quorum():
-            print("Cannot process legislation: No quorum")
+            logger.warning("Cannot process legislation: No quorum")
             return False
         # Simplified external legislation proposal
         return random.random() > 0.6  # 40% chance of proposal acceptance
 
     def vote_on_legislation(self, legislation, ignore_quorum: bool = False) -> bool:
         if not ignore_quorum and not self.has_quorum():
-            print("Cannot vote: No quorum")
+            logger.warning("Cannot vote: No quorum")
             return False
         for member in self.members:
             if member.status == ParliamentaryStatus.ACTIVE:
@@ -319,7 +322,7 @@ class Parliament:
 
     def vote_no_confidence(self) -> bool:
         if not self.has_quorum():
-            print("Cannot vote: No quorum")
+            logger.warning("Cannot vote: No quorum")
             return False
         # Simplified no-confidence vote
         return random.random() > 0.7  # 30% chance of success
@@ -344,7 +347,7 @@ class Parliament:
     def ratify_government(self, government) -> bool:
         if not self.has_quorum():
             if DEBUG_MODE:
-                print("Cannot ratify government: No quorum")
+                logger.debug("Cannot ratify government: No quorum")
             return False
 
         votes_needed = self.total_seats * 0.51  # Absolute majority needed
@@ -364,8 +367,8 @@ class Parliament:
         ratified = votes_for >= votes_needed
         
         if DEBUG_MODE:
-            print(f"Government ratification {'succeeded' if ratified else 'failed'}")
-            print(f"Votes for: {votes_for}, Needed: {votes_needed}")
+            logger.debug("Government ratification %s", 'succeeded' if ratified else 'failed')
+            logger.debug("Votes for: %s, Needed: %s", votes_for, votes_needed)
 
         return ratified
 
@@ -422,7 +425,7 @@ class Parliament:
         """
         if not self.has_quorum():
             if DEBUG_MODE:
-                print("Cannot vote on dismissal: No quorum")
+                logger.debug("Cannot vote on dismissal: No quorum")
             return False
 
         # Need two-thirds majority for dismissal
@@ -462,9 +465,8 @@ class Parliament:
         dismissal_approved = votes_for >= votes_needed
         
         if DEBUG_MODE:
-            print(f"Dismissal vote for member {member.name}: "
-                  f"For: {votes_for}, Against: {votes_against}, "
-                  f"{'Approved' if dismissal_approved else 'Rejected'}")
+            logger.debug("Dismissal vote for member %s: For: %s, Against: %s, %s", member.name,
+                         votes_for, votes_against, 'Approved' if dismissal_approved else 'Rejected')
 
         return dismissal_approved
 
@@ -1,12 +1,15 @@
 from enum import Enum
-from typing import List, Dict, TYPE_CHECKING
+from typing import List, Dict, Optional, Union, TYPE_CHECKING
 import random
-from datetime import datetime
+import numpy as np
 
 if TYPE_CHECKING:
     from .citizen import Citizen
 from .government import Government 
 from .economy_sector import EconomySectorType
+from .kernels import ColumnKernel
+from .rng import ShardedStream
+from .clock import SimulationClock, current_clock
 
 class MediaType(Enum):
     TRADITIONAL_NEWSPAPER = "Traditional Newspaper"
@@ -24,8 +27,9 @@ class NewsCategory(Enum):
     ENVIRONMENT = "Environment"
 
 class MediaOutlet:
-    def __init__(self, name: str, media_type: MediaType):
+    def __init__(self, name: str, media_type: MediaType, clock: Optional[SimulationClock] = None):
         self.name = name
+        self.clock = clock or current_clock()
         self.media_type = media_type
         self.credibility = 50.0  # Scale of 0-100
         self.audience_reach = 1000  # Number of people reached
@@ -75,7 +79,7 @@ class MediaOutlet:
             'category': category,
             'factuality': factuality,
             'sentiment': sentiment,
-            'timestamp': datetime.now()
+            'timestamp': self.clock.today()  # Simulated day
         }
         return news
 
@@ -258,3 +262,84 @@ class MediaLandscape:
             # Consider factors like sensationalism, polarization
             tension_impact += outlet.get_tension_contribution()
         return min(1.0, tension_impact / len(self.outlets))
+
+
+class MediaInfluenceEngine:
+    """
+    Batched equivalent of Citizen.process_media_influence for a whole population.
+
+    A news cycle is reduced to its sentiment vector and applied to the
+    trust_in_government and satisfaction_level columns one news item at a time,
+    clamping after each item exactly like the per-citizen loop.
+    """
+    COLUMNS = ('education_level', 'trust_in_government', 'satisfaction_level')
+
+    def __init__(self, rng: Union[np.random.Generator, ShardedStream], passes: int = 1):
+        self.rng = rng  # A ShardedStream gives each row shard its own reproducible draws
+        self.passes = passes  # How many times each news cycle is applied
+
+    @staticmethod
+    def sentiment_vector(news_cycle: List[Dict]) -> np.ndarray:
+        return np.array([news.get('sentiment', 0) for news in news_cycle], dtype=np.float64)
+
+    def apply(self, store, news_cycle: List[Dict], passes: Optional[int] = None) -> None:
+        """
+        Apply a news cycle to every citizen in `store`
+
+        Args:
+            store: PopulationStore to update in place
+            news_cycle: Output of MediaLandscape.simulate_news_cycle
+            passes: Number of applications (defaults to the engine setting); two passes
+                reproduce processing the same cycle twice, in a single sweep
+        """
+        kernel = self.kernel(news_cycle, passes)
+        if not len(kernel.sentiments) or not len(store):
+            return
+        store.for_each_chunk([kernel])
+
+    def kernel(self, news_cycle: List[Dict], passes: Optional[int] = None) -> 'MediaInfluenceKernel':
+        """The news cycle as a sweep step (see PopulationStore.for_each_chunk), e.g. to fuse it with other phases"""
+        return MediaInfluenceKernel(self.rng, self.sentiment_vector(news_cycle), self.passes if passes is None else passes)
+
+    @staticmethod
+    def influence_columns(columns: Dict[str, np.ndarray], sentiments: np.ndarray,
+                          rng: np.random.Generator, passes: int = 1) -> None:
+        """Update trust and satisfaction columns in place for the given sentiments"""
+        trust = columns['trust_in_government']
+        satisfaction = columns['satisfaction_level']
+        n = len(trust)
+
+        # Base influence depends on education and media literacy; fixed for the whole cycle
+        scaled_influence = np.minimum(1.0, columns['education_level'] / 100 * 0.7 + 0.3) * 20
+        impact = np.empty(n)
+        for _ in range(passes):
+            for sentiment in sentiments:
+                # Random factor in [0.8, 1.2), drawn into the reused buffer
+                rng.random(out=impact)
+                impact *= 0.4
+                impact += 0.8
+                impact *= scaled_influence
+                impact *= sentiment
+                trust += impact
+                np.clip(trust, 0, 100, out=trust)
+                impact *= 0.8  # Slightly less impact on satisfaction
+                satisfaction += impact
+                np.clip(satisfaction, 0, 100, out=satisfaction)
+
+class MediaInfluenceKernel(ColumnKernel):
+    """MediaInfluenceEngine.influence_columns for one news cycle"""
+    COLUMNS = MediaInfluenceEngine.COLUMNS
+    UPDATES = ('trust_in_government', 'satisfaction_level')
+
+    def __init__(self, rng: Union[np.random.Generator, ShardedStream], sentiments: np.ndarray, passes: int = 1):
+        super().__init__(rng)
+        self.sentiments = sentiments
+        self.passes = passes
+
+    def run(self, columns: Dict[str, np.ndarray], rng: np.random.Generator) -> None:
+        if len(self.sentiments):
+            MediaInfluenceEngine.influence_columns(columns, self.sentiments, rng, self.passes)
+
+    def apply_cohorts(self, cohorts) -> None:
+        if len(self.sentiments):
+            cohorts.process_media_influence(self.sentiments, self.passes)
@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import Dict, Optional
-from datetime import datetime
+from .clock import SimulationClock, current_clock
 
 class PolicyStatus(Enum):
     PROPOSED = "Proposed"
@@ -32,16 +32,18 @@ class Policy:
                  area: PolicyArea,
                  strength: float,
                  proposer: str,
-                 description: Optional[str] = None):
+                 description: Optional[str] = None,
+                 clock: Optional[SimulationClock] = None):
         self.title = title
+        self.clock = clock or current_clock()
         self.area = area
         self.strength = max(-1, min(1, strength))  # Ensure policy strength is between -1 and 1
         self.proposer = proposer
         self.description = description
         self.status = PolicyStatus.PROPOSED
-        self.creation_date = datetime.now()
-        self.implementation_date: Optional[datetime] = None
-        self.expiration_date: Optional[datetime] = None
+        self.creation_date = self.clock.today()  # Simulated days
+        self.implementation_date: Optional[int] = None
+        self.expiration_date: Optional[int] = None
         
         # Track policy effects
         self.economic_impact: float = 0.0
@@ -59,12 +61,12 @@ class Policy:
     def implement(self) -> None:
         """Activate the policy and set implementation date"""
         self.status = PolicyStatus.ACTIVE
-        self.implementation_date = datetime.now()
+        self.implementation_date = self.clock.today()
         
     def expire(self) -> None:
         """Mark policy as expired"""
         self.status = PolicyStatus.EXPIRED
-        self.expiration_date = datetime.now()
+        self.expiration_date = self.clock.today()
         
     def reject(self) -> None:
         """Mark policy as rejected"""
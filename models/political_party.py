@@ -1,6 +1,5 @@
 from enum import Enum
-from typing import List, Dict, TYPE_CHECKING
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, TYPE_CHECKING
 import random
 from config import *
 
@@ -8,6 +7,11 @@ if TYPE_CHECKING:
     from .citizen import Citizen
     from .legislative import *
 from .government import *
+from .clock import SimulationClock, current_clock
+
+import importlib
+legislative = importlib.import_module(".legislative", package=__package__)
+government = importlib.import_module(".government", package=__package__)  # Partially initialized when imported from there
 
 class Ideology(Enum):
     FAR_LEFT = "Far-Left"
@@ -74,6 +78,17 @@ class PoliticalParty:
     def calculate_alignment(self, citizen: 'Citizen') -> float:
         return sum(abs(self.policies[area] - getattr(citizen, area.value.lower(), 0)) for area in PolicyArea)
 
+    def prepare_emergency_campaign(self) -> None:
+        """Commit half of the party's funds to the campaign for a snap election"""
+        self.campaign(self.funds * 0.5)
+
+    def nominate_prime_minister(self) -> 'Parliamentarian':
+        """Put forward a party member as Prime Minister of a new government"""
+        candidate = legislative.Parliamentarian(legislative.Chamber.DEPUTIES)
+        candidate.party = self
+        candidate.government_role = legislative.GovernmentRole.PRIME_MINISTER
+        return candidate
+
     def campaign_for_referendum(self, referendum) -> None:
         """
         Conducts a campaign regarding a referendum
@@ -110,8 +125,13 @@ class PoliticalParty:
             }
 
 class PoliticalSystem:
-    def __init__(self):
+    def __init__(self, clock: Optional[SimulationClock] = None):
         self.parties: List[PoliticalParty] = []
+        self.clock = clock or current_clock()
+        self.emergency_election_scheduled = False
+        self.election_date: Optional[int] = None  # Simulated day of the emergency election
+        self.election_results: Dict[PoliticalParty, float] = {}  # Party -> vote share
+        self.votes_cast = 0
 
     def register_party(self, party: PoliticalParty) -> None:
         self.parties.append(party)
@@ -169,7 +189,7 @@ class PoliticalSystem:
     def initiate_emergency_election(self) -> None:
         """Initiate emergency election procedures"""
         self.emergency_election_scheduled = True
-        self.election_date = datetime.now() + timedelta(days=30)  # Schedule within 30 days
+        self.election_date = self.clock.today() + 30  # Schedule within 30 days
         
         # Notify all parties
         for party in self.parties:
@@ -179,13 +199,31 @@ class PoliticalSystem:
         self.votes_cast = 0
         self.election_results = {}
 
+    def hold_emergency_election(self) -> Dict[PoliticalParty, float]:
+        """
+        Hold the scheduled emergency election: vote shares follow party
+        popularity with some campaign-day noise
+
+        Returns:
+            Dict[PoliticalParty, float]: Vote share per party
+        """
+        if not self.emergency_election_scheduled or not self.parties:
+            return {}
+        weights = {party: max(party.popularity, 0.0) * random.uniform(0.8, 1.2) for party in self.parties}
+        total = sum(weights.values())
+        if total <= 0:
+            weights = {party: 1.0 for party in self.parties}
+            total = float(len(self.parties))
+        self.election_results = {party: weight / total for party, weight in weights.items()}
+        return self.election_results
+
     def can_form_government(self) -> bool:
         """Check if conditions are met to form a new government"""
         if not self.emergency_election_scheduled:
             return False
             
         # Check if election date has passed
-        if datetime.now() < self.election_date:
+        if self.clock.today() < self.election_date:
             return False
             
         # Check if there's a clear winner or viable coalition
@@ -207,7 +245,7 @@ class PoliticalSystem:
         self.election_date = None
         
         # Create and return new government
-        return Government(prime_minister)
+        return government.Government(prime_minister, clock=self.clock)
 
     def get_party_positions(self, referendum) -> Dict['PoliticalParty', float]:
     #def get_party_positions(self, referendum: 'Referendum') -> Dict['PoliticalParty', float]:
@@ -0,0 +1,802 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+import numpy as np
+from config import RNG_SHARD_SIZE
+
+from .citizen import (Citizen, CitizenshipStatus, EmploymentStatus, Ethnicity, Religion, RegionType,
+                      MIN_LEGAL_VOTING_AGE)
+from .kernels import ColumnKernel, chunk_generators, sweep_columns
+from .rng import ShardedStream
+
+class CategoryCodes:
+    """
+    Lookup table between the values of a categorical attribute and uint8 codes.
+
+    Known values (enum members, "Region_1".."Region_10", ...) get fixed codes
+    up front; values first seen at runtime are appended, up to 256 in total.
+    """
+    def __init__(self, values: Iterable[object]):
+        self.values: List[object] = list(values)
+        self.codes: Dict[object, int] = {value: code for code, value in enumerate(self.values)}
+        self._lookup: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            if len(self.values) > 255:
+                raise ValueError(f"Too many distinct values for a uint8 category: {value!r}")
+            code = len(self.values)
+            self.values.append(value)
+            self.codes[value] = code
+            self._lookup = None
+        return code
+
+    def encode_many(self, values: Sequence) -> np.ndarray:
+        return np.fromiter((self.encode(value) for value in values), dtype=np.uint8, count=len(values))
+
+    def decode(self, code: int):
+        return self.values[code]
+
+    def decode_many(self, codes: np.ndarray) -> np.ndarray:
+        """Object array of values for an array of codes"""
+        if self._lookup is None:
+            self._lookup = np.empty(len(self.values), dtype=object)
+            self._lookup[:] = self.values
+        return self._lookup[codes]
+
+# Categorical attributes are stored as uint8 codes into these tables; the
+# first entry of each is the default for a fresh row.
+CATEGORIES: Dict[str, CategoryCodes] = {
+    'sex': CategoryCodes(['Male', 'Female']),
+    'region': CategoryCodes(f"Region_{i}" for i in range(1, 11)),
+    'citizenship_status': CategoryCodes(CitizenshipStatus),
+    'employment_status': CategoryCodes(status.value for status in EmploymentStatus),
+    'ethnicity': CategoryCodes(Ethnicity),
+    'religion': CategoryCodes(Religion),
+    'region_type': CategoryCodes(RegionType),
+}
+CITIZEN_CODE = CATEGORIES['citizenship_status'].encode(CitizenshipStatus.CITIZEN)
+
+def category_state() -> Dict[str, list]:
+    """Values of every category table in code order, for saving alongside stored codes"""
+    return {name: list(table.values) for name, table in CATEGORIES.items()}
+
+def restore_categories(saved: Dict[str, list]) -> None:
+    """Re-register values appended at runtime so saved codes decode the same (see category_state)"""
+    for name, values in saved.items():
+        table = CATEGORIES[name]
+        known = table.values[:len(values)]
+        if known != values[:len(known)]:
+            raise ValueError(f"Saved category codes for '{name}' do not match this process")
+        for value in values[len(known):]:
+            table.encode(value)
+
+# Column schema for the population store: name -> (dtype, default for a fresh row).
+# Mirrors the attributes set in Citizen.__init__.
+CITIZEN_COLUMNS = {
+    # Identity and demographics
+    'id': (np.int64, 0),
+    'age': (np.float64, 0.0),
+    'sex': (np.uint8, 0),
+    'region': (np.uint8, 0),
+    'citizenship_status': (np.uint8, 0),
+    'is_immigrant': (np.bool_, False),
+    'years_in_country': (np.float64, 0.0),
+
+    # Economic attributes
+    'income': (np.float64, 0.0),
+    'wealth': (np.float64, 0.0),
+    'savings': (np.float64, 0.0),
+    'debt': (np.float64, 0.0),
+    'socioeconomic_rating': (np.float64, 0.0),
+
+    # Social factors
+    'education_level': (np.float64, 0.0),
+    'health': (np.float64, 100.0),
+    'happiness': (np.float64, 50.0),
+    'social_capital': (np.float64, 0.0),
+    'trust_in_institutions': (np.float64, 0.0),
+    'economic_satisfaction': (np.float64, 50.0),
+    'social_satisfaction': (np.float64, 50.0),
+
+    # Work factors
+    'employment_status': (np.uint8, 0),
+    'job_satisfaction': (np.float64, 0.0),
+    'work_life_balance': (np.float64, 0.0),
+
+    # Political factors
+    'political_leaning': (np.float64, 0.0),
+    'political_ideology': (np.float64, 0.0),
+    'civic_engagement': (np.float64, 0.0),
+    'environmental_concern': (np.float64, 0.0),
+    'consumption': (np.float64, 0.0),
+
+    # Identity attributes
+    'ethnicity': (np.uint8, 0),
+    'religion': (np.uint8, 0),
+    'region_type': (np.uint8, 0),
+
+    # Social interaction factors
+    'social_mobility': (np.float64, 0.0),
+    'community_involvement': (np.float64, 0.0),
+    'political_engagement': (np.float64, 0.0),
+    'trust_in_government': (np.float64, 50.0),
+    'satisfaction_level': (np.float64, 50.0),
+}
+
+# Per-citizen containers that are rarely populated; kept in a sparse side table
+# instead of a column and created on first access.
+LAZY_ATTRIBUTES = {
+    'media_usage': dict,
+    'leisure_activities': list,
+}
+
+def _allocate_local(name: str, dtype, capacity: int) -> np.ndarray:
+    return np.empty(capacity, dtype=dtype)
+
+class PopulationStore:
+    """
+    Array-backed storage for citizens: one contiguous NumPy column per attribute.
+
+    Rows are addressed by slot index. Hot paths read and write whole columns
+    through `column()` or stream them through kernels with `for_each_chunk()`;
+    code that needs a Citizen object gets a CitizenView proxy onto a row via
+    `view()`.
+
+    Listeners (e.g. PopulationAggregates) are notified of every add, remove,
+    row move, single-value write and batch column update. Code that writes
+    columns directly must call `mark_updated()` afterwards.
+
+    Column memory comes from `allocator(name, dtype, capacity)`, np.empty by
+    default; sharding.ShardedExecutor swaps in shared memory via `rehome()` and
+    population_file.MappedColumnAllocator keeps columns in memory-mapped files.
+    An allocator with `grows_in_place = True` returns a larger column that
+    already holds the old rows.
+    """
+    def __init__(self, capacity: int = 0, allocator: Optional[Callable[..., np.ndarray]] = None):
+        self.size = 0
+        self.capacity = capacity
+        self.allocator = allocator or _allocate_local
+        self.columns: Dict[str, np.ndarray] = {
+            name: self.allocator(name, dtype, capacity) for name, (dtype, _) in CITIZEN_COLUMNS.items()
+        }
+        self.extras: Dict[int, Dict[str, object]] = {}  # Slot -> attributes without a column
+        self.listeners: List = []
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getstate__(self) -> Dict[str, object]:
+        # The allocator may be bound to this process (shared memory or mapped
+        # files), so it is not saved. __setstate__ gives the restored store the
+        # in-memory allocator and takes its capacity from the shortest column.
+        state = dict(vars(self))
+        state['allocator'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        vars(self).update(state)
+        self.allocator = _allocate_local
+        self.capacity = min((len(column) for column in self.columns.values()), default=0)
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a writable view of the live part of a column"""
+        return self.columns[name][:self.size]
+
+    def mean(self, name: str) -> float:
+        return float(self.column(name).mean()) if self.size else 0.0
+
+    def add_listener(self, listener) -> None:
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        self.listeners.remove(listener)
+
+    def mark_updated(self, names: Iterable[str], totals: Optional[Dict[str, object]] = None) -> None:
+        """
+        Tell listeners that whole columns were rewritten by a batch kernel
+
+        Args:
+            names: Columns that changed
+            totals: Already-reduced aggregates of the new values (see
+                PopulationAggregates.shard_totals), so listeners can skip a full pass
+        """
+        names = tuple(names)
+        for listener in self.listeners:
+            listener.on_columns_updated(self, names, totals)
+
+    def for_each_chunk(self, kernels: Iterable[ColumnKernel], chunk_size: Optional[int] = None) -> None:
+        """
+        Stream the population through `kernels` in one pass of fixed-size row slices.
+
+        Each chunk runs every kernel in order, then yields the partial
+        aggregates of the written columns, so listeners are told once at the
+        end without a further pass over the columns.
+
+        Args:
+            kernels: Steps to run on every chunk (see kernels.py)
+            chunk_size: Rows per chunk; defaults to the shard size of the kernels'
+                ShardedStreams (which it must equal), else RNG_SHARD_SIZE
+        """
+        kernels = list(kernels)
+        if chunk_size is None:
+            sharded = [kernel.rng for kernel in kernels if isinstance(kernel.rng, ShardedStream)]
+            chunk_size = sharded[0].rng.shard_size if sharded else RNG_SHARD_SIZE
+        names, updated = sweep_columns(kernels)
+        columns = {name: self.column(name) for name in names}
+        starts = range(0, self.size, chunk_size)
+        draws = [chunk_generators(kernel.rng, len(starts), chunk_size) for kernel in kernels]
+        partials = []
+        for chunk, start in enumerate(starts):
+            rows = {name: column[start:start + chunk_size] for name, column in columns.items()}
+            for kernel, generators in zip(kernels, draws):
+                kernel.run(rows, generators[chunk])
+            partials.append(PopulationAggregates.shard_totals({name: rows[name] for name in updated}))
+        self.mark_updated(updated, PopulationAggregates.combine_totals(partials))
+
+    def rehome(self, allocator: Optional[Callable[..., np.ndarray]] = None) -> None:
+        """Move every column into memory from `allocator` (np.empty if None)"""
+        self.allocator = allocator or _allocate_local
+        for name, column in self.columns.items():
+            moved = self.allocator(name, column.dtype, self.capacity)
+            moved[:self.size] = column[:self.size]
+            self.columns[name] = moved
+
+    def _reserve(self, additional: int) -> None:
+        """Grow column capacity (amortized doubling) to fit `additional` more rows"""
+        needed = self.size + additional
+        if needed <= self.capacity:
+            return
+        new_capacity = max(needed, self.capacity * 2, 1024)
+        in_place = getattr(self.allocator, 'grows_in_place', False)
+        for name, column in self.columns.items():
+            grown = self.allocator(name, column.dtype, new_capacity)
+            if not in_place:
+                grown[:self.size] = column[:self.size]
+            self.columns[name] = grown
+        self.capacity = new_capacity
+
+    def append_rows(self, count: int, values: Optional[Dict[str, object]] = None) -> np.ndarray:
+        """
+        Append `count` rows in one block.
+
+        Args:
+            count: Number of rows to add
+            values: Column name -> array of length `count` (or scalar); missing
+                columns get their schema default and ids are assigned if absent
+
+        Returns:
+            np.ndarray: Slot indices of the new rows
+        """
+        values = values or {}
+        self._reserve(count)
+        start, stop = self.size, self.size + count
+        for name, (_, default) in CITIZEN_COLUMNS.items():
+            self.columns[name][start:stop] = values.get(name, default)
+        if 'id' not in values:
+            self.columns['id'][start:stop] = np.arange(self._next_id, self._next_id + count)
+            self._next_id += count
+        elif count:
+            self._next_id = max(self._next_id, int(self.columns['id'][start:stop].max()) + 1)
+        self.size = stop
+        slots = np.arange(start, stop)
+        for listener in self.listeners:
+            listener.on_rows_added(self, slots)
+        return slots
+
+    def add_random(self, count: int, rng: np.random.Generator, age: Optional[float] = None,
+                   overrides: Optional[Dict[str, object]] = None) -> np.ndarray:
+        """
+        Add `count` citizens with the same attribute distributions as Citizen.__init__
+
+        Args:
+            count: Number of citizens to add
+            rng: Generator for the attribute draws
+            age: Fixed age for every new citizen (e.g. 0 for births); random if None
+            overrides: Column name -> values replacing the random draws (e.g. citizens sampled from cohorts)
+        """
+        values = {
+            'age': rng.integers(0, 91, count).astype(np.float64) if age is None else float(age),
+            'sex': rng.integers(0, 2, count, dtype=np.uint8),
+            'region': rng.integers(0, 10, count, dtype=np.uint8),
+            'income': rng.uniform(1000, 5000, count),
+            'wealth': rng.uniform(5000, 50000, count),
+            'political_leaning': rng.uniform(-1, 1, count),
+            'political_ideology': rng.uniform(-1, 1, count),
+            'ethnicity': rng.integers(0, len(Ethnicity), count, dtype=np.uint8),
+            'religion': rng.integers(0, len(Religion), count, dtype=np.uint8),
+            'region_type': rng.integers(0, len(RegionType), count, dtype=np.uint8),
+            'happiness': rng.uniform(40, 80, count),
+            'trust_in_institutions': rng.uniform(30, 70, count),
+            'socioeconomic_rating': rng.uniform(20, 80, count),
+            'social_mobility': rng.uniform(0, 1, count),
+            'community_involvement': rng.uniform(0, 1, count),
+            'political_engagement': rng.uniform(0, 1, count),
+            'trust_in_government': rng.uniform(30, 70, count),
+            'satisfaction_level': rng.uniform(40, 60, count),
+            'education_level': rng.uniform(0, 100, count),
+        }
+        values.update(overrides or {})
+        return self.append_rows(count, values)
+
+    def add_citizen(self, citizen: Citizen) -> int:
+        """Copy a standalone Citizen (or a view from another store) into a new row"""
+        return int(self.add_citizens([citizen])[0])
+
+    def add_citizens(self, citizens: List[Citizen]) -> np.ndarray:
+        count = len(citizens)
+        values = {}
+        for name, (dtype, _) in CITIZEN_COLUMNS.items():
+            attributes = [getattr(citizen, name) for citizen in citizens]
+            if name in CATEGORIES:
+                values[name] = CATEGORIES[name].encode_many(attributes)
+            else:
+                values[name] = np.array(attributes, dtype=dtype).reshape(count)
+        slots = self.append_rows(count, values)
+        for slot, citizen in zip(slots, citizens):
+            extras = _citizen_extras(citizen)
+            if extras:
+                self.extras[int(slot)] = extras
+        return slots
+
+    @classmethod
+    def from_citizens(cls, citizens: Iterable[Citizen]) -> 'PopulationStore':
+        citizens = list(citizens)
+        store = cls(capacity=len(citizens))
+        store.add_citizens(citizens)
+        return store
+
+    def remove_last(self, count: int) -> None:
+        """Remove the `count` most recently added rows"""
+        count = min(count, self.size)
+        removed = np.arange(self.size - count, self.size)
+        for listener in self.listeners:
+            listener.on_rows_removed(self, removed)
+        for slot in removed:
+            self.extras.pop(slot, None)
+        self.size -= count
+
+    def remove(self, slots: np.ndarray) -> None:
+        """Remove arbitrary rows, compacting the remaining ones in order"""
+        keep = np.ones(self.size, dtype=bool)
+        keep[slots] = False
+        for listener in self.listeners:
+            listener.on_rows_removed(self, np.flatnonzero(~keep))
+        new_size = int(keep.sum())
+        for name, column in self.columns.items():
+            column[:new_size] = column[:self.size][keep]
+        new_slots = np.cumsum(keep) - 1
+        self.extras = {int(new_slots[slot]): extras for slot, extras in self.extras.items() if keep[slot]}
+        self.size = new_size
+        moved = np.flatnonzero(keep & (new_slots != np.arange(len(keep))))
+        self._notify_moved(moved, new_slots[moved])
+
+    def release(self, slots: np.ndarray) -> None:
+        """
+        Remove arbitrary rows in O(len(slots)) without preserving order.
+
+        Vacated slots below the new end are refilled with rows moved in from
+        the tail, so the live rows stay contiguous and the freed tail capacity
+        is reused by the next append.
+        """
+        slots = np.unique(slots)
+        if not len(slots):
+            return
+        for listener in self.listeners:
+            listener.on_rows_removed(self, slots)
+        new_size = self.size - len(slots)
+        holes = slots[slots < new_size]
+        tail = np.arange(new_size, self.size)
+        sources = tail[~np.isin(tail, slots, assume_unique=True)]
+        for column in self.columns.values():
+            column[holes] = column[sources]
+        for slot in slots:
+            self.extras.pop(int(slot), None)
+        for source, hole in zip(sources, holes):
+            if int(source) in self.extras:
+                self.extras[int(hole)] = self.extras.pop(int(source))
+        self.size = new_size
+        self._notify_moved(sources, holes)
+
+    def _notify_moved(self, sources: np.ndarray, targets: np.ndarray) -> None:
+        if not len(sources):
+            return
+        for listener in self.listeners:
+            listener.on_rows_moved(self, sources, targets)
+
+    def decoded(self, name: str) -> np.ndarray:
+        """Values of a categorical column as an object array (a copy)"""
+        return CATEGORIES[name].decode_many(self.column(name))
+
+    def get(self, name: str, slot: int):
+        value = self.columns[name][slot]
+        if name in CATEGORIES:
+            return CATEGORIES[name].decode(value)
+        return value.item() if isinstance(value, np.generic) else value
+
+    def set(self, name: str, slot: int, value) -> None:
+        """Write one value; listeners see categorical values as codes"""
+        if name in CATEGORIES:
+            value = CATEGORIES[name].encode(value)
+        column = self.columns[name]
+        if not self.listeners:
+            column[slot] = value
+            return
+        old = column[slot]
+        column[slot] = value
+        for listener in self.listeners:
+            listener.on_value_updated(self, name, slot, old, column[slot])
+
+    def view(self, slot: int) -> 'CitizenView':
+        return CitizenView(self, int(slot))
+
+    def views(self, slots: Iterable[int]) -> List['CitizenView']:
+        return [CitizenView(self, int(slot)) for slot in slots]
+
+# Age bands used by the generational tension metric: young < 30 <= middle < 60 <= elderly
+AGE_BAND_EDGES = (30, 60)
+AGE_BANDS = ('young', 'middle', 'elderly')
+
+class PopulationAggregates:
+    """
+    Running population aggregates kept up to date by a PopulationStore.
+
+    Maintains column sums (for averages), the row count, categorical
+    histograms and age-band counts so that satisfaction and tension metrics
+    are O(1) reads. Adds, removes and single-value writes are applied as
+    deltas; batch column updates refresh the affected aggregates from the
+    column that was just rewritten. Histograms are bincounts indexed by
+    category code.
+    """
+    SUM_COLUMNS = ('happiness', 'trust_in_institutions', 'socioeconomic_rating',
+                   'trust_in_government', 'satisfaction_level')
+    CATEGORY_COLUMNS = ('ethnicity', 'religion', 'region')
+
+    def __init__(self, store: PopulationStore):
+        self.store = store
+        self.count = 0
+        self.sums: Dict[str, float] = {}
+        self.histograms: Dict[str, np.ndarray] = {}
+        self.age_bands: Dict[str, int] = {}
+        self.recompute()
+        store.add_listener(self)
+
+    def detach(self) -> None:
+        self.store.remove_listener(self)
+
+    def mean(self, name: str) -> float:
+        return self.sums[name] / self.count if self.count else 0.0
+
+    def recompute(self) -> None:
+        """Rebuild every aggregate with a full pass over the store"""
+        self.count = len(self.store)
+        self.sums = {name: float(self.store.column(name).sum()) for name in self.SUM_COLUMNS}
+        self.histograms = {name: self._count_codes(self.store.column(name)) for name in self.CATEGORY_COLUMNS}
+        self.age_bands = self._count_age_bands(self.store.column('age'))
+
+    def verify(self, rtol: float = 1e-9) -> None:
+        """Check the running aggregates against a full recompute (debug mode)"""
+        expected = PopulationAggregates.__new__(PopulationAggregates)
+        expected.store = self.store
+        expected.recompute()
+        mismatches = []
+        if expected.count != self.count:
+            mismatches.append(f"count: {self.count} != {expected.count}")
+        for name, value in expected.sums.items():
+            if not np.isclose(self.sums[name], value, rtol=rtol, atol=1e-6):
+                mismatches.append(f"sum of {name}: {self.sums[name]} != {value}")
+        for name, histogram in expected.histograms.items():
+            if not np.array_equal(self.histograms[name], histogram):
+                mismatches.append(f"histogram of {name} differs")
+        if expected.age_bands != self.age_bands:
+            mismatches.append(f"age bands: {self.age_bands} != {expected.age_bands}")
+        if mismatches:
+            raise RuntimeError("Population aggregates out of sync: " + "; ".join(mismatches))
+
+    # Full-column counts run in slices of this many rows, bounding the index
+    # temporaries (8 bytes per row) for very large or file-backed stores
+    CHUNK_ROWS = 1 << 20
+
+    @classmethod
+    def _count_codes(cls, codes: np.ndarray) -> np.ndarray:
+        counts = np.zeros(256, dtype=np.int64)
+        for start in range(0, len(codes), cls.CHUNK_ROWS):
+            counts += np.bincount(codes[start:start + cls.CHUNK_ROWS], minlength=256)
+        return counts
+
+    @classmethod
+    def _count_age_bands(cls, ages: np.ndarray) -> Dict[str, int]:
+        counts = np.zeros(len(AGE_BANDS), dtype=np.int64)
+        for start in range(0, len(ages), cls.CHUNK_ROWS):
+            bands = np.searchsorted(AGE_BAND_EDGES, ages[start:start + cls.CHUNK_ROWS], side='right')
+            counts += np.bincount(bands, minlength=len(AGE_BANDS))
+        return dict(zip(AGE_BANDS, (int(count) for count in counts)))
+
+    def _apply_rows(self, store: PopulationStore, slots: np.ndarray, sign: int) -> None:
+        self.count += sign * len(slots)
+        for name in self.SUM_COLUMNS:
+            self.sums[name] += sign * float(store.columns[name][slots].sum())
+        for name in self.CATEGORY_COLUMNS:
+            self.histograms[name] += sign * self._count_codes(store.columns[name][slots])
+        for band, count in self._count_age_bands(store.columns['age'][slots]).items():
+            self.age_bands[band] += sign * count
+
+    # Store listener interface
+    def on_rows_added(self, store: PopulationStore, slots: np.ndarray) -> None:
+        self._apply_rows(store, slots, 1)
+
+    def on_rows_removed(self, store: PopulationStore, slots: np.ndarray) -> None:
+        self._apply_rows(store, slots, -1)
+
+    def on_columns_updated(self, store: PopulationStore, names, totals=None) -> None:
+        totals = totals or {}
+        for name in names:
+            if name in self.sums:
+                self.sums[name] = totals[name] if name in totals else float(store.column(name).sum())
+            elif name in self.histograms:
+                self.histograms[name] = self._count_codes(store.column(name))
+            elif name == 'age':
+                self.age_bands = dict(totals['age']) if 'age' in totals else self._count_age_bands(store.column('age'))
+
+    @classmethod
+    def shard_totals(cls, columns: Dict[str, np.ndarray]) -> Dict[str, object]:
+        """
+        Partial aggregates over one shard of rows, for `mark_updated(totals=...)`.
+
+        Returns sums for the summed columns and age-band counts for 'age'
+        among `columns`; combine shards with `combine_totals`.
+        """
+        totals = {name: float(column.sum()) for name, column in columns.items() if name in cls.SUM_COLUMNS}
+        if 'age' in columns:
+            totals['age'] = cls._count_age_bands(columns['age'])
+        return totals
+
+    @staticmethod
+    def combine_totals(partials: Iterable[Dict[str, object]]) -> Dict[str, object]:
+        """Add up shard_totals results (in the given order, so the result is deterministic)"""
+        combined: Dict[str, object] = {}
+        for partial in partials:
+            for name, value in partial.items():
+                if isinstance(value, dict):
+                    bands = combined.setdefault(name, dict.fromkeys(value, 0))
+                    for band, count in value.items():
+                        bands[band] += count
+                else:
+                    combined[name] = combined.get(name, 0.0) + value
+        return combined
+
+    def on_rows_moved(self, store: PopulationStore, sources: np.ndarray, targets: np.ndarray) -> None:
+        pass  # Aggregates do not depend on slot positions
+
+    def on_value_updated(self, store: PopulationStore, name: str, slot: int, old, new) -> None:
+        if name in self.sums:
+            self.sums[name] += float(new) - float(old)
+        elif name in self.histograms:
+            self.histograms[name][old] -= 1
+            self.histograms[name][new] += 1
+        elif name == 'age':
+            old_band, new_band = np.searchsorted(AGE_BAND_EDGES, [old, new], side='right')
+            self.age_bands[AGE_BANDS[old_band]] -= 1
+            self.age_bands[AGE_BANDS[new_band]] += 1
+
+class VoterRoll:
+    """
+    Eligibility index over a PopulationStore: citizens (by status) aged
+    MIN_LEGAL_VOTING_AGE or older.
+
+    Kept as a bitmap updated from store notifications. Citizens still too young
+    to vote are tracked separately, so the monthly ageing pass only re-checks
+    them. The sorted slot list is materialized on first use and then patched
+    with each change, so a referendum gets its voters in O(eligible).
+    """
+    def __init__(self, store: PopulationStore):
+        self.store = store
+        self.rebuild()
+        store.add_listener(self)
+
+    def detach(self) -> None:
+        self.store.remove_listener(self)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def rebuild(self) -> None:
+        """Recompute the index from the store columns"""
+        store = self.store
+        self.eligible = np.zeros(store.capacity, dtype=bool)
+        citizens = store.column('citizenship_status') == CITIZEN_CODE
+        adults = store.column('age') >= MIN_LEGAL_VOTING_AGE
+        self.eligible[:store.size] = citizens & adults
+        self.count = int(self.eligible.sum())
+        self._minors = np.flatnonzero(citizens & ~adults)  # Citizens who will age into the roll
+        self._slots: Optional[np.ndarray] = None
+
+    def slots(self) -> np.ndarray:
+        """Sorted store slots of everyone with voting rights"""
+        if self._slots is None:
+            self._slots = np.flatnonzero(self.eligible[:self.store.size])
+        return self._slots
+
+    def _enroll(self, slots: np.ndarray) -> None:
+        if not len(slots):
+            return
+        self.eligible[slots] = True
+        self.count += len(slots)
+        if self._slots is not None:
+            slots = np.sort(slots)
+            self._slots = np.insert(self._slots, np.searchsorted(self._slots, slots), slots)
+
+    def _strike(self, slots: np.ndarray) -> None:
+        slots = slots[self.eligible[slots]]
+        if not len(slots):
+            return
+        self.eligible[slots] = False
+        self.count -= len(slots)
+        if self._slots is not None:
+            self._slots = np.delete(self._slots, np.searchsorted(self._slots, slots))
+
+    def _fits(self, store: PopulationStore) -> None:
+        if len(self.eligible) < store.capacity:
+            self.eligible = np.concatenate([self.eligible, np.zeros(store.capacity - len(self.eligible), dtype=bool)])
+
+    # Store listener interface
+    def on_rows_added(self, store: PopulationStore, slots: np.ndarray) -> None:
+        self._fits(store)
+        citizens = store.columns['citizenship_status'][slots] == CITIZEN_CODE
+        adults = store.columns['age'][slots] >= MIN_LEGAL_VOTING_AGE
+        self._enroll(slots[citizens & adults])
+        self._minors = np.concatenate([self._minors, slots[citizens & ~adults]])
+
+    def on_rows_removed(self, store: PopulationStore, slots: np.ndarray) -> None:
+        self._strike(slots)
+        self._minors = self._minors[~np.isin(self._minors, slots)]
+
+    def on_rows_moved(self, store: PopulationStore, sources: np.ndarray, targets: np.ndarray) -> None:
+        moving = self.eligible[sources]
+        self.eligible[sources] = False
+        self.eligible[targets[moving]] = True
+        if self._slots is not None:
+            kept = np.delete(self._slots, np.searchsorted(self._slots, sources[moving]))
+            arriving = np.sort(targets[moving])
+            self._slots = np.insert(kept, np.searchsorted(kept, arriving), arriving)
+        if len(self._minors):
+            order = np.argsort(sources)
+            position = np.minimum(np.searchsorted(sources, self._minors, sorter=order), len(sources) - 1)
+            hit = sources[order[position]] == self._minors
+            self._minors[hit] = targets[order[position[hit]]]
+
+    def on_columns_updated(self, store: PopulationStore, names, totals=None) -> None:
+        if 'citizenship_status' in names:
+            self.rebuild()
+        elif 'age' in names and len(self._minors):
+            came_of_age = store.columns['age'][self._minors] >= MIN_LEGAL_VOTING_AGE
+            self._enroll(self._minors[came_of_age])
+            self._minors = self._minors[~came_of_age]
+
+    def on_value_updated(self, store: PopulationStore, name: str, slot: int, old, new) -> None:
+        if name not in ('age', 'citizenship_status'):
+            return
+        slots = np.array([slot])
+        self._strike(slots)
+        self._minors = self._minors[self._minors != slot]
+        if store.columns['citizenship_status'][slot] == CITIZEN_CODE:
+            if store.columns['age'][slot] >= MIN_LEGAL_VOTING_AGE:
+                self._enroll(slots)
+            else:
+                self._minors = np.append(self._minors, slot)
+
+@dataclass(frozen=True)
+class DemographicSnapshot:
+    """Demographic counts behind the social tension metrics, taken at one point in time"""
+    population: int
+    ethnic_groups: int       # Distinct ethnicities present
+    religious_groups: int    # Distinct religions present
+    age_bands: Dict[str, int]
+    urban_count: int         # Citizens whose region is labelled 'Urban...'
+
+    @classmethod
+    def from_aggregates(cls, aggregates: PopulationAggregates) -> 'DemographicSnapshot':
+        """Build the snapshot from running histograms, without a pass over citizens"""
+        return cls(
+            population=aggregates.count,
+            ethnic_groups=int(np.count_nonzero(aggregates.histograms['ethnicity'])),
+            religious_groups=int(np.count_nonzero(aggregates.histograms['religion'])),
+            age_bands=dict(aggregates.age_bands),
+            urban_count=sum(int(aggregates.histograms['region'][code])
+                            for code, region in enumerate(CATEGORIES['region'].values)
+                            if str(region).startswith('Urban')),
+        )
+
+def _citizen_extras(citizen: Citizen) -> Dict[str, object]:
+    """Collect the non-column attributes of a citizen worth carrying over"""
+    if isinstance(citizen, CitizenView):
+        return dict(citizen._store.extras.get(citizen._slot, {}))
+    return {
+        name: getattr(citizen, name) for name in Citizen.__slots__
+        if name not in CITIZEN_COLUMNS and name != 'electronic_signature' and hasattr(citizen, name)
+        and not (name in LAZY_ATTRIBUTES and not getattr(citizen, name))
+    }
+
+class CitizenView(Citizen):
+    """
+    Lightweight proxy onto one row of a PopulationStore.
+
+    Attribute reads and writes go straight to the store columns, so Citizen
+    methods like update() and decide_referendum_vote() work unchanged.
+    """
+    __slots__ = ('_store', '_slot')
+
+    def __init__(self, store: PopulationStore, slot: int):
+        object.__setattr__(self, '_store', store)
+        object.__setattr__(self, '_slot', slot)
+
+    @property
+    def electronic_signature(self) -> str:
+        return f"sig_{self.id}"
+
+    def __getattr__(self, name: str):
+        # Only reached for attributes that have no column
+        if name.startswith('_'):
+            raise AttributeError(name)
+        extras = self._store.extras.get(self._slot, {})
+        if name in extras:
+            return extras[name]
+        if name in LAZY_ATTRIBUTES:
+            value = LAZY_ATTRIBUTES[name]()
+            self._store.extras.setdefault(self._slot, {})[name] = value
+            return value
+        raise AttributeError(f"'Citizen' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value) -> None:
+        if isinstance(getattr(type(self), name, None), property):
+            object.__setattr__(self, name, value)
+        else:
+            self._store.extras.setdefault(self._slot, {})[name] = value
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CitizenView) and other._store is self._store and other._slot == self._slot
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._slot))
+
+    def __repr__(self) -> str:
+        return f"CitizenView(id={self.id}, slot={self._slot})"
+
+def _column_property(name: str) -> property:
+    def fget(self):
+        return self._store.get(name, self._slot)
+
+    def fset(self, value):
+        self._store.set(name, self._slot, value)
+
+    return property(fget, fset)
+
+for _name in CITIZEN_COLUMNS:
+    setattr(CitizenView, _name, _column_property(_name))
+
+class CitizenSequence(Sequence):
+    """Read-only sequence of CitizenView proxies over a store, built lazily"""
+    def __init__(self, store: PopulationStore):
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._store.views(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("citizen index out of range")
+        return self._store.view(index)
+
+    def __iter__(self):
+        store = self._store
+        for slot in range(len(store)):
+            yield CitizenView(store, slot)
@@ -0,0 +1,118 @@
+"""
+File-backed population columns.
+
+A population file is a directory holding one raw column file per
+PopulationStore column (`<name>.col`, `capacity` rows) plus:
+
+    manifest.json   format and version, live size, capacity and column dtypes
+    state.pickle    next citizen id, sparse per-citizen extras and the
+                    category code tables
+
+Columns are np.memmap arrays over the column files, so a population can be
+larger than physical memory. The kernel pages rows in as the shard-by-shard
+update kernels reach them and writes dirty pages back on its own. Growing
+the store extends the files in place (they are sparse until written).
+
+Only sync() writes the size and metadata. The column files change as
+the run writes them, so sync() before the process exits for a consistent
+restart; SocietySystem syncs after creating its population and
+Simulation.cleanup() syncs at the end of a run. open_population() maps
+the files again without reading them up front.
+"""
+import json
+import os
+import pickle
+from typing import Dict
+import numpy as np
+
+from .population import PopulationStore, category_state, restore_categories, _allocate_local
+
+FORMAT = 'technocratia-population'
+VERSION = 1
+
+class MappedColumnAllocator:
+    """PopulationStore allocator that backs each column with a memory-mapped file in `directory`"""
+    grows_in_place = True  # Reallocating a column keeps its leading rows; the store skips the copy
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.col")
+
+    def __call__(self, name: str, dtype, capacity: int) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        if not capacity:
+            return np.empty(0, dtype=dtype)
+        path = self.path(name)
+        size = capacity * dtype.itemsize
+        with open(path, 'ab') as handle:  # Creates the file; never truncates existing rows
+            if handle.tell() < size:
+                handle.truncate(size)
+        return np.memmap(path, dtype=dtype, mode='r+', shape=(capacity,))
+
+    def sync(self, store: PopulationStore) -> None:
+        """Write dirty column pages and the store metadata, making the current state reopenable"""
+        for column in store.columns.values():
+            if isinstance(column, np.memmap):
+                column.flush()
+        state = {'next_id': store._next_id, 'extras': store.extras, 'categories': category_state()}
+        self._replace('state.pickle', pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        manifest = {
+            'format': FORMAT,
+            'version': VERSION,
+            'size': store.size,
+            'capacity': store.capacity,
+            'columns': {name: column.dtype.str for name, column in store.columns.items()},
+        }
+        self._replace('manifest.json', json.dumps(manifest, indent=2).encode())
+
+    def _replace(self, filename: str, data: bytes) -> None:
+        staging = os.path.join(self.directory, f"{filename}.tmp")
+        with open(staging, 'wb') as handle:
+            handle.write(data)
+        os.replace(staging, os.path.join(self.directory, filename))
+
+def make_private(store: PopulationStore) -> None:
+    """
+    Remap a file-backed store copy-on-write, e.g. in a forked scenario branch:
+    its later writes stay in this process and never reach the files. Growing
+    the store then moves it into ordinary memory.
+    """
+    allocator = store.allocator
+    if not isinstance(allocator, MappedColumnAllocator):
+        return
+    for name, column in store.columns.items():
+        if len(column):
+            store.columns[name] = np.memmap(allocator.path(name), dtype=column.dtype, mode='c', shape=(len(column),))
+    store.allocator = _allocate_local
+
+def has_population(directory: str) -> bool:
+    """Whether `directory` holds a synced population file"""
+    return os.path.exists(os.path.join(directory, 'manifest.json'))
+
+def create_population(directory: str, capacity: int = 0) -> PopulationStore:
+    """Empty store whose columns live in `directory` (existing column files are reused as scratch space)"""
+    return PopulationStore(capacity=capacity, allocator=MappedColumnAllocator(directory))
+
+def open_population(directory: str) -> PopulationStore:
+    """Map the population last synced to `directory` back into a store"""
+    with open(os.path.join(directory, 'manifest.json')) as handle:
+        manifest = json.load(handle)
+    if manifest.get('format') != FORMAT:
+        raise ValueError(f"{directory} is not a population file")
+    if manifest['version'] > VERSION:
+        raise ValueError(f"Population file version {manifest['version']} is newer than supported ({VERSION})")
+    with open(os.path.join(directory, 'state.pickle'), 'rb') as handle:
+        state: Dict[str, object] = pickle.load(handle)
+
+    restore_categories(state['categories'])
+    store = create_population(directory, manifest['capacity'])
+    for name, column in store.columns.items():
+        if column.dtype.str != manifest['columns'].get(name):
+            raise ValueError(f"Population file column '{name}' is {manifest['columns'].get(name)}, expected {column.dtype.str}")
+    store.size = manifest['size']
+    store._next_id = state['next_id']
+    store.extras = state['extras']
+    return store
@@ -1,6 +1,6 @@
 import random
 from enum import Enum
-from datetime import datetime, timedelta
+from .clock import SimulationClock, current_clock
 from typing import List, Optional
 
 from .citizen import *
@@ -8,16 +8,17 @@ from .legislative import *
 from .referendum import *
 
 class President:
-    def __init__(self, name):
+    def __init__(self, name, clock: Optional[SimulationClock] = None):
         self.name = name
-        self.term_start_date = datetime.now()
-        self.term_end_date = self.term_start_date + timedelta(days=5*365)  # 5 years term
+        self.clock = clock or current_clock()
+        self.term_start_date = self.clock.today()  # Simulated days
+        self.term_end_date = self.term_start_date + SimulationClock.days(years=5)  # 5 years term
         self.referendum_system = ReferendumSystem(Parliament) #TODO: will fail, current parlament ??
         self.vetoed_laws = []
         self.sent_to_referendum = []
 
     def is_term_expired(self) -> bool:
-        return datetime.now() > self.term_end_date
+        return self.clock.today() > self.term_end_date
 
     def propose_dismissal(self, parliamentarian, dismissal_reason: str) -> bool:
         """
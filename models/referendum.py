@@ -1,8 +1,8 @@
 from enum import Enum
-from datetime import datetime
-from typing import List, Dict, Optional, TYPE_CHECKING
+from typing import List, Dict, Optional, Tuple, Union, TYPE_CHECKING
 import random
 import uuid
+import numpy as np
 
 #from .citizen import *
 #from .legislative import Parliament
@@ -10,6 +10,9 @@ import uuid
 import importlib
 citizen = importlib.import_module(".citizen", package=__package__)
 legislative = importlib.import_module(".legislative", package=__package__)
+from .political_party import IdeologyScore
+from .rng import ShardedStream, batch_generator, shard_draws
+from .clock import SimulationClock, current_clock
 
 # if TYPE_CHECKING:
 #     from .citizen import Citizen
@@ -39,11 +42,12 @@ class Referendum:
         self.total_votes: int = 0
         self.quorum: int = 0
         self.min_votes: int = 0
-        self.start_date: Optional[datetime] = None
-        self.end_date: Optional[datetime] = None
+        self.start_date: Optional[int] = None  # Simulated days
+        self.end_date: Optional[int] = None
         self.documentation: str = ""
         self.summary: str = ""
         self.blockchain_hash: str = ""
+        self.audited_ballots: Dict[int, bool] = {}  # Citizen id -> vote in favour, for voters sampled for audit
         
         # Add impact areas with default False
         self.affects_economic: bool = False
@@ -87,8 +91,14 @@ class ExpertOrganization:
         self.delegated_votes: int = 0
 
 class ReferendumSystem:
-    def __init__(self, parliament):
+    # Citizen columns needed by cast_bulk
+    VOTER_COLUMNS = ('political_ideology', 'education_level', 'economic_satisfaction', 'social_satisfaction')
+
+    def __init__(self, parliament, rng: Optional[Union[np.random.Generator, ShardedStream]] = None,
+                 clock: Optional[SimulationClock] = None):
         self.parliament = parliament
+        self.clock = clock or current_clock()
+        self.np_rng = rng if rng is not None else np.random.default_rng()  # Used by the bulk voting paths
         self.referendums: List[Referendum] = []
         self.expert_organizations: List[ExpertOrganization] = []
         self.participation_points: Dict[int, int] = {}  # Citizen ID to points
@@ -104,7 +114,7 @@ class ReferendumSystem:
     def start_referendum(self, referendum: Referendum) -> bool:
         if referendum.status == ReferendumStatus.PROPOSED:
             referendum.status = ReferendumStatus.ACTIVE
-            referendum.start_date = datetime.now()
+            referendum.start_date = self.clock.today()
             referendum.quorum = int(self.parliament.total_seats * self.quorum_percentage)
             referendum.min_votes = int(self.parliament.total_seats * self.min_votes_percentage)
             return True
@@ -123,6 +133,125 @@ class ReferendumSystem:
             
         return True
 
+    def cast_bulk(self, referendum: Referendum, population_columns: Dict[str, np.ndarray],
+                  media_coverage: Dict, party_positions: Dict,
+                  return_ballots: bool = False) -> Union[Tuple[int, int], Tuple[int, int, np.ndarray]]:
+        """
+        Decide and record the votes of many citizens at once.
+
+        Vectorized equivalent of calling Citizen.decide_referendum_vote and
+        vote() for every voter: party alignment, media sway and the random
+        draw are computed for all voters in a few array operations.
+
+        Args:
+            referendum: The referendum being voted on
+            population_columns: Column name -> array over eligible voters, see VOTER_COLUMNS
+            media_coverage: Output of MediaLandscape.get_referendum_coverage
+            party_positions: Output of PoliticalSystem.get_party_positions
+            return_ballots: Also return the per-voter choices for auditing
+
+        Returns:
+            (votes_for, votes_against), plus a boolean ballot array if return_ballots
+        """
+        n = len(population_columns['political_ideology'])
+        ballots = np.zeros(n, dtype=bool)
+        party_terms = self.party_terms(party_positions)
+        media_influence = media_coverage.get('support_ratio', 0.5) - 0.5
+        for rows, rng in shard_draws(self.np_rng, n):
+            shard = {name: column[rows] for name, column in population_columns.items()}
+            ballots[rows] = self.decide_columns(shard, rng, party_terms, media_influence,
+                                                referendum.affects_economic, referendum.affects_social)
+
+        votes_for = int(ballots.sum())
+        votes_against = n - votes_for
+        if not self.record_bulk(referendum, votes_for, votes_against):
+            votes_for = votes_against = 0
+        return (votes_for, votes_against, ballots) if return_ballots else (votes_for, votes_against)
+
+    @staticmethod
+    def party_terms(party_positions: Dict) -> List[Tuple[float, bool]]:
+        """(ideology score, supports) per party, in position order"""
+        return [(IdeologyScore.get_score(party.ideology), bool(position)) for party, position in party_positions.items()]
+
+    @staticmethod
+    def decide_columns(columns: Dict[str, np.ndarray], rng: np.random.Generator,
+                       party_terms: List[Tuple[float, bool]], media_influence: float,
+                       affects_economic: bool, affects_social: bool) -> np.ndarray:
+        """
+        Ballots for one batch of voters (the per-voter logic of cast_bulk).
+
+        Args:
+            columns: Column name -> array over the voters, see VOTER_COLUMNS
+            rng: Generator for the undecided voters' draws
+            party_terms: Output of party_terms()
+            media_influence: Media support ratio minus 0.5
+            affects_economic: Referendum.affects_economic
+            affects_social: Referendum.affects_social
+
+        Returns:
+            np.ndarray: True for a vote in favour
+        """
+        ideology = columns['political_ideology']
+        ballots = np.zeros(len(ideology), dtype=bool)
+        undecided = np.ones(len(ideology), dtype=bool)
+
+        # Voters follow the first ideologically aligned party, in position order
+        for score, supports in party_terms:
+            aligned = undecided & (np.abs(ideology - score) < 0.3)
+            ballots[aligned] = supports
+            undecided &= ~aligned
+
+        # Everyone else weighs media coverage and personal factors
+        count = int(undecided.sum())
+        if count:
+            support_likelihood = np.full(count, 0.5)
+            support_likelihood += media_influence * (1 - columns['education_level'][undecided] / 100) * 0.3
+            if affects_economic:
+                support_likelihood += (columns['economic_satisfaction'][undecided] - 50) / 100 * 0.2
+            if affects_social:
+                support_likelihood += (columns['social_satisfaction'][undecided] - 50) / 100 * 0.2
+            support_likelihood += rng.uniform(-0.1, 0.1, count)
+            ballots[undecided] = rng.random(count) < np.clip(support_likelihood, 0, 1)
+        return ballots
+
+    def cast_cohorts(self, referendum: Referendum, cohorts, media_coverage: Dict,
+                     party_positions: Dict) -> Tuple[int, int]:
+        """
+        Decide and record the votes of a cohort population (see models/cohorts.py).
+
+        Each cohort's voters vote in favour with the cohort's probability from
+        CohortTable.decide_referendum_vote, drawn as one binomial per cohort.
+
+        Returns:
+            (votes_for, votes_against)
+        """
+        voters = cohorts.voters()
+        support = cohorts.decide_referendum_vote(self.party_terms(party_positions),
+                                                 media_coverage.get('support_ratio', 0.5) - 0.5,
+                                                 referendum.affects_economic, referendum.affects_social)
+        votes_for = int(batch_generator(self.np_rng).binomial(voters, np.clip(support, 0, 1)).sum())
+        votes_against = int(voters.sum()) - votes_for
+        if not self.record_bulk(referendum, votes_for, votes_against):
+            return 0, 0
+        return votes_for, votes_against
+
+    def cast_random_bulk(self, referendum: Referendum, voter_count: int,
+                         support_probability: float = 0.5) -> Tuple[int, int]:
+        """Record `voter_count` independent votes, each in favour with `support_probability`"""
+        votes_for = int(batch_generator(self.np_rng).binomial(voter_count, support_probability))
+        votes_against = voter_count - votes_for
+        if not self.record_bulk(referendum, votes_for, votes_against):
+            return 0, 0
+        return votes_for, votes_against
+
+    def record_bulk(self, referendum: Referendum, votes_for: int, votes_against: int) -> bool:
+        """Add tallied votes; same rules as vote(): only active referendums accept votes"""
+        if referendum.status != ReferendumStatus.ACTIVE:
+            return False
+        referendum.votes_for += votes_for
+        referendum.votes_against += votes_against
+        return True
+
     def delegate_vote(self, citizen, expert: ExpertOrganization, referendum: Referendum) -> bool:
         if referendum.type in [ReferendumType.REGIONAL, ReferendumType.LOCAL]:
             expert.delegated_votes += 1
@@ -131,7 +260,7 @@ class ReferendumSystem:
 
     def complete_referendum(self, referendum: Referendum) -> bool:
         if referendum.status == ReferendumStatus.ACTIVE:
-            referendum.end_date = datetime.now()
+            referendum.end_date = self.clock.today()
             if referendum.total_votes >= referendum.quorum and referendum.total_votes >= referendum.min_votes:
                 referendum.status = ReferendumStatus.COMPLETED
             else:
@@ -0,0 +1,169 @@
+import importlib
+import random
+import sys
+import zlib
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import numpy as np
+from config import *
+
+# Modules that draw from the stdlib `random` module; bind_modules() gives each
+# its own stream so one subsystem's draws do not shift another's.
+STREAM_MODULES = (
+    'models.citizen', 'models.economy', 'models.economy_sector', 'models.bank_national',
+    'models.media', 'models.legislative', 'models.referendum', 'models.political_party',
+    'models.president', 'models.government', 'models.civil_society', 'models.society',
+    'models.scheduler', 'simulation',
+)
+
+def _stream_key(name: str) -> int:
+    return zlib.crc32(name.encode())
+
+class SimulationRNG:
+    """
+    Independent, reproducible random streams for every subsystem of a run.
+
+    All streams derive from one root seed through NumPy SeedSequence spawn
+    keys, so adding draws to one subsystem never shifts another:
+
+    - generator(name): a NumPy Generator per subsystem
+    - stream(name): a stdlib random.Random per subsystem
+    - shard_generator(name, shard, step): a fresh Generator per population
+      shard and batch step; with a fixed RNG_SHARD_SIZE the draws for a row
+      do not depend on how shards are split across workers
+
+    With seed=None the root entropy is drawn from the OS (see `entropy` to
+    reproduce such a run) and stdlib streams stay on the global `random`
+    module, so unseeded runs behave exactly as before.
+    """
+    def __init__(self, seed: Optional[int] = RANDOM_SEED, shard_size: int = RNG_SHARD_SIZE,
+                 entropy: Optional[int] = None):
+        self.seed = seed
+        # Root entropy; pass a run's `entropy` to rebuild its streams elsewhere (e.g. in a worker)
+        self.entropy = entropy if entropy is not None else np.random.SeedSequence(seed).entropy
+        self.shard_size = shard_size
+        self._generators: Dict[str, np.random.Generator] = {}
+        self._streams: Dict[str, random.Random] = {}
+        self._faker: Optional[random.Random] = None  # Stream of the shared Faker instance
+        self._bound: Dict[str, object] = {}  # Module name -> its previous `random`
+        self._bound_faker: Optional[random.Random] = None  # Faker's previous stream
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Module bindings belong to the process, not the run: rebind after unpickling
+        state = dict(vars(self))
+        state['_bound'] = {}
+        state['_bound_faker'] = None
+        return state
+
+    def _sequence(self, name: str, *key: int) -> np.random.SeedSequence:
+        return np.random.SeedSequence(self.entropy, spawn_key=(_stream_key(name),) + key)
+
+    def generator(self, name: str) -> np.random.Generator:
+        """NumPy Generator for subsystem `name` (the same object on every call)"""
+        if name not in self._generators:
+            self._generators[name] = np.random.default_rng(self._sequence(name))
+        return self._generators[name]
+
+    def stream(self, name: str) -> Union[random.Random, object]:
+        """stdlib-style stream for subsystem `name`; the `random` module itself when unseeded"""
+        if self.seed is None:
+            return random
+        if name not in self._streams:
+            state = self._sequence(name, 0).generate_state(4, np.uint64)
+            self._streams[name] = random.Random(int.from_bytes(state.tobytes(), 'little'))
+        return self._streams[name]
+
+    def shard_generator(self, name: str, shard: int, step: int) -> np.random.Generator:
+        """Generator for rows [shard * shard_size, (shard + 1) * shard_size) at batch `step`"""
+        return np.random.default_rng(self._sequence(name, 1, step, shard))
+
+    def sharded(self, name: str) -> 'ShardedStream':
+        return ShardedStream(self, name)
+
+    def bind_modules(self) -> None:
+        """
+        Point each model module's `random` and the shared Faker instance at
+        this run's seeded streams. No-op when unseeded or already bound.
+        unbind_modules() puts back whatever was bound before, so several runs
+        in one process can take turns (see bound()).
+        """
+        if self.seed is None or self._bound:
+            return
+        for module_name in STREAM_MODULES:
+            module = sys.modules.get(module_name)
+            if module is None or not hasattr(module, 'random'):
+                continue
+            self._bound[module_name] = module.random
+            module.random = self.stream(module_name.rsplit('.', 1)[-1])
+        fake = importlib.import_module('models.legislative').fake
+        if getattr(self, '_faker', None) is None:
+            self._faker = random.Random(self.seed)  # As Faker.seed_instance(seed)
+        self._bound_faker = fake.random
+        fake.random = self._faker
+
+    def unbind_modules(self) -> None:
+        if not self._bound:
+            return
+        for module_name, original in self._bound.items():
+            sys.modules[module_name].random = original
+        self._bound.clear()
+        importlib.import_module('models.legislative').fake.random = self._bound_faker
+        self._bound_faker = None
+
+    @contextmanager
+    def bound(self) -> Iterator[None]:
+        """
+        Bind the module streams for the duration of a block, unless they are
+        already bound. The bindings are process-wide, so a run binds them only
+        while it runs and another run's draws never come from its streams.
+        """
+        if self.seed is None or self._bound:
+            yield
+            return
+        self.bind_modules()
+        try:
+            yield
+        finally:
+            self.unbind_modules()
+
+class ShardedStream:
+    """
+    Per-shard generators for one subsystem, advancing one step per batch.
+
+    Batch engines accept one of these in place of a Generator (see shard_draws)
+    so that each fixed-size row shard gets its own reproducible draws.
+    """
+    def __init__(self, rng: SimulationRNG, name: str):
+        self.rng = rng
+        self.name = name
+        self.step = 0
+
+    def next_step(self) -> int:
+        """Advance to the next batch; shard generators are keyed on the returned step"""
+        self.step += 1
+        return self.step
+
+    def shards(self, size: int) -> List[Tuple[slice, np.random.Generator]]:
+        self.next_step()
+        shard_size = self.rng.shard_size
+        return [
+            (slice(start, min(start + shard_size, size)), self.rng.shard_generator(self.name, shard, self.step))
+            for shard, start in enumerate(range(0, size, shard_size))
+        ]
+
+def batch_generator(rng: Union[np.random.Generator, ShardedStream]) -> np.random.Generator:
+    """Generator for draws that cover a whole batch at once (e.g. a single binomial tally)"""
+    if isinstance(rng, ShardedStream):
+        return rng.rng.generator(rng.name)
+    return rng
+
+def shard_draws(rng: Union[np.random.Generator, ShardedStream], size: int) -> List[Tuple[slice, np.random.Generator]]:
+    """
+    Split `size` rows into (rows, generator) pairs.
+
+    A plain Generator covers all rows in one piece; a ShardedStream yields one
+    generator per RNG_SHARD_SIZE rows.
+    """
+    if isinstance(rng, ShardedStream):
+        return rng.shards(size)
+    return [(slice(0, size), rng)]
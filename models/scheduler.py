@@ -0,0 +1,194 @@
+import heapq
+import itertools
+import math
+import random
+from typing import Callable, List, Optional, Tuple
+
+from .clock import SimulationClock
+
+class Event:
+    """A scheduled call; recurring events are re-queued every `interval` days after they fire"""
+    __slots__ = ('time', 'priority', 'handler', 'args', 'interval', 'cancelled')
+
+    def __init__(self, time: int, priority: int, handler: Callable, args: tuple, interval: Optional[int]):
+        self.time = time
+        self.priority = priority
+        self.handler = handler
+        self.args = args
+        self.interval = interval
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def __repr__(self) -> str:
+        name = getattr(self.handler, '__name__', repr(self.handler))
+        return f"Event(day={self.time}, {name}, every={self.interval})"
+
+class EventScheduler:
+    """
+    Priority queue of timed events, in integer simulated days.
+
+    The scheduler drives a SimulationClock: the clock reads the day of the
+    event being handled, so models stamping dates see simulated time.
+
+    Events fire in (time, priority, scheduling order). A subsystem registers
+    its own cadence with every() or draws its next occurrence with
+    poisson() or bernoulli(). Days without events cost nothing, so the run
+    length and time resolution are independent of how often each subsystem acts.
+    """
+    def __init__(self, start: int = 0, clock: Optional[SimulationClock] = None):
+        self.clock = clock if clock is not None else SimulationClock(start)
+        self.profiler = None  # Optional profiling.PhaseProfiler; handlers run as its phases
+        self._queue: List[Tuple[int, int, int, Event]] = []
+        self._order = itertools.count()
+
+    def __getstate__(self) -> dict:
+        # Profilers are per-process diagnostics, not run state
+        state = dict(vars(self))
+        state['profiler'] = None
+        return state
+
+    @property
+    def now(self) -> int:
+        return self.clock.day
+
+    def __len__(self) -> int:
+        return sum(not entry[3].cancelled for entry in self._queue)
+
+    def _push(self, event: Event) -> Event:
+        heapq.heappush(self._queue, (event.time, event.priority, next(self._order), event))
+        return event
+
+    def at(self, time: int, handler: Callable, *args, priority: int = 0) -> Event:
+        """Fire `handler(*args)` once on day `time` (not earlier than now)"""
+        return self._push(Event(max(int(time), self.now), priority, handler, args, None))
+
+    def after(self, delay: int, handler: Callable, *args, priority: int = 0) -> Event:
+        """Fire `handler(*args)` once, `delay` days from now"""
+        return self.at(self.now + delay, handler, *args, priority=priority)
+
+    def every(self, interval: int, handler: Callable, *args, start: Optional[int] = None,
+              priority: int = 0) -> Event:
+        """Fire `handler(*args)` every `interval` days from `start` (default now) until cancelled"""
+        first = self.now if start is None else start
+        return self._push(Event(max(int(first), self.now), priority, handler, args, int(interval)))
+
+    def poisson(self, rate: float, handler: Callable, *args, priority: int = 0) -> Event:
+        """
+        Fire `handler(*args)` as a Poisson process with `rate` events per day.
+
+        Each occurrence schedules the next one, so a rare event costs one queue
+        entry instead of a probability roll every tick.
+        """
+        return PoissonProcess(self, rate, handler, priority).schedule(*args)
+
+    def bernoulli(self, probability: float, interval: int, handler: Callable, *args, priority: int = 0) -> Optional[Event]:
+        """
+        Fire `handler(*args)` at most once per `interval` days, with `probability`.
+
+        Each occurrence draws how many periods pass until the next one, so a
+        rare event costs one queue entry instead of a probability roll every
+        period. Occurrences fall on the first day of their period, like a
+        `random.random() < probability` roll in a periodic loop.
+        """
+        return BernoulliProcess(self, probability, interval, handler, priority).schedule(*args)
+
+    def skip_until(self, time: int) -> int:
+        """
+        Skip every pending event before day `time`; returns the number skipped.
+
+        Recurring events move to their first occurrence on or after `time`, so
+        they keep their cadence. Poisson and Bernoulli processes are dropped and
+        drawn again from `time`, as if the skipped days had not happened. Other
+        one-off events, such as deadlines, are postponed to `time`.
+        """
+        skipped = 0
+        redrawn = []
+        for index, (when, priority, order, event) in enumerate(self._queue):
+            if when >= time or event.cancelled:
+                continue
+            if event.interval:
+                event.time += -(-(time - event.time) // event.interval) * event.interval
+            elif isinstance(event.handler, (PoissonProcess, BernoulliProcess)):
+                event.cancel()
+                redrawn.append(event)
+            else:
+                event.time = time
+            self._queue[index] = (event.time, priority, order, event)
+            skipped += 1
+        heapq.heapify(self._queue)
+        for event in redrawn:
+            event.handler.schedule(*event.args, start=time)
+        return skipped
+
+    def run_until(self, time: int) -> int:
+        """Fire every event before day `time` in order and advance to it; returns the number fired"""
+        fired = 0
+        while self._queue and self._queue[0][0] < time:
+            event = heapq.heappop(self._queue)[3]
+            if event.cancelled:
+                continue
+            self.clock.advance_to(event.time)
+            if self.profiler is None:
+                event.handler(*event.args)
+            else:
+                self.profiler.call(_phase_name(event.handler), event.handler, *event.args)
+            fired += 1
+            if event.interval and not event.cancelled:
+                event.time += event.interval
+                self._push(event)
+        self.clock.advance_to(max(self.now, time))
+        return fired
+
+class PoissonProcess:
+    """Self-rescheduling handler with exponential gaps between occurrences"""
+    def __init__(self, scheduler: EventScheduler, rate: float, handler: Callable, priority: int = 0):
+        self.scheduler = scheduler
+        self.rate = rate
+        self.handler = handler
+        self.priority = priority
+        self.__name__ = getattr(handler, '__name__', 'poisson')
+
+    def schedule(self, *args, start: Optional[int] = None) -> Event:
+        """Draw the next occurrence after day `start` (default now)"""
+        delay = max(1, math.ceil(random.expovariate(self.rate)))
+        first = self.scheduler.now if start is None else start
+        return self.scheduler.at(first + delay, self, *args, priority=self.priority)
+
+    def __call__(self, *args) -> None:
+        self.handler(*args)
+        self.schedule(*args)
+
+class BernoulliProcess:
+    """Self-rescheduling handler firing in each period with a fixed probability, at most once"""
+    def __init__(self, scheduler: EventScheduler, probability: float, interval: int, handler: Callable,
+                 priority: int = 0):
+        self.scheduler = scheduler
+        self.probability = probability
+        self.interval = int(interval)
+        self.handler = handler
+        self.priority = priority
+        self.__name__ = getattr(handler, '__name__', 'bernoulli')
+
+    def schedule(self, *args, start: Optional[int] = None) -> Optional[Event]:
+        """Draw the next period to fire in, counting the one starting on day `start` (default now)"""
+        if self.probability <= 0:
+            return None
+        first = self.scheduler.now if start is None else start
+        failures = 0
+        if self.probability < 1:
+            # Periods without an occurrence before the next one are geometric
+            failures = int(math.log(1.0 - random.random()) / math.log(1.0 - self.probability))
+        return self.scheduler.at(first + failures * self.interval, self, *args, priority=self.priority)
+
+    def __call__(self, *args) -> None:
+        self.handler(*args)
+        self.schedule(*args, start=self.scheduler.now + self.interval)
+
+def _phase_name(handler: Callable) -> str:
+    return getattr(handler, '__name__', type(handler).__name__).lstrip('_')
+
+def monthly_rate(probability: float, days_per_month: int) -> float:
+    """Daily Poisson rate that gives at least one event in a month with `probability`"""
+    return -math.log(1.0 - probability) / days_per_month
@@ -1,14 +1,48 @@
 import random
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
 from config import *
 
-from .citizen import Citizen
+from .citizen import Citizen, CitizenshipStatus, CitizenUpdateEngine, MIN_LEGAL_VOTING_AGE
+from .demographics import DemographicEngine
+from .kernels import ColumnKernel
 from .legislative import Law
+from .referendum import Referendum, ReferendumSystem
+from .rng import SimulationRNG
+from .population import (PopulationStore, PopulationAggregates, VoterRoll, DemographicSnapshot,
+                         CitizenSequence, CitizenView)
+from .population_file import MappedColumnAllocator, create_population, has_population, open_population
 
 class SocietySystem:
-    def __init__(self, initial_population: int):
-        self.citizens: List[Citizen] = []
-        self.create_initial_population(initial_population)
+    def __init__(self, initial_population: int, rng: Optional[np.random.Generator] = None,
+                 debug_checks: bool = DEBUG_MODE, vital_statistics: bool = False,
+                 streams: Optional[SimulationRNG] = None, population_file: Optional[str] = None):
+        """
+        Args:
+            initial_population: Number of citizens to create
+            rng: Generator for population draws (ignored when `streams` is given)
+            debug_checks: Verify running aggregates against full recomputes each month
+            vital_statistics: Apply monthly births/deaths from BIRTH_RATE/DEATH_RATE
+            streams: Per-subsystem random streams of a reproducible run
+            population_file: Directory for memory-mapped population columns (see
+                population_file.py); an existing population there is reopened instead
+                of creating `initial_population` citizens
+        """
+        if streams is not None:
+            rng = streams.generator('society')
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.debug_checks = debug_checks
+        self.vital_statistics = vital_statistics
+        self.aggregates: Optional[PopulationAggregates] = None
+        self.voter_roll: Optional[VoterRoll] = None
+        self.tick = 0  # Completed calls to update_population
+        self._snapshot: Optional[DemographicSnapshot] = None
+        self._snapshot_tick = -1
+        self.update_engine = CitizenUpdateEngine(streams.sharded('citizen_update') if streams else self.rng)
+        self.demographics = DemographicEngine(streams.generator('demographics') if streams else self.rng)
+        self.executor = None  # Optional sharding.ShardedExecutor for the monthly citizen update
+        self.max_population = MAX_POPULATION  # Cap on births and growth batches
+        self._create_population(initial_population, population_file)
         self.social_tension_factors = {
             'income_inequality': 0.0,
             'ethnic_tensions': 0.0,
@@ -17,11 +51,51 @@ class SocietySystem:
             'religious_tensions': 0.0
         }
 
+    def _create_population(self, initial_population: int, population_file: Optional[str]) -> None:
+        if population_file is not None and has_population(population_file):
+            # Restart: the columns are mapped from disk, nothing is regenerated
+            self._attach_store(open_population(population_file))
+        else:
+            self._attach_store(create_population(population_file, initial_population) if population_file
+                               else PopulationStore(capacity=initial_population))
+            self.create_initial_population(initial_population)
+            self.sync_population_file()
+
+    def __len__(self) -> int:
+        """Number of citizens"""
+        return len(self.store)
+
+    def mean(self, name: str) -> float:
+        """Population average of a citizen attribute (see PopulationAggregates.SUM_COLUMNS)"""
+        return self.aggregates.mean(name)
+
+    @property
+    def citizens(self) -> CitizenSequence:
+        """Citizens as lightweight views onto the population store"""
+        return CitizenSequence(self.store)
+
+    @citizens.setter
+    def citizens(self, citizens: List[Citizen]) -> None:
+        self._attach_store(PopulationStore.from_citizens(citizens))
+
+    def _attach_store(self, store: PopulationStore) -> None:
+        """Use `store` for the population and keep running aggregates over it"""
+        if self.aggregates is not None:
+            self.aggregates.detach()
+            self.voter_roll.detach()
+        self.store = store
+        self.aggregates = PopulationAggregates(store)
+        self.voter_roll = VoterRoll(store)
+        self._snapshot = None
+
+    def sync_population_file(self) -> None:
+        """Make the current population reopenable from its population file (no-op in memory)"""
+        if isinstance(self.store.allocator, MappedColumnAllocator):
+            self.store.allocator.sync(self.store)
+
     def create_initial_population(self, population_size: int) -> None:
-        for _ in range(population_size):
-            citizen = self.create_random_citizen()
-            self.citizens.append(citizen)
-            #TODO: Add more factors to the citizen, sync / write updates for those factors
+        self.store.add_random(population_size, self.rng)
+        #TODO: Add more factors to the citizen, sync / write updates for those factors
 
     def create_random_citizen(self) -> Citizen:
         age = random.randint(0, 90)
@@ -29,19 +103,60 @@ class SocietySystem:
         region = f"Region_{random.randint(1, 10)}"
         return Citizen(age, sex, region)
 
+    def add_citizen(self, citizen: Citizen) -> CitizenView:
+        return self.store.view(self.store.add_citizen(citizen))
+
     def get_random_citizens(self, n: int) -> List[Citizen]:
-        return random.sample(self.citizens, min(n, len(self.citizens)))
+        population = len(self.store)
+        slots = self.rng.choice(population, size=min(n, population), replace=False)
+        return self.store.views(slots)
+
+    def get_voting_slots(self) -> np.ndarray:
+        """Store slots of citizens with voting rights, from the maintained voter roll"""
+        return self.voter_roll.slots()
 
     def get_voting_population(self) -> List[Citizen]:
-        return [citizen for citizen in self.citizens if citizen.has_voting_rights()]
+        return self.store.views(self.get_voting_slots())
+
+    def get_voter_columns(self, names) -> Dict[str, np.ndarray]:
+        """Columns restricted to citizens with voting rights, e.g. for ReferendumSystem.cast_bulk"""
+        slots = self.get_voting_slots()
+        return {name: self.store.column(name)[slots] for name in names}
+
+    def voter_count(self) -> int:
+        """Number of citizens with voting rights"""
+        return len(self.voter_roll)
+
+    def cast_votes(self, system: ReferendumSystem, referendum: Referendum, media_coverage: Dict,
+                   party_positions: Dict) -> Tuple[int, int]:
+        """Every voter decides and votes on an active referendum (ReferendumSystem.cast_bulk)"""
+        if self.executor is not None:
+            return self.executor.cast_bulk(system, referendum, self.store, self.get_voting_slots(),
+                                           media_coverage, party_positions)
+        return system.cast_bulk(referendum, self.get_voter_columns(ReferendumSystem.VOTER_COLUMNS),
+                                media_coverage, party_positions)
+
+    def for_each_chunk(self, kernels: Iterable[ColumnKernel], chunk_size: Optional[int] = None) -> None:
+        """
+        Stream the population through `kernels` in one chunked sweep (see
+        PopulationStore.for_each_chunk); on the executor the chunks are its RNG shards.
+        """
+        if self.executor is not None:
+            self.executor.sweep(self.store, kernels)
+        else:
+            self.store.for_each_chunk(kernels, chunk_size)
 
     # This method would handle births, deaths, aging, etc.
-    def update_population(self) -> None:
+    def update_population(self, kernels: Iterable[ColumnKernel] = ()) -> None:
         """
         This method handles births, deaths, aging, etc.
+
+        Args:
+            kernels: Further per-citizen steps fused into the monthly update sweep,
+                e.g. MediaInfluenceEngine.kernel for the month's news cycle
         """
         # Calculate batch sizes based on current population
-        current_pop = len(self.citizens)
+        current_pop = len(self)
         growth_batch = int(current_pop * POPULATION_GROWTH_FACTOR)
         decline_batch = int(current_pop * POPULATION_DECLINE_FACTOR)
         
@@ -52,24 +167,49 @@ class SocietySystem:
         # Add random population changes in batches        
         growth_chance = random.random()        
         if growth_chance > (1 - POPULATION_GROWTH_CHANCE):
-            # Ensure we don't remove more than existing
-            for _ in range(growth_batch):
-                if len(self.citizens) < MAX_POPULATION:
-                    new_citizen = self.create_random_citizen()
-                    self.citizens.append(new_citizen)        
+            # Ensure we don't exceed the population cap
+            self._grow(min(growth_batch, max(0, self.max_population - current_pop)))
         elif growth_chance < POPULATION_DECLINE_CHANCE:
-            for _ in range(min(decline_batch, current_pop)):
-                if self.citizens:
-                    self.citizens.pop()
+            self._decline(min(decline_batch, current_pop))
+        if self.vital_statistics:
+            self._apply_vital_statistics()
 
         # Create basic state dictionaries for updates
         economy_state = {'growth': random.uniform(-0.02, 0.04)}
         social_state = {'cohesion': random.uniform(0.3, 0.7)}
         political_state = {'stability': random.uniform(0.4, 0.8)}
 
-        # Update existing citizens
-        for citizen in self.citizens:
-            citizen.update(economy_state, social_state, political_state)
+        # Update existing citizens in one chunked sweep (same arguments as Citizen.update)
+        self.for_each_chunk([self.update_engine.kernel(economy_state, social_state, political_state), *kernels])
+
+        if self.debug_checks:
+            self.aggregates.verify()
+        self.tick += 1
+
+    def _grow(self, count: int) -> None:
+        self.demographics.grow(self.store, count)
+
+    def _decline(self, count: int) -> None:
+        self.demographics.decline(self.store, count)
+
+    def _apply_vital_statistics(self) -> Tuple[int, int]:
+        """Monthly births and deaths; returns their numbers"""
+        return self.demographics.apply_vital_statistics(self.store, max_population=self.max_population)
+
+    def get_demographic_snapshot(self) -> DemographicSnapshot:
+        """
+        Demographic counts for the current tick.
+
+        Taken at most once per tick, so repeated tension queries within the same
+        month share it; changes made mid-tick show up from the next tick.
+        """
+        if self._snapshot is None or self._snapshot_tick != self.tick:
+            self._snapshot = self._take_snapshot()
+            self._snapshot_tick = self.tick
+        return self._snapshot
+
+    def _take_snapshot(self) -> DemographicSnapshot:
+        return DemographicSnapshot.from_aggregates(self.aggregates)
 
     def get_satisfaction_score(self) -> float:
         """
@@ -79,17 +219,13 @@ class SocietySystem:
         - Average socioeconomic status
         Returns value between 0 and 1
         """
-        if not self.citizens:
+        if not len(self):
             return random.uniform(0.4, 0.6)  # Return reasonable default if no citizens
         
-        # Calculate average happiness
-        avg_happiness = sum(citizen.happiness for citizen in self.citizens) / len(self.citizens)
-        
-        # Calculate average trust
-        avg_trust = sum(citizen.trust_in_institutions for citizen in self.citizens) / len(self.citizens)
-        
-        # Calculate average socioeconomic status
-        avg_socioeconomic = sum(citizen.socioeconomic_rating for citizen in self.citizens) / len(self.citizens)
+        # Averages come from the running aggregates, no pass over citizens
+        avg_happiness = self.mean('happiness')
+        avg_trust = self.mean('trust_in_institutions')
+        avg_socioeconomic = self.mean('socioeconomic_rating')
         
         # Add some random variation to make it more dynamic
         base_satisfaction = (avg_happiness / 100 * 0.4 + 
@@ -144,45 +280,36 @@ class SocietySystem:
     def get_ethnic_diversity_tension(self) -> float:
         """Calculate ethnic tension based on citizen diversity and interaction"""
         # Simplified calculation based on ethnic groups distribution
-        ethnic_groups = {}
-        for citizen in self.citizens:
-            ethnic_groups[citizen.ethnicity] = ethnic_groups.get(citizen.ethnicity, 0) + 1
+        ethnic_groups = self.get_demographic_snapshot().ethnic_groups
         
         # More diverse population might lead to higher tension
-        diversity_factor = len(ethnic_groups) / 10  # Normalized by assumed max of 10 ethnic groups
+        diversity_factor = ethnic_groups / 10  # Normalized by assumed max of 10 ethnic groups
         return self.social_tension_factors['ethnic_tensions'] * diversity_factor
 
     def get_age_group_conflicts(self) -> float:
         """Calculate generational tension based on age distribution"""
-        age_groups = {'young': 0, 'middle': 0, 'elderly': 0}
-        for citizen in self.citizens:
-            if citizen.age < 30:
-                age_groups['young'] += 1
-            elif citizen.age < 60:
-                age_groups['middle'] += 1
-            else:
-                age_groups['elderly'] += 1
+        snapshot = self.get_demographic_snapshot()
+        age_groups = snapshot.age_bands
         
         # Calculate imbalance between age groups
-        total = len(self.citizens)
+        total = snapshot.population
         age_disparity = max(abs(age_groups['young']/total - age_groups['elderly']/total), 0.1)
         return self.social_tension_factors['generational_divide'] * age_disparity
 
     def get_urban_rural_disparity(self) -> float:
         """Calculate urban-rural divide tension"""
-        urban_count = sum(1 for citizen in self.citizens if citizen.region.startswith('Urban'))
-        rural_count = len(self.citizens) - urban_count
+        snapshot = self.get_demographic_snapshot()
+        urban_count = snapshot.urban_count
+        rural_count = snapshot.population - urban_count
         
         # Calculate disparity ratio
-        disparity = abs((urban_count - rural_count) / len(self.citizens))
+        disparity = abs((urban_count - rural_count) / snapshot.population)
         return self.social_tension_factors['urban_rural_divide'] * disparity
 
     def get_religious_conflicts(self) -> float:
         """Calculate religious tension based on religious diversity"""
-        religious_groups = {}
-        for citizen in self.citizens:
-            religious_groups[citizen.religion] = religious_groups.get(citizen.religion, 0) + 1
+        religious_groups = self.get_demographic_snapshot().religious_groups
             
         # More religious groups might indicate higher potential for conflict
-        diversity_factor = len(religious_groups) / 5  # Normalized by assumed max of 5 major religions
+        diversity_factor = religious_groups / 5  # Normalized by assumed max of 5 major religions
         return self.social_tension_factors['religious_tensions'] * diversity_factor
@@ -25,6 +25,7 @@ class SocietyState:
             'political': {},
             'social': {}
         }
+        self.state = SocietyStateType.STABLE
         
     def update_indicators(self, economic_data: Dict[str, float], 
                          political_data: Dict[str, float], 
@@ -45,6 +46,12 @@ class SocietyState:
             political_stability * 0.3 +
             social_stability * 0.3
         )
+        self.state = self._classify_state(economic_stability, political_stability, social_stability,
+                                          self.indicators['overall_stability'])
+
+    def is_crisis(self) -> bool:
+        """Whether the society is in any crisis state"""
+        return self.state not in (SocietyStateType.STABLE, SocietyStateType.PROSPERITY)
         
     def get_state_report(self) -> str:
         """Generate a comprehensive state report"""
@@ -68,9 +75,29 @@ class SocietyState:
             
         # Overall Stability
         report += f"\nOverall Stability: {self.indicators.get('overall_stability', 0):.2f}"
+        report += f"\nState: {self.state.value}"
         
         return report
 
+    def _classify_state(self, economic_stability: float, political_stability: float,
+                        social_stability: float, overall_stability: float) -> SocietyStateType:
+        """
+        Classify the society by its stability scores and the crisis thresholds.
+        More than one crisis at once is a state of emergency.
+        """
+        crises = [state for state, stability, threshold in (
+            (SocietyStateType.ECONOMIC_CRISIS, economic_stability, ECONOMIC_CRISIS_THRESHOLD),
+            (SocietyStateType.POLITICAL_CRISIS, political_stability, POLITICAL_CRISIS_THRESHOLD),
+            (SocietyStateType.SOCIAL_UNREST, social_stability, SOCIAL_UNREST_THRESHOLD),
+        ) if stability < threshold]
+        if len(crises) > 1:
+            return SocietyStateType.STATE_OF_EMERGENCY
+        if crises:
+            return crises[0]
+        if overall_stability > PROSPERITY_THRESHOLD:
+            return SocietyStateType.PROSPERITY
+        return SocietyStateType.STABLE
+
     def _calculate_economic_stability(self, economic_data: Dict[str, float]) -> float:
         """
         Calculate economic stability based on key economic indicators
@@ -0,0 +1,134 @@
+"""
+Per-phase instrumentation of a Simulation run.
+
+A phase is a named piece of work: every scheduler event handler (population
+update, news cycle, parliamentary session, referendum vote, tension check,
+...) plus the setup and indicator phases of Simulation. PhaseProfiler
+records, per month and phase:
+
+    wall_s, cpu_s   wall-clock and process CPU seconds
+    calls           times the phase ran
+    alloc_blocks    net change in allocated Python memory blocks
+    alloc_bytes     net traced bytes (memory mode only; tracemalloc)
+    peak_bytes      highest traced usage reached during the phase (memory mode only)
+
+Phases nest: a handler that enters another phase is charged only its own
+(self) time in the collapsed-stack export, which flamegraph.pl and
+speedscope read directly.
+
+Profiling is off unless a profiler is passed to Simulation. When it is
+off, the only cost is one `is None` check per event.
+"""
+import csv
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+FIELDS = ('wall_s', 'cpu_s', 'calls', 'alloc_blocks', 'alloc_bytes', 'peak_bytes')
+
+class PhaseProfiler:
+    """
+    Wall/CPU timers, call counts and allocation counters per (month, phase).
+
+    Example:
+        profiler = PhaseProfiler(memory=True)
+        Simulation(profiler=profiler).run()
+        profiler.write_table('output/profile.csv')
+        profiler.write_collapsed('output/profile.collapsed')
+    """
+    def __init__(self, memory: bool = False):
+        """
+        Args:
+            memory: Also trace allocated bytes with tracemalloc (slows the run noticeably)
+        """
+        self.memory = memory
+        self.month = None  # Month being simulated; None during setup
+        self.stats: Dict[Tuple[object, str], List[float]] = {}
+        self.stacks: Dict[Tuple[str, ...], float] = {}  # Stack -> self wall seconds
+        self._stack: List[str] = []
+        self._child_time: List[float] = []
+        self._started_tracing = False
+
+    def start(self) -> None:
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Charge the enclosed block to phase `name` of the current month"""
+        self._stack.append(name)
+        self._child_time.append(0.0)
+        blocks = sys.getallocatedblocks()
+        if self.memory and tracemalloc.is_tracing():
+            traced, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            entry = self.stats.setdefault((self.month, name), [0.0] * len(FIELDS))
+            entry[0] += wall
+            entry[1] += cpu
+            entry[2] += 1
+            entry[3] += sys.getallocatedblocks() - blocks
+            if self.memory and tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                entry[4] += current - traced
+                entry[5] = max(entry[5], peak - traced)
+            children = self._child_time.pop()
+            stack = tuple(self._stack)
+            self.stacks[stack] = self.stacks.get(stack, 0.0) + wall - children
+            self._stack.pop()
+            if self._child_time:
+                self._child_time[-1] += wall
+
+    def call(self, name: str, handler: Callable, *args) -> None:
+        """Run `handler(*args)` as phase `name` (used by EventScheduler)"""
+        with self.phase(name):
+            handler(*args)
+
+    def rows(self) -> List[Dict[str, object]]:
+        """Per-month timing table: one row per (month, phase), setup first"""
+        keys = sorted(self.stats, key=lambda key: (-1 if key[0] is None else key[0], key[1]))
+        return [{'month': 'setup' if month is None else month + 1, 'phase': name,
+                 **dict(zip(FIELDS, self.stats[month, name]))}
+                for month, name in keys]
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """Whole-run totals per phase, slowest first"""
+        totals: Dict[str, List[float]] = {}
+        for (_, name), entry in self.stats.items():
+            total = totals.setdefault(name, [0.0] * len(FIELDS))
+            for index, value in enumerate(entry):
+                total[index] = max(total[index], value) if FIELDS[index] == 'peak_bytes' else total[index] + value
+        return {name: dict(zip(FIELDS, entry))
+                for name, entry in sorted(totals.items(), key=lambda item: -item[1][0])}
+
+    def write_table(self, path: str) -> None:
+        with open(path, 'w', newline='') as handle:
+            writer = csv.DictWriter(handle, fieldnames=('month', 'phase') + FIELDS)
+            writer.writeheader()
+            writer.writerows(self.rows())
+
+    def write_collapsed(self, path: str) -> None:
+        """Collapsed stacks ('run;phase;subphase <microseconds>') for flame graph tools"""
+        with open(path, 'w') as handle:
+            for stack, seconds in sorted(self.stacks.items()):
+                handle.write(f"{';'.join(('run',) + stack)} {max(0, round(seconds * 1e6))}\n")
+
+    def report(self, limit: int = 10) -> str:
+        lines = ["Phase                         wall s    cpu s   calls"]
+        for name, entry in list(self.totals().items())[:limit]:
+            lines.append(f"{name:<28} {entry['wall_s']:8.3f} {entry['cpu_s']:8.3f} {int(entry['calls']):7d}")
+        return "\n".join(lines)
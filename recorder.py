@@ -0,0 +1,166 @@
+"""
+Columnar time series of the monthly indicators.
+
+TimeSeriesRecorder appends one record (indicator name -> number) per
+month into preallocated typed column buffers. Every `chunk_rows` records
+it appends the buffers to one binary file per column. The output is a
+directory:
+
+    manifest.json     format name and version, committed row count, rows
+                      per flushed chunk, and the dtype of each column
+    columns/<name>    raw little-endian values, chunks appended in order
+
+A column file is one flat array, so read_series() memory-maps whole
+columns. The manifest is replaced after the column files are written,
+and readers only trust its row count, so a run that is still recording
+(or was killed mid-flush) can be read at any time.
+"""
+import json
+import os
+import shutil
+from numbers import Integral, Real
+from typing import Dict, List, Mapping
+
+import numpy as np
+
+FORMAT = 'technocratia-timeseries'
+VERSION = 1
+
+def flatten(record: Mapping[str, object], prefix: str = '') -> Dict[str, object]:
+    """Nested indicator dicts to dotted column names: {'economic': {'gdp': 1}} -> {'economic.gdp': 1}"""
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, Mapping):
+            flat.update(flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+def _dtype(name: str, value: object) -> np.dtype:
+    if isinstance(value, (bool, np.bool_)):
+        return np.dtype('<?')
+    if isinstance(value, Integral):
+        return np.dtype('<i8')
+    if isinstance(value, Real):
+        return np.dtype('<f8')
+    raise TypeError(f"Indicator '{name}' is {type(value).__name__}; only numbers are recorded")
+
+class TimeSeriesRecorder:
+    """
+    Appends monthly indicator records to a columnar directory.
+
+    The first record fixes the columns and their dtypes (bool, int64 or
+    float64). Later records may leave float columns out, which records NaN,
+    but may not add columns.
+
+    Example:
+        with TimeSeriesRecorder('output/timeseries') as recorder:
+            Simulation(recorder=recorder).run()
+        series = read_series('output/timeseries')
+        series['economy.gdp']
+    """
+    def __init__(self, path: str, chunk_rows: int = 120):
+        """
+        Args:
+            path: Output directory (replaced when the first record arrives)
+            chunk_rows: Records buffered in memory between writes
+        """
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.schema: Dict[str, np.dtype] = {}
+        self.rows = 0  # Records written to disk
+        self.chunks: List[int] = []  # Rows per written chunk
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._fill = 0
+
+    def __len__(self) -> int:
+        return self.rows + self._fill
+
+    def __enter__(self) -> 'TimeSeriesRecorder':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _create(self, record: Mapping[str, object]) -> None:
+        self.schema = {name: _dtype(name, value) for name, value in record.items()}
+        self._buffers = {name: np.empty(self.chunk_rows, dtype=dtype) for name, dtype in self.schema.items()}
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.makedirs(os.path.join(self.path, 'columns'))
+        self._write_manifest()
+
+    def append(self, record: Mapping[str, object]) -> None:
+        """Add one record of numbers, flat (see flatten) and keyed by column name"""
+        if not self.schema:
+            self._create(record)
+        unknown = record.keys() - self.schema.keys()
+        if unknown:
+            raise ValueError(f"Columns not in the recorded schema: {', '.join(sorted(unknown))}")
+        for name, buffer in self._buffers.items():
+            if name in record:
+                value = record[name]
+                if buffer.dtype.kind == 'i' and not isinstance(value, Integral):
+                    raise TypeError(f"Indicator '{name}' was recorded as an integer, got {value!r}")
+                buffer[self._fill] = value
+            elif buffer.dtype.kind == 'f':
+                buffer[self._fill] = np.nan
+            else:
+                raise ValueError(f"Record is missing column '{name}' ({buffer.dtype} has no missing value)")
+        self._fill += 1
+        if self._fill == self.chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the buffered records to the column files and commit them in the manifest"""
+        if not self._fill:
+            return
+        for name, buffer in self._buffers.items():
+            with open(os.path.join(self.path, 'columns', name), 'ab') as handle:
+                handle.write(buffer[:self._fill].tobytes())
+        self.rows += self._fill
+        self.chunks.append(self._fill)
+        self._fill = 0
+        self._write_manifest()
+
+    def close(self) -> None:
+        self.flush()
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            'format': FORMAT,
+            'version': VERSION,
+            'rows': self.rows,
+            'chunks': self.chunks,
+            'columns': {name: dtype.str for name, dtype in self.schema.items()},
+        }
+        staging = os.path.join(self.path, 'manifest.json.tmp')
+        with open(staging, 'w') as handle:
+            json.dump(manifest, handle, indent=2)
+        os.replace(staging, os.path.join(self.path, 'manifest.json'))
+
+def read_series(path: str, mmap: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Load a recorder directory as column name -> array of every committed row.
+
+    Args:
+        path: Directory written by TimeSeriesRecorder
+        mmap: Memory-map the column files read-only instead of reading them into memory
+    """
+    with open(os.path.join(path, 'manifest.json')) as handle:
+        manifest = json.load(handle)
+    if manifest.get('format') != FORMAT:
+        raise ValueError(f"{path} is not a recorded time series")
+    if manifest['version'] > VERSION:
+        raise ValueError(f"Time series version {manifest['version']} is newer than supported ({VERSION})")
+
+    rows = manifest['rows']
+    columns = {}
+    for name, dtype in manifest['columns'].items():
+        dtype = np.dtype(dtype)
+        file = os.path.join(path, 'columns', name)
+        if mmap and rows:
+            columns[name] = np.memmap(file, dtype=dtype, mode='r', shape=(rows,))
+        else:
+            columns[name] = np.fromfile(file, dtype=dtype, count=rows)
+    return columns
@@ -0,0 +1,200 @@
+"""
+Counterfactual "what if" branches of a running Simulation.
+
+ScenarioRunner takes a simulation at month K and forks one child process
+per scenario. The child inherits the whole run state copy-on-write, so
+forking costs no more than the pages the branch later writes. Each child
+applies the scenario's interventions, runs the following months and
+sends back only its indicator trajectory. The parent simulation is left
+untouched at month K, so it can branch again.
+
+A baseline branch with no interventions runs alongside the scenarios.
+Branches share the random streams of the parent, so they draw the same
+numbers, and any difference from the baseline comes from the
+interventions.
+
+Where fork() is unavailable, the runner writes a checkpoint instead and
+spawned workers restore it. Their population columns are then shared
+copy-on-write through the checkpoint's memory maps.
+"""
+import multiprocessing
+import os
+import tempfile
+from multiprocessing.connection import wait
+from typing import Callable, Dict, List, Optional, Sequence
+import numpy as np
+from config import *
+
+from models.bank_national import MonetaryPolicy
+from models.population_file import make_private
+from simulation import Simulation
+
+Intervention = Callable[[Simulation], None]
+
+class Austerity:
+    """Intervention: the government implements austerity (no-op without a government)"""
+    def __call__(self, simulation: Simulation) -> None:
+        if simulation.government is not None:
+            simulation.government.implement_austerity()
+
+    def __repr__(self) -> str:
+        return "Austerity()"
+
+class SetMonetaryPolicy:
+    """Intervention: the national bank switches to `policy`"""
+    def __init__(self, policy: MonetaryPolicy):
+        self.policy = policy
+
+    def __call__(self, simulation: Simulation) -> None:
+        simulation.national_bank.set_monetary_policy(self.policy)
+
+    def __repr__(self) -> str:
+        return f"SetMonetaryPolicy({self.policy})"
+
+class InjectReferendum:
+    """Intervention: hold a national referendum right away"""
+    def __init__(self, title: str, description: str = ""):
+        self.title = title
+        self.description = description
+
+    def __call__(self, simulation: Simulation) -> None:
+        simulation.hold_referendum(self.title, self.description or self.title)
+
+    def __repr__(self) -> str:
+        return f"InjectReferendum({self.title!r})"
+
+class Scenario:
+    """A named list of interventions applied to a branch before its first month"""
+    def __init__(self, name: str, interventions: Sequence[Intervention] = ()):
+        self.name = name
+        self.interventions = list(interventions)
+
+    def __repr__(self) -> str:
+        return f"Scenario({self.name!r}, {self.interventions!r})"
+
+BASELINE = 'baseline'
+
+def _run_branch(simulation: Simulation, scenario: Scenario, months: int) -> List[Dict[str, float]]:
+    """Apply the interventions and run `months` months; returns the new history entries"""
+    simulation.silence()
+    if simulation.executor is not None:
+        # The pool and shared columns belong to the parent: continue single-process on a private copy
+        simulation.society.store.rehome()
+        simulation.society.executor = None
+        simulation.executor = None
+    # The recorder's files and the profiler's totals belong to the parent as well
+    simulation.recorder = None
+    simulation.profiler = None
+    simulation.scheduler.profiler = None
+    # A file-backed population is shared with the parent too; keep the branch's writes private
+    make_private(simulation.society.store)
+    with simulation.rng.bound():
+        for intervention in scenario.interventions:
+            intervention(simulation)
+    start = len(simulation.history)
+    for month in range(start, start + months):
+        simulation.step(month)
+    return simulation.history[start:]
+
+def _forked_branch(simulation: Simulation, scenario: Scenario, months: int, connection) -> None:
+    try:
+        connection.send(('ok', _run_branch(simulation, scenario, months)))
+    except BaseException as error:
+        connection.send(('error', f"{type(error).__name__}: {error}"))
+    finally:
+        connection.close()
+
+def _restored_branch(task) -> List[Dict[str, float]]:
+    path, scenario, months = task
+    simulation = Simulation(quiet=True, workers=1).restore(path)
+    try:
+        return _run_branch(simulation, scenario, months)
+    finally:
+        simulation.cleanup()
+
+class ScenarioResults:
+    """Indicator trajectories per branch, with differences against the baseline"""
+    def __init__(self, trajectories: Dict[str, List[Dict[str, float]]]):
+        self.trajectories = trajectories
+
+    def series(self, name: str, metric: str) -> np.ndarray:
+        return np.array([indicators[metric] for indicators in self.trajectories[name]], dtype=float)
+
+    def diff(self, name: str, metric: str) -> np.ndarray:
+        """Per-month difference of `metric` between branch `name` and the baseline"""
+        return self.series(name, metric) - self.series(BASELINE, metric)
+
+    def summary(self, metrics: Sequence[str] = ('overall_stability', 'government_approval', 'gdp')) -> Dict[str, Dict[str, float]]:
+        """Final-month difference from the baseline per scenario and metric"""
+        return {name: {metric: float(self.diff(name, metric)[-1]) for metric in metrics}
+                for name in self.trajectories if name != BASELINE}
+
+class ScenarioRunner:
+    """
+    Branches a running simulation into counterfactual scenarios.
+
+    Example:
+        simulation.setup()
+        for month in range(24):
+            simulation.step(month)
+        results = ScenarioRunner(simulation).run([
+            Scenario('austerity', [Austerity()]),
+            Scenario('tightening', [SetMonetaryPolicy(MonetaryPolicy.CONTRACTIONARY)]),
+        ], months=24)
+        results.diff('austerity', 'gdp')
+    """
+    def __init__(self, simulation: Simulation, workers: Optional[int] = None):
+        """
+        Args:
+            simulation: Set-up simulation to branch from its current month
+            workers: Branches run at once (default os.cpu_count())
+        """
+        self.simulation = simulation
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(self, scenarios: Sequence[Scenario], months: int) -> ScenarioResults:
+        """Run the baseline and every scenario for `months` months from the current state"""
+        branches = [Scenario(BASELINE)] + list(scenarios)
+        names = [branch.name for branch in branches]
+        if len(set(names)) != len(names):
+            raise ValueError("Scenario names must be unique (and not 'baseline')")
+        if 'fork' in multiprocessing.get_all_start_methods():
+            trajectories = self._run_forked(branches, months)
+        else:
+            trajectories = self._run_restored(branches, months)
+        return ScenarioResults({name: trajectories[name] for name in names})
+
+    def _run_forked(self, branches: List[Scenario], months: int) -> Dict[str, List[Dict[str, float]]]:
+        context = multiprocessing.get_context('fork')
+        trajectories = {}
+        pending = list(branches)
+        running = {}  # Connection -> (process, scenario name)
+        while pending or running:
+            while pending and len(running) < self.workers:
+                scenario = pending.pop(0)
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(target=_forked_branch, args=(self.simulation, scenario, months, sender))
+                process.start()
+                sender.close()
+                running[receiver] = (process, scenario.name)
+            for receiver in wait(list(running)):
+                process, name = running.pop(receiver)
+                try:
+                    status, payload = receiver.recv()
+                except EOFError:
+                    status, payload = 'error', f"branch process exited with code {process.exitcode}"
+                receiver.close()
+                process.join()
+                if status != 'ok':
+                    raise RuntimeError(f"Scenario '{name}' failed: {payload}")
+                trajectories[name] = payload
+        return trajectories
+
+    def _run_restored(self, branches: List[Scenario], months: int) -> Dict[str, List[Dict[str, float]]]:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'branch-point')
+            self.simulation.checkpoint(path)
+            context = multiprocessing.get_context('spawn')
+            with context.Pool(min(self.workers, len(branches))) as pool:
+                results = pool.map(_restored_branch, [(path, scenario, months) for scenario in branches])
+        return {scenario.name: result for scenario, result in zip(branches, results)}
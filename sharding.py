@@ -0,0 +1,215 @@
+"""
+Multi-process execution of the per-citizen phases of a simulated month.
+
+The population columns are moved into shared memory, so worker processes
+read and write their rows in place. The coordinator reduces the scalar
+inputs of each phase once (economy and social impact, news sentiments,
+party alignment terms) and broadcasts them with the shard tasks; fused
+sweeps send every kernel of the sweep with each shard. Workers
+send back only partial aggregates: column sums, age bands and vote
+tallies.
+
+Shards are the fixed RNG_SHARD_SIZE row ranges of SimulationRNG. Each shard
+draws from its own (shard, step) generator, so the results are bit-identical
+to the single-process ShardedStream path for the same seed, whatever the
+worker count.
+"""
+import multiprocessing
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from config import *
+
+from models.citizen import CitizenUpdateEngine
+from models.kernels import ColumnKernel, sweep_columns
+from models.media import MediaInfluenceEngine
+from models.population import PopulationStore, PopulationAggregates
+from models.referendum import ReferendumSystem, Referendum
+from models.rng import SimulationRNG, ShardedStream
+
+# Column name -> (segment name, dtype string, capacity)
+Layout = Dict[str, Tuple[str, str, int]]
+
+class SharedColumnAllocator:
+    """PopulationStore allocator that places each column in a SharedMemory segment"""
+    def __init__(self):
+        self.segments: Dict[str, SharedMemory] = {}  # Column name -> current segment
+        self._retired: List[SharedMemory] = []
+
+    def __call__(self, name: str, dtype, capacity: int) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        segment = SharedMemory(create=True, size=max(1, capacity * dtype.itemsize))
+        if name in self.segments:
+            self._retire(self.segments[name])
+        self.segments[name] = segment
+        return np.ndarray(capacity, dtype=dtype, buffer=segment.buf)
+
+    def layout(self, store: PopulationStore) -> Layout:
+        return {name: (self.segments[name].name, column.dtype.str, len(column))
+                for name, column in store.columns.items()}
+
+    def _retire(self, segment: SharedMemory) -> None:
+        # The old array may still be referenced while the store copies out of it
+        segment.unlink()
+        self._retired.append(segment)
+
+    def close(self) -> None:
+        for segment in self.segments.values():
+            segment.unlink()
+        for segment in self._retired + list(self.segments.values()):
+            try:
+                segment.close()
+            except BufferError:
+                pass  # Still mapped by a live array; released when that goes away
+        self.segments.clear()
+        self._retired.clear()
+
+# Worker process state: the run's streams and attached segments by name
+_worker: Dict[str, object] = {}
+
+def _init_worker(entropy: int, shard_size: int) -> None:
+    _worker['rng'] = SimulationRNG(shard_size=shard_size, entropy=entropy)
+    _worker['segments'] = {}
+
+def _attach(layout: Layout, names) -> Dict[str, np.ndarray]:
+    segments = _worker['segments']
+    columns = {}
+    for name in names:
+        segment_name, dtype, capacity = layout[name]
+        if segment_name not in segments:
+            segments[segment_name] = SharedMemory(name=segment_name)
+        columns[name] = np.ndarray(capacity, dtype=np.dtype(dtype), buffer=segments[segment_name].buf)
+    return columns
+
+def _release_stale(layout: Layout) -> None:
+    current = {segment_name for segment_name, _, _ in layout.values()}
+    segments = _worker['segments']
+    for segment_name in [name for name in segments if name not in current]:
+        try:
+            segments.pop(segment_name).close()
+        except BufferError:
+            pass
+
+def _run_shard(task: tuple):
+    """Run one phase on one shard in a worker; returns partial aggregates"""
+    kind, layout, stream, step, shard, start, stop, params = task
+    _release_stale(layout)
+    if kind == 'vote':
+        rng = _worker['rng'].shard_generator(stream, shard, step)
+        voter_slots, terms = params
+        columns = _attach(layout, ReferendumSystem.VOTER_COLUMNS)
+        voters = {name: column[voter_slots] for name, column in columns.items()}
+        return int(ReferendumSystem.decide_columns(voters, rng, *terms).sum())
+
+    # 'sweep': fused kernels, each drawing from its own stream at its own step
+    names, updated = sweep_columns([kernel for kernel, _, _ in params])
+    columns = {name: column[start:stop] for name, column in _attach(layout, names).items()}
+    for kernel, kernel_stream, kernel_step in params:
+        kernel.run(columns, _worker['rng'].shard_generator(kernel_stream, shard, kernel_step))
+    return PopulationAggregates.shard_totals({name: columns[name] for name in updated})
+
+class ShardedExecutor:
+    """
+    Runs the per-citizen phases on a process pool over shared-memory columns.
+
+    Drop-in for the single-process engine calls: sweep() for
+    PopulationStore.for_each_chunk, update_citizens() for
+    CitizenUpdateEngine.apply, apply_media() for MediaInfluenceEngine.apply and
+    cast_bulk() for ReferendumSystem.cast_bulk. The engines must draw from
+    ShardedStreams of `streams` so both paths share the same random numbers.
+    """
+    def __init__(self, streams: SimulationRNG, workers: int = SIMULATION_WORKERS):
+        self.streams = streams
+        self.workers = workers
+        self.allocator = SharedColumnAllocator()
+        self._stores: List[Tuple[PopulationStore, Callable[..., np.ndarray]]] = []  # With their own allocators
+        # Workers must share the coordinator's resource tracker, or their own
+        # trackers would unlink the segments when the workers exit
+        resource_tracker.ensure_running()
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+        self.pool = context.Pool(workers, initializer=_init_worker, initargs=(streams.entropy, streams.shard_size))
+
+    def __enter__(self) -> 'ShardedExecutor':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop the workers and move shared columns back where they came from:
+        process memory, or the files of a file-backed population
+        """
+        self.pool.terminate()
+        self.pool.join()
+        for store, allocator in self._stores:
+            store.rehome(allocator)
+        self._stores.clear()
+        self.allocator.close()
+
+    def _share(self, store: PopulationStore) -> Layout:
+        if store.allocator is not self.allocator:
+            if self._stores:
+                raise ValueError("ShardedExecutor already shares another population store")
+            self._stores.append((store, store.allocator))
+            store.rehome(self.allocator)
+        return self.allocator.layout(store)
+
+    def _next_step(self, stream: ShardedStream) -> int:
+        if not isinstance(stream, ShardedStream) or stream.rng is not self.streams:
+            raise ValueError("Engine must draw from a ShardedStream of the executor's SimulationRNG")
+        return stream.next_step()
+
+    def _shard_tasks(self, kind: str, layout: Layout, stream: Optional[ShardedStream], size: int, params) -> List[tuple]:
+        """
+        One task per shard of `size` rows; `params` may be a function of (start, stop).
+        Without a `stream` the params carry their own streams (fused sweeps).
+        """
+        name, step = (stream.name, self._next_step(stream)) if stream is not None else (None, None)
+        shard_size = self.streams.shard_size
+        tasks = []
+        for shard, start in enumerate(range(0, size, shard_size)):
+            stop = min(start + shard_size, size)
+            shard_params = params(start, stop) if callable(params) else params
+            tasks.append((kind, layout, name, step, shard, start, stop, shard_params))
+        return tasks
+
+    def _map(self, tasks: List[tuple]) -> list:
+        return self.pool.map(_run_shard, tasks, chunksize=1)
+
+    def sweep(self, store: PopulationStore, kernels: Iterable[ColumnKernel]) -> None:
+        """Parallel PopulationStore.for_each_chunk; the chunks are the RNG shards"""
+        kernels = list(kernels)
+        layout = self._share(store)
+        params = [(kernel, kernel.rng.name, self._next_step(kernel.rng)) for kernel in kernels]
+        partials = self._map(self._shard_tasks('sweep', layout, None, len(store), params))
+        store.mark_updated(sweep_columns(kernels)[1], PopulationAggregates.combine_totals(partials))
+
+    def update_citizens(self, store: PopulationStore, engine: CitizenUpdateEngine,
+                        economy, policies, social_environment) -> None:
+        """Parallel CitizenUpdateEngine.apply"""
+        self.sweep(store, [engine.kernel(economy, policies, social_environment)])
+
+    def apply_media(self, store: PopulationStore, engine: MediaInfluenceEngine,
+                    news_cycle: List[Dict], passes: Optional[int] = None) -> None:
+        """Parallel MediaInfluenceEngine.apply"""
+        kernel = engine.kernel(news_cycle, passes)
+        if not len(kernel.sentiments) or not len(store):
+            return
+        self.sweep(store, [kernel])
+
+    def cast_bulk(self, system: ReferendumSystem, referendum: Referendum, store: PopulationStore,
+                  voter_slots: np.ndarray, media_coverage: Dict, party_positions: Dict) -> Tuple[int, int]:
+        """Parallel ReferendumSystem.cast_bulk over the voters at `voter_slots`"""
+        layout = self._share(store)
+        terms = (system.party_terms(party_positions), media_coverage.get('support_ratio', 0.5) - 0.5,
+                 referendum.affects_economic, referendum.affects_social)
+        tasks = self._shard_tasks('vote', layout, system.np_rng, len(voter_slots),
+                                  lambda start, stop: (voter_slots[start:stop], terms))
+        votes_for = sum(self._map(tasks))
+        votes_against = len(voter_slots) - votes_for
+        if not system.record_bulk(referendum, votes_for, votes_against):
+            return 0, 0
+        return votes_for, votes_against
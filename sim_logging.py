@@ -0,0 +1,153 @@
+"""
+Asynchronous logging for Simulation runs.
+
+configure_logging() puts one QueueHandler on the simulation's loggers.
+The simulation thread only enqueues each LogRecord: no formatting and no
+I/O. A QueueListener thread formats the records and writes them to the
+console and to a buffered log file. The file is flushed every
+`flush_every` records, on warnings and on close.
+
+Formatting is lazy. Log with %-style arguments, as in
+logger.debug("size %d", n), and the message string is built by the
+writer thread, only for records that pass the level check. Arguments are
+read when the record is written, so do not mutate them after the call.
+
+The log file is either plain text ('time - LEVEL - message') or JSON
+lines: one object per record with time, level, logger, message and the
+simulated day.
+"""
+import atexit
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, Iterable, Optional
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+class DeferredQueueHandler(QueueHandler):
+    """Enqueues records as they are; the listener thread formats them"""
+    def __init__(self, log_queue, context: Optional[Callable[[], Dict[str, object]]] = None):
+        """
+        Args:
+            log_queue: Queue read by the QueueListener
+            context: Called per record in the logging thread; its items become record attributes
+        """
+        super().__init__(log_queue)
+        self.context = context
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler.prepare formats the message here; leave that to the writer thread
+        if self.context is not None:
+            for name, value in self.context().items():
+                setattr(record, name, value)
+        return record
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that flushes every `flush_every` records (and on warnings) instead of every record"""
+    def __init__(self, filename: str, mode: str = 'w', flush_every: int = 256,
+                 buffer_size: int = 1 << 16, encoding: Optional[str] = None):
+        self.flush_every = flush_every
+        self.buffer_size = buffer_size
+        self._pending = 0
+        super().__init__(filename, mode, encoding=encoding)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if self._pending >= self.flush_every or record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self._pending = 0
+        super().flush()
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, plus day and exception when present"""
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        if hasattr(record, 'day'):
+            entry['day'] = record.day
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class LogPipeline:
+    """Queue, writer thread and output handlers behind a set of loggers"""
+    def __init__(self, loggers: Iterable[logging.Logger], level: int = logging.INFO,
+                 path: Optional[str] = None, console: bool = True, json_lines: bool = False,
+                 flush_every: int = 256, context: Optional[Callable[[], Dict[str, object]]] = None):
+        """
+        Args:
+            loggers: Loggers to route through the queue (they stop propagating)
+            level: Level for the loggers and the outputs
+            path: Log file, replaced (None for no file)
+            console: Also write to stderr
+            json_lines: Write the file as JSON lines instead of text
+            flush_every: Records between file flushes
+            context: Extra record attributes, e.g. the simulated day (see DeferredQueueHandler)
+        """
+        self.queue = queue.SimpleQueue()  # Unbounded: logging never blocks the simulation
+        self.outputs = []
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+            self.outputs.append(console_handler)
+        if path is not None:
+            file_handler = BufferedFileHandler(path, flush_every=flush_every)
+            file_handler.setFormatter(JsonLinesFormatter() if json_lines else logging.Formatter(TEXT_FORMAT))
+            self.outputs.append(file_handler)
+        for output in self.outputs:
+            output.setLevel(level)
+
+        self.handler = DeferredQueueHandler(self.queue, context)
+        self.loggers = list(loggers)
+        for logger in self.loggers:
+            logger.handlers.clear()
+            logger.addHandler(self.handler)
+            logger.setLevel(level)
+            logger.propagate = False
+        self.listener = QueueListener(self.queue, *self.outputs, respect_handler_level=True)
+        self.listener.start()
+        self.closed = False
+
+    def close(self) -> None:
+        """Detach from the loggers, write every queued record and close the outputs"""
+        if self.closed:
+            return
+        self.closed = True
+        for logger in self.loggers:
+            logger.removeHandler(self.handler)
+        self.listener.stop()  # Drains the queue, then joins the writer thread
+        for output in self.outputs:
+            output.close()
+
+_active: Optional[LogPipeline] = None
+
+def configure_logging(loggers: Iterable[logging.Logger], **options) -> LogPipeline:
+    """Close the previously configured pipeline and start a new one (options as LogPipeline)"""
+    global _active
+    if _active is not None:
+        _active.close()
+    _active = LogPipeline(loggers, **options)
+    return _active
+
+@atexit.register
+def _close_active() -> None:
+    # The writer is a daemon thread: flush what it still holds before the interpreter exits
+    if _active is not None:
+        _active.close()
@@ -1,8 +1,10 @@
 import sys, logging
+from contextlib import nullcontext
 from config import *
 
 from models.citizen import *
 from models.society import *
+from models.cohorts import CohortSociety, HybridSociety
 from models.society_state import *
 from models.legislative import *
 from models.government import *
@@ -13,6 +15,13 @@ from models.civil_society import *
 from models.economy import *
 from models.bank_national import *
 from models.media import *
+from models.rng import SimulationRNG
+from models.scheduler import EventScheduler
+from models.clock import SimulationClock, use_clock
+from sharding import ShardedExecutor
+from checkpoint import read_checkpoint, write_checkpoint, apply_module_state
+from sim_logging import configure_logging
+from recorder import flatten
 
 
 def is_running_under_test():
@@ -20,64 +29,114 @@ def is_running_under_test():
     return 'unittest' in sys.modules
 
 class Simulation:
-    def __init__(self, debug_mode=False):
+    # Per-process attributes that checkpoints leave out
+    TRANSIENT_ATTRIBUTES = ('logger', 'log_pipeline', 'executor', 'workers', 'profiler', 'recorder')
+
+    def __init__(self, debug_mode=False, seed=RANDOM_SEED, workers=SIMULATION_WORKERS,
+                 months=None, initial_population=INITIAL_POPULATION, quiet=False, profiler=None,
+                 json_logs=False, recorder=None, population_file=None, fused_sweep=FUSED_POPULATION_SWEEP,
+                 population_mode=POPULATION_MODE):
+        """
+        Args:
+            debug_mode: Verbose logging, 12-month runs and aggregate self-checks
+            seed: Root seed for every random stream (None for an unseeded run)
+            workers: Processes for the per-citizen phases (see sharding.py)
+            months: Months to simulate (default 12 in debug mode, else SIMULATION_MONTHS)
+            initial_population: Starting number of citizens
+            quiet: Log nothing and leave logging handlers untouched (e.g. ensemble replicas)
+            profiler: Optional profiling.PhaseProfiler timing every phase of the run
+            json_logs: Write the log file as JSON lines (output/output.jsonl) instead of text
+            recorder: Optional recorder.TimeSeriesRecorder receiving every monthly indicator
+            population_file: Directory backing the population with memory-mapped files (reopened
+                if it already holds one); with workers > 1 the columns move to shared memory while the
+                worker pool runs and are copied back to the files when it closes
+            fused_sweep: Generate the news cycle at the start of each month and apply it in the
+                population update's sweep instead of a separate pass later in the month
+            population_mode: 'agents' keeps one row per citizen; 'cohorts' groups citizens into
+                cohorts of weighted attribute distributions (see models/cohorts.py); 'hybrid' keeps
+                cohorts and materializes individual citizens when they are sampled or audited
+        """
         global DEBUG_MODE
         DEBUG_MODE = debug_mode
 
-        # Get logger first
-        self.logger = logging.getLogger(__name__)
-        
-        # Clear ALL handlers
-        self.logger.handlers.clear()
-        # Also clear root logger handlers to prevent duplication
-        logging.getLogger().handlers.clear()
-        
-        # Set up logging handlers
-        handlers = []
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.DEBUG if debug_mode else logging.INFO)
-        handlers.append(console_handler)
-        
-        # File handler
-        if not is_running_under_test():
-            self.file_handler = logging.FileHandler('output/output.txt', mode='w')
-            self.file_handler.setLevel(logging.DEBUG if debug_mode else logging.INFO)
+        # Independent random streams per subsystem; a fixed seed reproduces the run
+        self.rng = SimulationRNG(seed)
+        # More than one worker runs the per-citizen phases on a process pool
+        self.workers = workers
+        self.executor = None
+        self.months = months if months is not None else (12 if debug_mode else SIMULATION_MONTHS)
+        self.initial_population = initial_population
+        self.population_file = population_file
+        self.fused_sweep = fused_sweep
+        if population_mode not in ('agents', 'cohorts', 'hybrid'):
+            raise ValueError(f"Unknown population mode '{population_mode}'")
+        self.population_mode = population_mode
+        self.history = []  # Indicators recorded by step(), one dict per month
+        self.profiler = profiler
+        self.recorder = recorder
+        self.society = None  # Built by setup() or restore()
+        self._month_referendums = []  # Referendums held during the current step()
+        self.clock = SimulationClock()  # Simulated days; models built by setup() read this clock
+        self.log_pipeline = None
+
+        if quiet:
+            self.silence()
         else:
-            self.file_handler = logging.NullHandler()
-        handlers.append(self.file_handler)
-        
-        # Apply format to all handlers
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        for handler in handlers:
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-        
-        # Set logger level
-        self.logger.setLevel(logging.DEBUG if debug_mode else logging.INFO)
-        
-        # Prevent propagation to root logger to avoid duplicate messages
-        self.logger.propagate = False
+            self._setup_logging(debug_mode, json_logs)
 
         self.interim_government = None  # Track interim government during transitions
 
-    def process_news_cycle(self, news_cycle, citizens, government, impact_factor=0.3):
+    def silence(self):
+        """Send this simulation's log to a logger that records nothing"""
+        self.logger = logging.getLogger(f"{__name__}.quiet")
+        if not self.logger.handlers:
+            self.logger.addHandler(logging.NullHandler())
+        self.logger.propagate = False
+        self.logger.setLevel(logging.CRITICAL)
+
+    def _setup_logging(self, debug_mode, json_logs=False):
+        # Clear root logger handlers to prevent duplication
+        logging.getLogger().handlers.clear()
+
+        # Records go through a queue to a writer thread (see sim_logging.py);
+        # model modules log under 'models'
+        self.logger = logging.getLogger(__name__)
+        self.log_pipeline = configure_logging(
+            [self.logger, logging.getLogger('models')],
+            level=logging.DEBUG if debug_mode else logging.INFO,
+            path=None if is_running_under_test() else ('output/output.jsonl' if json_logs else 'output/output.txt'),
+            json_lines=json_logs,
+            context=self._log_context
+        )
+
+    def _log_context(self):
+        return {'day': self.clock.day}
+
+    def process_news_cycle(self, news_cycle, citizens=None, government=None, impact_factor=0.3, passes=1):
         """
         Process a news cycle and update citizens' opinions based on the news content
         
         Args:
             news_cycle (List[Dict]): List of news items with their properties
-            citizens (List[Citizen]): List of citizens to update
+            citizens (List[Citizen]): Citizens to update; None updates the whole population
+                in one sweep of the media kernel
             government (Government): Current government
             impact_factor (float): How strongly news affects opinions (0-1)
+            passes (int): How many times each citizen processes the cycle
         """
-        for citizen in citizens:
-            # Have each citizen process all news in the cycle
-            citizen.process_media_influence(news_cycle)
+        if citizens is None:
+            kernel = self.media_engine.kernel(news_cycle, passes)
+            if len(kernel.sentiments) and len(self.society):
+                self.society.for_each_chunk([kernel])
+        else:
+            for citizen in citizens:
+                # Have each citizen process all news in the cycle
+                for _ in range(passes):
+                    citizen.process_media_influence(news_cycle)
 
         if DEBUG_MODE:
-            logging.info(f"Processed news cycle affecting {len(citizens)} citizens")
+            self.logger.info("Processed news cycle affecting %d citizens",
+                             len(self.society) if citizens is None else len(citizens))
 
     def calculate_public_trust(self, society_data):
         """Calculate and return the public trust score"""
@@ -112,23 +171,56 @@ class Simulation:
 
     # Main simulation logic
     def run(self):
+        """
+        Set up, simulate every month and log the reports; returns the monthly indicators.
+        A restored simulation continues after its last recorded month.
+        """
+        if self.society is None:
+            self.setup()
+        for month in range(len(self.history), self.months):
+            self.step(month)
+        self.report()
+        return self.history
+
+    def _phase(self, name):
+        """Context manager timing a named phase when profiling, otherwise a no-op"""
+        return self.profiler.phase(name) if self.profiler is not None else nullcontext()
+
+    def setup(self):
+        """Build every subsystem and hold the founding elections and presidential review"""
+        if self.profiler is not None:
+            self.profiler.start()
+        with self.rng.bound(), self._phase('setup'):
+            self._setup()
+
+    def _setup(self):
         self.logger.debug("Starting simulation...")
+        self.logger.info("Random seed: %s", self.rng.seed)
+        use_clock(self.clock)
     
         # Initialize core components
-        society = SocietySystem(initial_population=10_000)  # Start with 10K citizens
-        society_state = SocietyState()
+        society_class = {'cohorts': CohortSociety, 'hybrid': HybridSociety}.get(self.population_mode, SocietySystem)
+        self.society = society_class(initial_population=self.initial_population, debug_checks=DEBUG_MODE, vital_statistics=True,
+                                     streams=self.rng, population_file=self.population_file)
+        self.society_state = SocietyState()
+
+        self.political_system = PoliticalSystem()
+        self.civil_society = CivilSociety()
+        self.parliament = Parliament(PARLIAMENT_TOTAL_SEATS)
+        self.parliament.referendum_system.np_rng = self.rng.sharded('referendum')
 
-        political_system = PoliticalSystem()
-        civil_society = CivilSociety()
-        parliament = Parliament(300)
+        self.national_bank = NationalBank("Central Bank of Technocratia")
+        self.economy = EconomicModel()
 
-        national_bank = NationalBank("Central Bank of Technocratia")
-        economy = EconomicModel()
+        self.media_landscape = MediaLandscape()
+        self.media_engine = MediaInfluenceEngine(self.rng.sharded('media'))
 
-        media_landscape = MediaLandscape()
+        if self.workers > 1 and self.population_mode == 'agents':
+            self.executor = ShardedExecutor(self.rng, self.workers)
+            self.society.executor = self.executor
 
         # Track demographic factors
-        demographic_factors = {
+        self.demographic_factors = {
             'age_groups': {'young': 0.3, 'middle': 0.5, 'elderly': 0.2},
             'urban_rural_ratio': 0.7,  # 70% urban
             'education_levels': {'low': 0.2, 'medium': 0.5, 'high': 0.3},
@@ -136,14 +228,14 @@ class Simulation:
         }
         
         # Set up political parties and civic organizations
-        parties = [
+        self.parties = [
             PoliticalParty("Progressive Alliance", Ideology.CENTER_LEFT),
             PoliticalParty("Conservative Union", Ideology.CENTER_RIGHT),
             PoliticalParty("Green Future", Ideology.LEFT)
         ]
-        for party in parties:
-            political_system.register_party(party)
-            self.logger.debug(f"Registered party: {party.name}")
+        for party in self.parties:
+            self.political_system.register_party(party)
+            self.logger.debug("Registered party: %s", party.name)
             
             # Recruit some members
             for _ in range(100):  
@@ -158,13 +250,13 @@ class Simulation:
                 strength = random.uniform(-1, 1)
                 party.propose_policy(area, strength)
 
-        civic_orgs = [
+        self.civic_orgs = [
             CivicOrganization("Green Earth", CauseType.ENVIRONMENTAL),
             CivicOrganization("Education for All", CauseType.EDUCATION),
             CivicOrganization("Health First", CauseType.HEALTHCARE)
         ]
-        for org in civic_orgs:
-            civil_society.register_organization(org)
+        for org in self.civic_orgs:
+            self.civil_society.register_organization(org)
 
             # Recruit some members
             for _ in range(10):  # Recruit some members
@@ -184,7 +276,7 @@ class Simulation:
             ("Independent Voice", MediaType.INDEPENDENT_JOURNALIST)
         ]
         for outlet_name, media_type in media_outlets:
-            media_landscape.add_outlet(MediaOutlet(outlet_name, media_type))
+            self.media_landscape.add_outlet(MediaOutlet(outlet_name, media_type))
 
         # Simulate presidential election
         presidential_candidates = [
@@ -199,8 +291,8 @@ class Simulation:
         for candidate in presidential_candidates:
             presidential_election.register_candidate(candidate)
 
-        president = presidential_election.conduct_election()
-        self.logger.info(f"{president.name} has been elected as President.")
+        self.president = presidential_election.conduct_election()
+        self.logger.info(f"{self.president.name} has been elected as President.")
 
         # Fill the parliament with active members
         for i in range(300):
@@ -210,26 +302,26 @@ class Simulation:
                 chamber = Chamber.SENATE
             member = Parliamentarian(chamber)  # No need to pass ID anymore
             member.status = ParliamentaryStatus.ACTIVE
-            parliament.add_member(member)
+            self.parliament.add_member(member)
 
         # Simulate parliamentary composition and seat allocation
-        political_system.form_parliament(parliament)
+        self.political_system.form_parliament(self.parliament)
 
         # Initialize government as None
-        government = None
+        self.government = None
        
         # Try to form government
-        if parliament.has_quorum():
-            prime_minister = president.choose_prime_minister(parliament)
+        if self.parliament.has_quorum():
+            prime_minister = self.president.choose_prime_minister(self.parliament)
             self.logger.info(f"{prime_minister} has been elected as Prime Minister.")
-            government = Government(prime_minister)
+            self.government = Government(prime_minister)
             
-            if parliament.ratify_government(government):
+            if self.parliament.ratify_government(self.government):
                 self.logger.info("Government successfully formed and ratified!")
-                government.update_budget(economy.government_revenue, economy.government_spending)
+                self.government.update_budget(self.economy.government_revenue, self.economy.government_spending)
             else:
                 self.logger.info("Government ratification failed.")
-                government = None
+                self.government = None
         else:
             self.logger.info("Parliament lacks quorum. Cannot proceed with government formation.")
 
@@ -242,225 +334,407 @@ class Simulation:
                 full_text="This law aims to overhaul the national healthcare system by increasing funding, improving infrastructure, and ensuring universal healthcare coverage for all citizens. The key provisions include: 1) Increased budget allocation for healthcare services, 2) Construction of new hospitals and clinics in underserved areas, 3) Implementation of a universal healthcare insurance program, 4) Recruitment and training of additional healthcare professionals, 5) Introduction of preventive care programs to reduce the incidence of chronic diseases."
             )
             test_law.is_promulgated = True
-            test_law.promulgation_date = datetime.now()
+            test_law.promulgation_date = self.clock.today()
             
             # President sends law to referendum
-            if president.send_law_to_referendum(test_law, parliament.referendum_system):
-                self.logger.info(f"President {president.name} sent law '{test_law.title}' to referendum")
+            if self.president.send_law_to_referendum(test_law, self.parliament.referendum_system):
+                self.logger.info(f"President {self.president.name} sent law '{test_law.title}' to referendum")
                 
                 # Assign the referendum before voting
-                referendum = parliament.referendum_system.referendums[-1]
+                referendum = self.parliament.referendum_system.referendums[-1]
                 
-                # Simulate voting
-                voting_population = society.get_voting_population()
-                for citizen in voting_population:
-                    parliament.referendum_system.vote(citizen, referendum, random.choice([True, False]))
+                # Simulate voting: every eligible citizen flips a coin
+                self.parliament.referendum_system.cast_random_bulk(referendum, self.society.voter_count())
                     
                 # Complete the referendum
-                parliament.referendum_system.complete_referendum(referendum)
+                self.parliament.referendum_system.complete_referendum(referendum)
                 
                 # Handle the results
-                president.handle_referendum_result(test_law, parliament.referendum_system)
+                self.president.handle_referendum_result(test_law, self.parliament.referendum_system)
                 
                 self.logger.info(
                     f"Presidential review referendum for '{test_law.title}' completed. "
                     f"Results: For: {referendum.votes_for}, Against: {referendum.votes_against}"
                 )
 
-        # Main loop simulation
-        for month in range(12 if DEBUG_MODE else SIMULATION_MONTHS):
-            self.logger.debug(f"\n--- Month {month + 1} ---")
-
-            # Update population
-            society.update_population()
-            self.logger.debug(f"Updated population. Current size: {len(society.citizens)}")
-
-            # Collect data from various society systems
-            economic_data = {
-                'gdp_growth': economy.get_gdp_growth(),
-                'inflation': national_bank.get_inflation_rate(),
-                'unemployment': economy.get_unemployment_rate()
-            }          
-
-            political_data = {
-                'government_approval': government.approval_rating if government else 0.0,
-                'parliament_effectiveness': parliament.get_effectiveness_score(),
-                'political_stability': political_system.get_stability_score()
-            }          
-
-            social_data = {
-                'social_cohesion': civil_society.get_cohesion_score(),
-                'media_trust': media_landscape.get_trust_score(),
-                'citizen_satisfaction': society.get_satisfaction_score()
-            }            
-
-            # Calculate public trust
-            self.logger.debug(f"Social cohesion: {social_data['social_cohesion']:.2f}")
-            self.logger.debug(f"Media trust: {social_data['media_trust']:.2f}")
-            self.logger.debug(f"Citizen satisfaction: {social_data['citizen_satisfaction']:.2f}")
-            public_trust = self.calculate_public_trust(social_data)
-
-            # Update society state with all indicators including public trust
-            society_state.update_indicators(
-                economic_data, 
-                political_data,
-                {**social_data, 'public_trust': public_trust}  # Include public trust in social data
-            )
+        # Subsystems act through the event scheduler from here on
+        self._schedule_events()
+
+    def open_referendum(self, title, description):
+        """Propose a national referendum and run its campaign; returns the Referendum"""
+        referendum = self.parliament.propose_referendum(title, description, ReferendumType.NATIONAL)
+
+        # Proper campaign period
+        self.media_landscape.cover_referendum(referendum)
+        for party in self.political_system.parties:
+            party.campaign_for_referendum(referendum)
+        return referendum
+
+    def close_referendum(self, referendum):
+        """Cast and count the votes of a campaigned referendum"""
+        # Citizens vote based on their attributes and campaign influence
+        self.parliament.referendum_system.start_referendum(referendum)
+        coverage = self.media_landscape.get_referendum_coverage(referendum)
+        party_positions = self.political_system.get_party_positions(referendum)
+        with self._phase('cast_votes'):
+            self.society.cast_votes(self.parliament.referendum_system, referendum, coverage, party_positions)
+
+        self.parliament.referendum_system.complete_referendum(referendum)
+        self._month_referendums.append(referendum)
+        self.logger.info("Referendum '%s' results: For: %d, Against: %d", referendum.title, referendum.votes_for, referendum.votes_against)
+
+    def hold_referendum(self, title, description):
+        """Campaign, vote and count a national referendum at once; returns the completed Referendum"""
+        referendum = self.open_referendum(title, description)
+        self.close_referendum(referendum)
+        return referendum
+
+    def step(self, month):
+        """
+        Simulate one month (0-based) and record its indicators. The run's random
+        streams and clock are active only while it steps, so several runs in one
+        process can take turns.
+        """
+        use_clock(self.clock)
+        with self.rng.bound():
+            return self._step(month)
+
+    def _step(self, month):
+        self._month_referendums = []
+        self.logger.debug("\n--- Month %d ---", month + 1)
+        if self.profiler is not None:
+            self.profiler.month = month
+        self.scheduler.run_until((month + 1) * DAYS_PER_MONTH)
+        with self._phase('indicators'):
+            indicators = self.monthly_indicators(month)
+            if self.recorder is not None:
+                self.recorder.append(self.indicator_record(indicators))
+        self.history.append(indicators)
+        return indicators
+
+    @property
+    def current_month(self):
+        """0-based month of the scheduler's current day"""
+        return self.scheduler.now // DAYS_PER_MONTH
+
+    def _schedule_events(self):
+        """
+        Register every subsystem's handler on the event scheduler.
 
-            # Update public trust
-            self.logger.debug(f"Updated public trust: {public_trust}")
-
-            # Economic updates
-            economy.simulate_month()
-            national_bank.update_economic_indicators()
-            self.logger.debug(f"Updated economic indicators: {national_bank.print_economic_indicators()}")
-
-            # Update government budget based on economic model
-            if government is not None:
-                government.update_budget(economy.government_revenue, economy.government_spending)
-
-            # Random bank policy decisions
-            if random.random() < 0.3:
-                national_bank.set_monetary_policy(random.choice(list(MonetaryPolicy)))
-            if random.random() < 0.2:
-                national_bank.conduct_open_market_operations(random.uniform(-1_000_000, 1_000_000))
-            if random.random() < 0.1:
-                national_bank.intervene_in_forex_market(random.uniform(-100_000_000, 100_000_000))            
-            if random.random() < 0.05:
-                national_bank.print_money(random.uniform(100_000_000, 1_000_000_000))
-
-            # Government operations with proper transition handling
-            if government is not None:
-                government.update_approval_rating()
-                self.logger.info(f"Government approval rating: {government.approval_rating:.2f}%")
-
-                if government.check_dissolution():
-                    self.logger.info("Government dissolved. Initiating transition period.")
-                    self.interim_government = government
-                    government = None
-                    # Trigger emergency measures during transition
-                    national_bank.emergency_measures()
-                    political_system.initiate_emergency_election()
-                    continue  # Skip to next month instead of breaking
-
-            # Handle interim government if regular government is dissolved
-            if government is None and self.interim_government is not None:
-                self.interim_government.run_emergency_operations()
-                if political_system.can_form_government():
-                    government = political_system.form_new_government()
-                    self.interim_government = None
-                    self.logger.info("New government formed after transition period.")
-
-            # Parliamentary activities
-            if random.random() < 0.4:
-                parliament.propose_legislation(f"Bill {month}", "Parliament", f"Content of bill {month}")
-
-            if parliament.proposed_legislation:
-                legislation = parliament.proposed_legislation[0]
-                if parliament.vote_on_legislation(legislation):
-                    self.logger.info(f"Legislation '{legislation.title}' passed")
-                    if random.choice([True, False, False, False]):
-                        civil_society.react_to_legislation(legislation)
-                else:
-                    self.logger.info(f"Legislation '{legislation.title}' failed")
-
-            # Presidential actions with proper checks
-            if random.random() < 0.1:
-                member_to_dismiss = random.choice(parliament.members) if parliament.members else None
-                if member_to_dismiss is not None:
-                    dismissal_reason = president.evaluate_dismissal_cause(member_to_dismiss)
-                    if dismissal_reason:
-                        self.logger.info(f"President attempting to dismiss parliamentarian for: {dismissal_reason}")
-                        if president.propose_dismissal(member_to_dismiss, dismissal_reason):
-                            self.logger.info(f"President proposed dismissal of parliamentarian {member_to_dismiss.id}")
-                            if parliament.vote_on_dismissal(member_to_dismiss):
-                                parliament.remove_member(member_to_dismiss)
-                                self.logger.info(f"Parliamentarian {member_to_dismiss.id} dismissed after parliamentary approval")
-                        else:
-                            self.logger.info("Dismissal proposal failed")
-
-            # Media influence implementation
-            news_cycle = media_landscape.simulate_news_cycle()
-            self.process_news_cycle(news_cycle, society.citizens, government if government else self.interim_government)
-            
-            # Update citizen opinions based on media coverage
-            for citizen in society.citizens:
-                citizen.process_media_influence(news_cycle)
-
-            # Enhanced referendum implementation
-            if random.random() < 0.05:
-                referendum = parliament.propose_referendum(
-                    f"Referendum {month}",
-                    f"Description of referendum {month}",
-                    ReferendumType.NATIONAL
-                )
-                
-                # Proper campaign period
-                media_landscape.cover_referendum(referendum)
-                for party in political_system.parties:
-                    party.campaign_for_referendum(referendum)
-                
-                # Citizens vote based on their attributes and campaign influence
-                parliament.referendum_system.start_referendum(referendum)
-                voting_population = society.get_voting_population()
-                for citizen in voting_population:
-                    vote_choice = citizen.decide_referendum_vote(
-                        referendum,
-                        media_landscape.get_referendum_coverage(referendum),
-                        political_system.get_party_positions(referendum)
-                    )
-                    parliament.referendum_system.vote(citizen, referendum, vote_choice)
-                
-                parliament.referendum_system.complete_referendum(referendum)
-                self.logger.info(f"Referendum '{referendum.title}' results: For: {referendum.votes_for}, Against: {referendum.votes_against}")
-
-            # Enhanced social tension calculation
-            social_tension = society.calculate_social_tensions(
-                economy=economy,
-                media_influence=media_landscape.get_tension_impact(),
-                policy_effects=parliament.get_active_legislation(),
-                government_approval=government.approval_rating if government else 0
-            ) or 0.0  # Provide default value of 0.0 if None is returned
-            
-            self.logger.debug(f"Calculated social tensions: {social_tension:.2f}")
+        Monthly phases keep the order of the original monthly loop through their
+        priorities. Chance events that used to roll `random.random() < p` every
+        month are Bernoulli processes: at most one occurrence a month, with
+        probability p, in the loop's order. A month without them costs nothing.
+        """
+        month = DAYS_PER_MONTH
+        self.scheduler = EventScheduler(clock=self.clock)
+        self.scheduler.profiler = self.profiler
+        start = self.scheduler.now
+        self.scheduler.every(month, self._update_population, start=start, priority=0)
+        self.scheduler.every(month, self._update_indicators, start=start, priority=1)
+        self.scheduler.every(month, self._update_economy, start=start, priority=2)
+        self.scheduler.every(month, self._update_government, start=start, priority=4)
+        self.scheduler.every(month, self._parliamentary_session, start=start, priority=6)
+        if not self.fused_sweep:  # Otherwise part of _update_population
+            self.scheduler.every(month, self._news_cycle, start=start, priority=8)
+        self.scheduler.every(month, self._measure_tensions, start=start, priority=10)
+        self.scheduler.every(3 * month, self._check_tensions, start=start, priority=11)
+
+        # Random bank policy decisions
+        self.scheduler.bernoulli(0.3, month, self._change_monetary_policy, priority=3)
+        self.scheduler.bernoulli(0.2, month, self._open_market_operations, priority=3)
+        self.scheduler.bernoulli(0.1, month, self._forex_intervention, priority=3)
+        self.scheduler.bernoulli(0.05, month, self._print_money, priority=3)
+        # Parliamentary, presidential and popular initiatives
+        self.scheduler.bernoulli(0.4, month, self._propose_bill, priority=5)
+        self.scheduler.bernoulli(0.1, month, self._presidential_dismissal, priority=7)
+        self.scheduler.bernoulli(0.05, month, self._start_referendum_campaign, priority=9)
+
+    def _update_population(self):
+        kernels = []
+        if self.fused_sweep:
+            # The month's news reaches citizens in the same sweep as their monthly update
+            with self._phase('generate_news'):
+                news_cycle = self.media_landscape.simulate_news_cycle()
+            kernels.append(self.media_engine.kernel(news_cycle, MEDIA_INFLUENCE_PASSES))
+        self.society.update_population(kernels)
+        self.logger.debug("Updated population. Current size: %d", len(self.society))
+
+    def _update_indicators(self):
+        # Collect data from various society systems
+        economic_data = {
+            'gdp_growth': self.economy.get_gdp_growth(),
+            'inflation': self.national_bank.get_inflation_rate(),
+            'unemployment': self.economy.get_unemployment_rate()
+        }          
+
+        political_data = {
+            'government_approval': self.government.approval_rating if self.government else 0.0,
+            'parliament_effectiveness': self.parliament.get_effectiveness_score(),
+            'political_stability': self.political_system.get_stability_score()
+        }          
+
+        social_data = {
+            'social_cohesion': self.civil_society.get_cohesion_score(),
+            'media_trust': self.media_landscape.get_trust_score(),
+            'citizen_satisfaction': self.society.get_satisfaction_score()
+        }            
+
+        # Calculate public trust
+        self.logger.debug("Social cohesion: %.2f", social_data['social_cohesion'])
+        self.logger.debug("Media trust: %.2f", social_data['media_trust'])
+        self.logger.debug("Citizen satisfaction: %.2f", social_data['citizen_satisfaction'])
+        public_trust = self.calculate_public_trust(social_data)
+
+        # Update society state with all indicators including public trust
+        self.society_state.update_indicators(
+            economic_data, 
+            political_data,
+            {**social_data, 'public_trust': public_trust}  # Include public trust in social data
+        )
 
-            if month % 3 == 0:  # Every 3 months
-                tension_level = society.calculate_social_tensions(economy) or 0.0  # Added default value
-                self.logger.info(f"Social Tension Level: {tension_level:.2f}")
-                
-                if tension_level > 0.7:
-                    self.logger.warning("High social tensions detected!")
-                    civil_society.organize_protests()
-                    media_landscape.increase_coverage()
-                    government.implement_social_measures()
+        # Update public trust
+        self.logger.debug("Updated public trust: %s", public_trust)
+
+    def _update_economy(self):
+        self.economy.simulate_month()
+        self.national_bank.update_economic_indicators()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Updated economic indicators: %s", self.national_bank.print_economic_indicators())
+
+        # Update government budget based on economic model
+        if self.government is not None:
+            self.government.update_budget(self.economy.government_revenue, self.economy.government_spending)
+
+    def _change_monetary_policy(self):
+        self.national_bank.set_monetary_policy(random.choice(list(MonetaryPolicy)))
+
+    def _open_market_operations(self):
+        self.national_bank.conduct_open_market_operations(random.uniform(-1_000_000, 1_000_000))
+
+    def _forex_intervention(self):
+        self.national_bank.intervene_in_forex_market(random.uniform(-100_000_000, 100_000_000))
+
+    def _print_money(self):
+        self.national_bank.print_money(random.uniform(100_000_000, 1_000_000_000))
+
+    def _update_government(self):
+        # Government operations with proper transition handling
+        if self.government is not None:
+            self.government.update_approval_rating()
+            self.logger.info("Government approval rating: %.2f%%", self.government.approval_rating)
+
+            if self.government.check_dissolution():
+                self.logger.info("Government dissolved. Initiating transition period.")
+                self.interim_government = self.government
+                self.government = None
+                # Trigger emergency measures during transition
+                self.national_bank.emergency_measures()
+                # The rest of the month is skipped, as the monthly loop did
+                self.scheduler.skip_until((self.current_month + 1) * DAYS_PER_MONTH)
+                self._call_emergency_election()
+                self.scheduler.after(EMERGENCY_DURATION, self._emergency_expired, priority=4)
+                return
+
+        # Handle interim government if regular government is dissolved
+        if self.government is None and self.interim_government is not None:
+            self.interim_government.run_emergency_operations()
+            if self.political_system.can_form_government():
+                self.government = self.political_system.form_new_government()
+                self.interim_government = None
+                self.logger.info("New government formed after transition period.")
+
+    def _call_emergency_election(self):
+        self.political_system.initiate_emergency_election()
+        self.scheduler.at(self.political_system.election_date, self._emergency_election, priority=4)
+
+    def _emergency_election(self):
+        if self.government is not None or self.interim_government is None:
+            return
+        results = self.political_system.hold_emergency_election()
+        self.logger.info("Emergency election results: " +
+                         ", ".join(f"{party.name} {share:.1%}" for party, share in results.items()))
+        if self.political_system.can_form_government():
+            self.government = self.political_system.form_new_government()
+            self.interim_government = None
+            self.government.update_budget(self.economy.government_revenue, self.economy.government_spending)
+            self.logger.info("New government formed after emergency election.")
+
+    def _emergency_expired(self):
+        # The transition outlasted the emergency period without a new government: call a new election
+        if self.government is None and self.interim_government is not None:
+            self.logger.info("Emergency period expired without a new government. Calling a new election.")
+            self._call_emergency_election()
+            self.scheduler.after(EMERGENCY_DURATION, self._emergency_expired, priority=4)
+
+    def _propose_bill(self):
+        month = self.current_month
+        self.parliament.propose_legislation(f"Bill {month}", "Parliament", f"Content of bill {month}")
+
+    def _parliamentary_session(self):
+        if self.parliament.proposed_legislation:
+            legislation = self.parliament.proposed_legislation[0]
+            if self.parliament.vote_on_legislation(legislation):
+                self.logger.info("Legislation '%s' passed", legislation.title)
+                if random.choice([True, False, False, False]):
+                    self.civil_society.react_to_legislation(legislation)
+            else:
+                self.logger.info("Legislation '%s' failed", legislation.title)
+
+    def _presidential_dismissal(self):
+        # Presidential actions with proper checks
+        member_to_dismiss = random.choice(self.parliament.members) if self.parliament.members else None
+        if member_to_dismiss is not None:
+            dismissal_reason = self.president.evaluate_dismissal_cause(member_to_dismiss)
+            if dismissal_reason:
+                self.logger.info(f"President attempting to dismiss parliamentarian for: {dismissal_reason}")
+                if self.president.propose_dismissal(member_to_dismiss, dismissal_reason):
+                    self.logger.info(f"President proposed dismissal of parliamentarian {member_to_dismiss.id}")
+                    if self.parliament.vote_on_dismissal(member_to_dismiss):
+                        self.parliament.remove_member(member_to_dismiss)
+                        self.logger.info(f"Parliamentarian {member_to_dismiss.id} dismissed after parliamentary approval")
+                else:
+                    self.logger.info("Dismissal proposal failed")
+
+    def _news_cycle(self):
+        # Media influence implementation: every citizen processes the news cycle
+        # MEDIA_INFLUENCE_PASSES times in a single population sweep
+        with self._phase('generate_news'):
+            news_cycle = self.media_landscape.simulate_news_cycle()
+        with self._phase('apply_media'):
+            self.process_news_cycle(news_cycle, government=self.government or self.interim_government,
+                                    passes=MEDIA_INFLUENCE_PASSES)
+
+    def _start_referendum_campaign(self):
+        # The vote follows a campaign period
+        month = self.current_month
+        referendum = self.open_referendum(f"Referendum {month}", f"Description of referendum {month}")
+        self.scheduler.after(REFERENDUM_CAMPAIGN_DAYS, self.close_referendum, referendum, priority=9)
+
+    def _measure_tensions(self):
+        # Enhanced social tension calculation
+        social_tension = self.society.calculate_social_tensions(
+            economy=self.economy,
+            media_influence=self.media_landscape.get_tension_impact(),
+            policy_effects=self.parliament.get_active_legislation(),
+            government_approval=self.government.approval_rating if self.government else 0
+        ) or 0.0  # Provide default value of 0.0 if None is returned
+
+        self.logger.debug("Calculated social tensions: %.2f", social_tension)
+
+    def _check_tensions(self):
+        # Every 3 months
+        tension_level = self.society.calculate_social_tensions(self.economy) or 0.0  # Added default value
+        self.logger.info("Social Tension Level: %.2f", tension_level)
+
+        if tension_level > 0.7:
+            self.logger.warning("High social tensions detected!")
+            self.civil_society.organize_protests()
+            self.media_landscape.increase_coverage()
+            self.government.implement_social_measures()
+
+    def monthly_indicators(self, month):
+        """Headline indicators after `month`, as recorded in `history`"""
+        referendums = self._month_referendums
+        votes = sum(referendum.votes_for + referendum.votes_against for referendum in referendums)
+        return {
+            'month': month + 1,
+            'population': len(self.society),
+            'overall_stability': self.society_state.indicators.get('overall_stability', 0.0),
+            'crisis': float(self.society_state.is_crisis()),  # 1.0 in an economic, political or social crisis
+            'government_approval': self.government.approval_rating if self.government else 0.0,
+            'gdp': self.economy.gdp,
+            'referendums': len(referendums),
+            # Share of votes in favour across this month's referendums (NaN if none were held)
+            'referendum_support': sum(referendum.votes_for for referendum in referendums) / votes if votes else float('nan'),
+        }
 
-        # Simulation reports
+    def indicator_record(self, indicators):
+        """Every indicator of the month as flat numeric columns, for the TimeSeriesRecorder"""
+        return flatten({
+            **indicators,
+            'day': self.clock.day,
+            'state': self.society_state.indicators,
+            'economy': self.economy.get_indicator_values(),
+            'bank': {indicator.name.lower(): value for indicator, value in self.national_bank.economic_indicators.items()},
+        })
+
+    def report(self):
+        """Log the end-of-run reports"""
         self.logger.info("\n--- Simulation Reports ---")
-        self.logger.info(f"Economic indicators: {economy.get_economic_indicators()}")
+        self.logger.info(f"Economic indicators: {self.economy.get_economic_indicators()}")
         self.logger.info("\n--")
-        self.logger.info(national_bank.generate_economic_report())
+        self.logger.info(self.national_bank.generate_economic_report())
         self.logger.info("\n--")
         if not DEBUG_MODE:
-            self.logger.info(media_landscape.generate_media_report())
+            self.logger.info(self.media_landscape.generate_media_report())
             self.logger.info("\n--")
-        self.logger.info(f"Total political system popularity: {political_system.total_popularity():.2f}")
-        self.logger.info(f"Total civil society influence: {civil_society.total_influence():.2f}")
+        self.logger.info(f"Total political system popularity: {self.political_system.total_popularity():.2f}")
+        self.logger.info(f"Total civil society influence: {self.civil_society.total_influence():.2f}")
 
         # Add to the simulation reports section
         self.logger.info("\n--- Society State Report ---")
-        self.logger.info(society_state.get_state_report())
+        self.logger.info(self.society_state.get_state_report())
+
+    def checkpoint(self, path, compress=False):
+        """
+        Save the complete run state to the checkpoint directory `path` (see checkpoint.py)
+
+        Args:
+            path: Checkpoint directory, replaced if it exists
+            compress: Also compress the float population columns (smaller, slower to save)
+        """
+        state = {name: value for name, value in vars(self).items() if name not in self.TRANSIENT_ATTRIBUTES}
+        with self.rng.bound():  # The saved module state is that of this run's streams
+            write_checkpoint(path, state, self.society.store, compress=compress, owner=self)
+        self.logger.info(f"Checkpoint saved to {path} after month {len(self.history)}")
+
+    def restore(self, path):
+        """
+        Replace this simulation's run state with a checkpoint; logging and worker
+        settings are kept. Several simulations restored from one checkpoint share
+        its uncompressed population columns copy-on-write.
+        """
+        self.rng.unbind_modules()
+        if self.executor is not None:
+            self.executor.close()
+            self.executor = None
+        state, module_state = read_checkpoint(path, owner=self)
+        vars(self).update(state)
+        with self.rng.bound():
+            apply_module_state(module_state)
+        use_clock(self.clock)
+        self.scheduler.profiler = self.profiler
+        if self.workers > 1 and self.population_mode == 'agents':
+            self.executor = ShardedExecutor(self.rng, self.workers)
+            self.society.executor = self.executor
+        self.logger.info(f"Restored checkpoint {path} at month {len(self.history)}")
+        return self
 
     def cleanup(self):
         """Clean up resources when simulation is done"""
-        if hasattr(self, 'file_handler'):
-            self.file_handler.close()
-            logging.getLogger().removeHandler(self.file_handler)
-
-def run_simulation(debug_mode=False):
+        self.rng.unbind_modules()
+        use_clock(None)
+        if self.profiler is not None:
+            self.profiler.stop()
+        if self.executor is not None:
+            self.executor.close()
+            self.executor = None
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.society is not None:
+            self.society.sync_population_file()
+        if self.log_pipeline is not None:
+            self.log_pipeline.close()
+            self.log_pipeline = None
+
+def run_simulation(debug_mode=False, seed=RANDOM_SEED, json_logs=False, population_file=None,
+                   fused_sweep=FUSED_POPULATION_SWEEP, population_mode=POPULATION_MODE):
     global DEBUG_MODE
     DEBUG_MODE = debug_mode
     
-    simulation = Simulation(debug_mode)
+    simulation = Simulation(debug_mode, seed=seed, json_logs=json_logs, population_file=population_file,
+                            fused_sweep=fused_sweep, population_mode=population_mode)
     try:
         simulation.run()
     finally:
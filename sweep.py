@@ -0,0 +1,260 @@
+"""
+Parameter sweeps over the constants in config.py.
+
+Modules use `from config import *`, so every module holds its own copy of
+each constant from import time. config_overrides() temporarily rebinds a
+constant in config and in every project module that imported it, so a run
+sees the override without re-importing anything. Defaults baked into
+function signatures (e.g. Simulation(seed=RANDOM_SEED)) are not affected.
+Pass those as arguments instead. A constant that no function reads when
+it runs (only signature defaults, import-time code or nothing at all) is
+rejected, so a sweep cannot silently vary a parameter that changes nothing.
+So are constants that Simulation sets from its own arguments (DEBUG_MODE).
+
+A sweep is a list of override dicts, built with grid() or
+latin_hypercube(). ParameterSweep runs each point with `replicas` seeds on
+one reusable process pool. Each (point, seed) outcome is cached on disk, so
+rerunning or extending a sweep only computes the new points.
+"""
+import csv
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import types
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+import numpy as np
+import config
+from config import *
+
+from ensemble import METRICS, _run_replica
+
+Point = Dict[str, Any]
+
+_PROJECT_ROOT = os.path.dirname(os.path.abspath(config.__file__))
+
+# Constants Simulation.__init__ overwrites from its arguments, by argument name
+_SIMULATION_ARGUMENTS = {'DEBUG_MODE': 'debug_mode'}
+
+def _project_modules() -> List[Any]:
+    modules = []
+    for module in list(sys.modules.values()):
+        path = getattr(module, '__file__', None)
+        if path and os.path.abspath(path).startswith(_PROJECT_ROOT + os.sep) and 'site-packages' not in path:
+            modules.append(module)
+    return modules
+
+def _code_names(code: types.CodeType) -> Iterator[str]:
+    yield from code.co_names
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            yield from _code_names(constant)
+
+def _functions(namespace: Dict[str, Any], module: str) -> Iterator[types.FunctionType]:
+    """Functions and methods defined in `module` among the values of `namespace`"""
+    for value in list(namespace.values()):
+        if isinstance(value, (staticmethod, classmethod)):
+            value = value.__func__
+        if isinstance(value, property):
+            yield from (accessor for accessor in (value.fget, value.fset, value.fdel) if accessor is not None)
+        elif isinstance(value, types.FunctionType) and value.__module__ == module:
+            yield value
+        elif isinstance(value, type) and value.__module__ == module:
+            yield from _functions(vars(value), module)
+
+def _read_at_call_time(modules: Iterable[Any]) -> Set[str]:
+    """Global names that functions of `modules` look up when they run"""
+    return {name for module in modules for function in _functions(vars(module), module.__name__)
+            for name in _code_names(function.__code__)}
+
+@contextmanager
+def config_overrides(**overrides: Any) -> Iterator[None]:
+    """
+    Rebind config constants in config and every project module that imported them.
+
+    Example:
+        with config_overrides(BIRTH_RATE=0.02, PARLIAMENT_QUORUM=0.6):
+            Simulation(seed=1).run()
+    """
+    unknown = sorted(name for name in overrides if not hasattr(config, name))
+    if unknown:
+        raise ValueError(f"Unknown config parameters: {', '.join(unknown)}")
+    overwritten = sorted(name for name in overrides if name in _SIMULATION_ARGUMENTS)
+    if overwritten:
+        raise ValueError("Config parameters set by Simulation arguments, pass those instead: " +
+                         ', '.join(f"{name} ({_SIMULATION_ARGUMENTS[name]})" for name in overwritten))
+    modules = _project_modules()
+    inert = sorted(set(overrides) - _read_at_call_time(modules))
+    if inert:
+        raise ValueError(f"Config parameters not read by any function, overriding them changes nothing: {', '.join(inert)}")
+    patched: List[Tuple[Dict[str, Any], str, Any]] = []
+    try:
+        for module in modules:
+            namespace = vars(module)
+            for name, value in overrides.items():
+                if name in namespace:
+                    patched.append((namespace, name, namespace[name]))
+                    namespace[name] = value
+        yield
+    finally:
+        for namespace, name, value in reversed(patched):
+            namespace[name] = value
+
+def grid(spec: Dict[str, Sequence[Any]]) -> List[Point]:
+    """Full factorial design: every combination of the listed values"""
+    names = list(spec)
+    return [dict(zip(names, values)) for values in itertools.product(*(spec[name] for name in names))]
+
+def latin_hypercube(spec: Dict[str, Tuple[float, float]], samples: int, seed: Optional[int] = None) -> List[Point]:
+    """
+    Latin-hypercube design: each parameter's range is split into `samples`
+    strata and every stratum is sampled exactly once.
+
+    Args:
+        spec: Parameter name -> (low, high); integer bounds give integer values
+        samples: Number of points
+        seed: Seed for the design (None for fresh entropy)
+    """
+    rng = np.random.default_rng(seed)
+    points: List[Point] = [{} for _ in range(samples)]
+    for name, (low, high) in spec.items():
+        unit = (rng.permutation(samples) + rng.random(samples)) / samples
+        values = low + unit * (high - low)
+        integer = isinstance(low, int) and isinstance(high, int)
+        for point, value in zip(points, values):
+            point[name] = int(round(value)) if integer else float(value)
+    return points
+
+def _run_point(task: Tuple[str, Point, int, int, int]) -> Tuple[str, Dict[str, float]]:
+    """Run one (point, seed) pair and return (cache key, outcome)"""
+    key, overrides, seed, months, initial_population = task
+    with config_overrides(**overrides):
+        _, values = _run_replica((0, seed, months, initial_population))
+    outcome = dict(zip(METRICS, values[-1].tolist()))  # Final-month indicators
+    outcome['referendums'] = float(np.sum(values[:, METRICS.index('referendums')]))
+    support = values[:, METRICS.index('referendum_support')]
+    outcome['referendum_support'] = float(np.nanmean(support)) if not np.all(np.isnan(support)) else float('nan')
+    outcome['mean_overall_stability'] = float(np.mean(values[:, METRICS.index('overall_stability')]))
+    outcome['crisis_months'] = float(np.sum(values[:, METRICS.index('crisis')]))
+    return key, outcome
+
+class SweepCache:
+    """Append-only JSON-lines file of outcomes by (point, seed, months, population) key"""
+    def __init__(self, path: str):
+        self.path = path
+        self.outcomes: Dict[str, Dict[str, float]] = {}
+        if os.path.exists(path):
+            with open(path) as handle:
+                for line in handle:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.outcomes[entry['key']] = entry['outcome']
+
+    @staticmethod
+    def key(overrides: Point, seed: int, months: int, initial_population: int) -> str:
+        # The metrics are part of the key, so outcomes cached before a metric was added are recomputed
+        payload = json.dumps({'overrides': overrides, 'seed': seed, 'months': months,
+                              'initial_population': initial_population, 'metrics': METRICS},
+                             sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, float]]:
+        return self.outcomes.get(key)
+
+    def put(self, key: str, outcome: Dict[str, float]) -> None:
+        self.outcomes[key] = outcome
+        with open(self.path, 'a') as handle:
+            handle.write(json.dumps({'key': key, 'outcome': outcome}) + '\n')
+
+class ParameterSweep:
+    """
+    Runs a design of config overrides and collects one tidy row per (point, replica).
+
+    Replica r of every point uses the same seed (common random numbers), so
+    differences between points come from the parameters, not the draws.
+
+    Example:
+        with ParameterSweep(grid({'BIRTH_RATE': [0.01, 0.02]}), replicas=5, seed=1,
+                            cache='output/sweep.jsonl') as sweep:
+            write_csv(sweep.run(), 'output/sweep.csv')
+    """
+    def __init__(self, points: Sequence[Point], replicas: int = 1, seed: Optional[int] = RANDOM_SEED,
+                 months: int = SIMULATION_MONTHS, initial_population: int = INITIAL_POPULATION,
+                 workers: Optional[int] = None, cache: Optional[str] = None):
+        """
+        Args:
+            points: Override dicts, e.g. from grid() or latin_hypercube()
+            replicas: Seeds per point
+            seed: Sweep seed; replica seeds are spawned from it (None disables the cache)
+            months: Months per run
+            initial_population: Starting population of each run
+            workers: Pool size (default os.cpu_count(); 1 runs in-process)
+            cache: Path of the JSON-lines result cache (None for no cache)
+        """
+        self.points = [dict(point) for point in points]
+        self.months = months
+        self.initial_population = initial_population
+        self.workers = workers or os.cpu_count() or 1
+        sequence = np.random.SeedSequence(seed)
+        self.seeds = [int(child.generate_state(1)[0]) for child in sequence.spawn(replicas)]
+        # Unseeded runs are not reproducible, so their outcomes are never reused
+        self.cache = SweepCache(cache) if cache is not None and seed is not None else None
+        self._pool = None
+
+    def __enter__(self) -> 'ParameterSweep':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _map(self, tasks):
+        if self.workers == 1 or len(tasks) <= 1:
+            return map(_run_point, tasks)
+        if self._pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+            self._pool = context.Pool(self.workers)
+        return self._pool.imap_unordered(_run_point, tasks)
+
+    def run(self) -> List[Dict[str, Any]]:
+        """Run every uncached (point, replica) and return the tidy outcome table"""
+        keys = {}
+        outcomes: Dict[str, Dict[str, float]] = {}
+        tasks = []
+        for index, point in enumerate(self.points):
+            for replica, seed in enumerate(self.seeds):
+                key = SweepCache.key(point, seed, self.months, self.initial_population)
+                keys[index, replica] = key
+                cached = self.cache.get(key) if self.cache is not None else None
+                if cached is not None:
+                    outcomes[key] = cached
+                elif key not in outcomes:
+                    outcomes[key] = None
+                    tasks.append((key, point, seed, self.months, self.initial_population))
+
+        for key, outcome in self._map(tasks):
+            outcomes[key] = outcome
+            if self.cache is not None:
+                self.cache.put(key, outcome)
+
+        return [{'point': index, 'replica': replica, 'seed': self.seeds[replica], **point,
+                 **outcomes[keys[index, replica]]}
+                for index, point in enumerate(self.points) for replica in range(len(self.seeds))]
+
+def write_csv(rows: Sequence[Dict[str, Any]], path: str) -> None:
+    """Write a tidy table (list of dicts with the same keys) as CSV"""
+    if not rows:
+        return
+    with open(path, 'w', newline='') as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
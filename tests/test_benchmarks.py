@@ -0,0 +1,29 @@
+import unittest
+
+from benchmarks import suite
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_suite_times_every_benchmark(self):
+        results = suite.run_suite(sizes=(200,), calls=2, log=lambda message: None)
+        self.assertEqual(results['format'], suite.FORMAT)
+        self.assertEqual(set(results['results']), set(suite.BENCHMARKS))
+        for timings in results['results'].values():
+            self.assertGreater(timings['200'], 0)
+
+    def test_unknown_benchmark(self):
+        with self.assertRaises(ValueError):
+            suite.run_suite(sizes=(200,), names=['no_such_benchmark'])
+
+    def test_compare_flags_slowdowns_over_threshold(self):
+        baseline = {'threshold': 0.2, 'results': {'news_cycle': {'1000': 1.0, '10000': 1.0},
+                                                  'economy_month': {'1000': 1.0}}}
+        results = {'results': {'news_cycle': {'1000': 1.19, '10000': 1.25},
+                               'economy_month': {'1000': 0.5},
+                               'update_population': {'1000': 9.0}}}  # Not in the baseline
+        regressions = suite.compare(results, baseline)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('news_cycle at 10,000'))
+        self.assertEqual(len(suite.compare(results, baseline, threshold=0.1)), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from simulation import Simulation
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'month-3')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def simulation(self):
+        return Simulation(seed=21, months=6, initial_population=500, quiet=True)
+
+    def test_restored_run_continues_identically(self):
+        original = self.simulation()
+        original.setup()
+        for month in range(3):
+            original.step(month)
+        original.checkpoint(self.path)
+        original.run()
+        original.cleanup()
+
+        restored = self.simulation().restore(self.path)
+        self.assertEqual(len(restored.history), 3)
+        restored.run()
+        restored.cleanup()
+
+        self.assertEqual(restored.history[-1]['gdp'], original.history[-1]['gdp'])
+        self.assertEqual(restored.history[-1]['overall_stability'], original.history[-1]['overall_stability'])
+        for name in original.society.store.columns:
+            np.testing.assert_array_equal(restored.society.store.column(name), original.society.store.column(name))
+
+    def test_branches_do_not_write_back_to_the_checkpoint(self):
+        simulation = self.simulation()
+        simulation.setup()
+        simulation.checkpoint(self.path)
+        saved = simulation.society.store.column('happiness').copy()
+
+        branch = self.simulation().restore(self.path)
+        branch.society.store.column('happiness')[:] = 0.0
+
+        reread = self.simulation().restore(self.path)
+        np.testing.assert_array_equal(reread.society.store.column('happiness'), saved)
+        reread.cleanup()
+        branch.cleanup()
+        simulation.cleanup()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from models.clock import SimulationClock, current_clock, use_clock
+from models.government import Government
+from models.political_party import Ideology, PoliticalParty, PoliticalSystem
+from models.scheduler import EventScheduler
+
+class TestSimulationClock(unittest.TestCase):
+    def setUp(self):
+        self.clock = SimulationClock()
+        self.previous = use_clock(self.clock)
+
+    def tearDown(self):
+        use_clock(self.previous)
+
+    def test_terms_expire_in_simulated_time(self):
+        government = Government(prime_minister=None)
+        self.assertIs(government.clock, current_clock())
+        self.assertFalse(government.check_dissolution())
+
+        EventScheduler(clock=self.clock).run_until(SimulationClock.days(years=3))
+        self.assertTrue(government.check_dissolution())
+        with self.assertRaises(ValueError):
+            self.clock.advance_to(0)
+
+    def test_emergency_election_forms_a_government(self):
+        system = PoliticalSystem()
+        for name, ideology, popularity in [("A", Ideology.LEFT, 4.0), ("B", Ideology.RIGHT, 1.0),
+                                           ("C", Ideology.CENTER, 1.0)]:
+            party = PoliticalParty(name, ideology)
+            party.popularity = popularity
+            system.register_party(party)
+
+        system.initiate_emergency_election()
+        self.assertEqual(system.election_date, 30)
+        system.hold_emergency_election()
+        self.assertFalse(system.can_form_government())  # Results are not final before election day
+
+        self.clock.advance_to(system.election_date)
+        self.assertTrue(system.can_form_government())
+        government = system.form_new_government()
+        self.assertEqual(government.formation_date, 30)
+        self.assertFalse(system.emergency_election_scheduled)
+
+    def test_government_needs_a_majority_party(self):
+        system = PoliticalSystem()
+        parties = [PoliticalParty(name, ideology) for name, ideology in
+                   [("A", Ideology.LEFT), ("B", Ideology.RIGHT), ("C", Ideology.CENTER)]]
+        for party in parties:
+            system.register_party(party)
+        system.initiate_emergency_election()
+        self.clock.advance_to(system.election_date)
+        # The two largest parties together hold a majority, but no single party does
+        system.election_results = dict(zip(parties, (0.45, 0.35, 0.2)))
+        self.assertFalse(system.can_form_government())
+        system.election_results = dict(zip(parties, (0.55, 0.3, 0.15)))
+        self.assertTrue(system.can_form_government())
+
+    def test_years_are_whole_months(self):
+        self.assertEqual(SimulationClock.days(years=3), SimulationClock.days(months=36))
+
+if __name__ == '__main__':
+    unittest.main()
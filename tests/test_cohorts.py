@@ -0,0 +1,192 @@
+import random
+import unittest
+import numpy as np
+
+from models.citizen import CitizenUpdateEngine
+from models.cohorts import CohortSociety, CohortTable, HybridSociety, clipped_moments
+from models.legislative import Parliament
+from models.media import MediaInfluenceEngine
+from models.population import PopulationStore, PopulationAggregates, DemographicSnapshot
+from models.political_party import PoliticalParty, Ideology
+from models.referendum import ReferendumSystem, ReferendumType
+from simulation import Simulation
+
+PARTY_TERMS = [(0.4, True), (-0.5, False), (0.0, True)]
+
+class TestCohortTable(unittest.TestCase):
+    def population(self, size=50_000):
+        store = PopulationStore()
+        store.add_random(size, np.random.default_rng(8))
+        return store
+
+    def test_from_store_keeps_counts_means_and_snapshot(self):
+        store = self.population()
+        aggregates = PopulationAggregates(store)
+        table = CohortTable.from_store(store)
+        self.assertEqual(len(table), len(store))
+        for name in ('happiness', 'trust_in_government', 'education_level'):
+            self.assertAlmostEqual(table.mean(name), store.column(name)[:len(store)].mean(), places=9)
+        self.assertEqual(table.snapshot(), DemographicSnapshot.from_aggregates(aggregates))
+        self.assertEqual(int(table.voters().sum()), int((store.column('age')[:len(store)] >= 16).sum()))
+
+    def test_age_edges_must_include_voting_and_tension_bands(self):
+        with self.assertRaises(ValueError):
+            CohortTable(age_edges=(18, 30, 60))
+
+    def test_clipped_moments_match_sampling(self):
+        samples = np.clip(np.random.default_rng(3).normal(90, 15, 1_000_000), 0, 100)
+        mean, variance = clipped_moments(np.array([90.0]), np.array([225.0]), 0, 100)
+        self.assertAlmostEqual(mean[0], samples.mean(), delta=0.05)
+        self.assertAlmostEqual(variance[0], samples.var(), delta=0.5)
+
+    def test_random_population_matches_store(self):
+        table = CohortTable()
+        table.add_random(200_000, np.random.default_rng(1))
+        store = self.population(200_000)
+        self.assertEqual(len(table), 200_000)
+        for name in ('happiness', 'satisfaction_level', 'education_level', 'health'):
+            self.assertAlmostEqual(table.mean(name), store.column(name)[:len(store)].mean(), delta=0.2)
+        young = table.snapshot().age_bands['young'] / len(table)
+        self.assertAlmostEqual(young, 30 / 91, delta=0.01)
+
+    def test_vital_statistics_follow_rates(self):
+        table = CohortTable()
+        table.add_random(1_000_000, np.random.default_rng(2))
+        births, deaths = table.apply_vital_statistics(np.random.default_rng(3), 0.012, 0.024,
+                                                      lambda ages: np.exp(0.085 * ages))
+        self.assertAlmostEqual(deaths, 2000, delta=200)
+        self.assertAlmostEqual(births, 1000, delta=150)
+        self.assertEqual(len(table), 1_000_000 + births - deaths)
+
+    def test_error_bound_against_agents(self):
+        # Same inputs for both modes over 48 months; bounds from the models/cohorts.py docstring
+        store = self.population()
+        table = CohortTable.from_store(store)
+        update = CitizenUpdateEngine(np.random.default_rng(1))
+        media = MediaInfluenceEngine(np.random.default_rng(2), passes=2)
+        inputs = random.Random(5)
+        bounds = {'happiness': 2.0, 'trust_in_government': 1.5, 'satisfaction_level': 1.5,
+                  'trust_in_institutions': 0.1, 'socioeconomic_rating': 0.1}
+        for month in range(48):
+            kernel = update.kernel({'growth': inputs.uniform(-0.02, 0.04)}, {'cohesion': inputs.uniform(0.3, 0.7)},
+                                   {'stability': inputs.uniform(0.4, 0.8)})
+            store.for_each_chunk([kernel])
+            table.update(np.random.default_rng(month), *kernel.terms)
+            kernel = media.kernel([{'sentiment': inputs.uniform(-1, 1)} for _ in range(inputs.randint(1, 5))])
+            store.for_each_chunk([kernel])
+            table.process_media_influence(kernel.sentiments, kernel.passes)
+            for name, bound in bounds.items():
+                self.assertLess(abs(table.mean(name) - store.column(name)[:len(store)].mean()), bound, (month, name))
+
+        voters = store.column('age')[:len(store)] >= 16
+        columns = {name: store.column(name)[:len(store)][voters] for name in ReferendumSystem.VOTER_COLUMNS}
+        ballots = ReferendumSystem.decide_columns(columns, np.random.default_rng(9), PARTY_TERMS, 0.2, True, True)
+        support = table.decide_referendum_vote(PARTY_TERMS, 0.2, True, True)
+        cohort_support = (support * table.voters()).sum() / table.voters().sum()
+        self.assertLess(abs(cohort_support - ballots.mean()), 0.005)
+
+class TestCohortSociety(unittest.TestCase):
+    def test_large_country_keeps_having_births(self):
+        # MAX_POPULATION is far below 20M; the cohort cap scales with the initial population
+        society = CohortSociety(20_000_000, rng=np.random.default_rng(7), vital_statistics=True)
+        self.assertGreaterEqual(society.max_population, 40_000_000)
+        births, deaths = society._apply_vital_statistics()
+        self.assertAlmostEqual(births, 20_000_000 * 0.011 / 12, delta=1000)
+        self.assertGreater(deaths, 0)
+
+class TestHybridSociety(unittest.TestCase):
+    def setUp(self):
+        self.society = HybridSociety(100_000, rng=np.random.default_rng(12), vital_statistics=True)
+
+    def test_sampled_citizens_are_materialized_once(self):
+        citizens = self.society.get_random_citizens(50)
+        self.assertEqual(len(citizens), 50)
+        self.assertEqual(len(self.society.store), 50)
+        self.assertEqual(len(self.society), 100_000)
+        self.assertEqual(len(self.society.cohorts), 100_000 - 50)
+        for citizen in citizens:
+            self.assertTrue(0 <= citizen.happiness <= 100)
+            self.assertTrue(-1 <= citizen.political_ideology <= 1)
+
+        # Later samples pick materialized citizens again in proportion to their numbers
+        self.society.get_random_citizens(100_000)
+        self.assertEqual(len(self.society.store), 100_000)
+        self.assertEqual(len(self.society.cohorts), 0)
+
+    def test_individuals_follow_the_monthly_update(self):
+        self.society.vital_statistics = False
+        citizen = self.society.get_random_citizens(1)[0]
+        age, citizen_id = citizen.age, citizen.id
+        for _ in range(3):
+            self.society.update_population()
+        self.society.aggregates.verify()
+        snapshot = self.society.get_demographic_snapshot()
+        self.assertEqual(snapshot.population, len(self.society))
+        self.assertEqual(sum(snapshot.age_bands.values()), len(self.society))
+        slots = np.flatnonzero(self.society.store.column('id')[:len(self.society.store)] == citizen_id)
+        if len(slots):  # Unless a decline batch took them
+            self.assertAlmostEqual(self.society.store.column('age')[slots[0]], age + 3 / 12)
+
+    def test_votes_are_audited_with_materialized_ballots(self):
+        system = ReferendumSystem(Parliament(100), rng=np.random.default_rng(4))
+        referendum = system.propose_referendum("Tax reform", "Economic tax reform", ReferendumType.NATIONAL)
+        system.start_referendum(referendum)
+        positions = {PoliticalParty("Union", Ideology.CENTER_RIGHT): 0.5}
+        voters = self.society.voter_count()
+        votes_for, votes_against = self.society.cast_votes(system, referendum, {'support_ratio': 0.6}, positions, audit=200)
+        self.assertEqual(votes_for + votes_against, voters)
+        self.assertEqual(len(referendum.audited_ballots), 200)
+        ids = set(self.society.store.column('id')[:len(self.society.store)].tolist())
+        self.assertTrue(set(referendum.audited_ballots) <= ids)
+
+    def test_repeated_audits_reuse_materialized_voters(self):
+        system = ReferendumSystem(Parliament(100), rng=np.random.default_rng(4))
+        positions = {PoliticalParty("Union", Ideology.CENTER_RIGHT): 0.5}
+        sizes = []
+        for number in range(5):
+            referendum = system.propose_referendum(f"Reform {number}", "Economic reform", ReferendumType.NATIONAL)
+            system.start_referendum(referendum)
+            self.society.cast_votes(system, referendum, {'support_ratio': 0.6}, positions, audit=200)
+            self.assertEqual(len(referendum.audited_ballots), 200)
+            sizes.append(len(self.society.store))
+        self.assertEqual(sizes, [200] * 5)  # One audit sample, not one per referendum
+
+class TestCohortSimulation(unittest.TestCase):
+    def run_simulation(self, population=20_000, months=3):
+        simulation = Simulation(seed=6, months=months, initial_population=population, quiet=True,
+                                population_mode='cohorts')
+        try:
+            return simulation.run(), simulation.society
+        finally:
+            simulation.cleanup()
+
+    def test_cohort_run_is_reproducible(self):
+        history, society = self.run_simulation()
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history[-1]['population'], len(society))
+        replay, _ = self.run_simulation()
+        self.assertEqual(replay[-1]['population'], history[-1]['population'])
+        self.assertEqual(replay[-1]['overall_stability'], history[-1]['overall_stability'])
+
+    def test_large_country_runs_in_cohort_memory(self):
+        history, society = self.run_simulation(population=20_000_000, months=2)
+        self.assertGreater(history[-1]['population'], 19_000_000)
+        self.assertEqual(len(society.store), 0)
+        table_bytes = society.cohorts.counts.nbytes * (1 + 2 * len(CohortTable.MOMENTS))
+        self.assertLess(table_bytes, 10_000_000)
+
+    def test_hybrid_run_materializes_audited_voters(self):
+        simulation = Simulation(seed=6, months=6, initial_population=20_000, quiet=True, population_mode='hybrid')
+        try:
+            history = simulation.run()
+        finally:
+            simulation.cleanup()
+        self.assertEqual(history[-1]['population'], len(simulation.society))
+        self.assertLess(len(simulation.society.store), len(simulation.society) // 5)
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Simulation(seed=1, months=1, initial_population=100, quiet=True, population_mode='households')
+
+if __name__ == '__main__':
+    unittest.main()
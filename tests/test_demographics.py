@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+
+from models.demographics import DemographicEngine
+from models.population import PopulationStore, PopulationAggregates, VoterRoll
+from models.society import SocietySystem
+
+class TestDemographicEngine(unittest.TestCase):
+    def setUp(self):
+        self.store = PopulationStore()
+        self.engine = DemographicEngine(np.random.default_rng(5))
+        self.engine.grow(self.store, 5000)
+
+    def test_decline_removes_exact_count_weighted_to_elderly(self):
+        ages_before = self.store.column('age').mean()
+        removed = self.engine.decline(self.store, 500)
+        self.assertEqual(len(removed), 500)
+        self.assertEqual(len(self.store), 4500)
+        self.assertFalse(np.isin(removed, self.store.column('id')).any())
+        self.assertLess(self.store.column('age').mean(), ages_before)
+
+    def test_decline_in_chunks_removes_the_same_citizens(self):
+        def removed(chunk_rows):
+            store = PopulationStore()
+            engine = DemographicEngine(np.random.default_rng(5))
+            engine.grow(store, 5000)
+            engine.CHUNK_ROWS = chunk_rows
+            return engine.decline(store, 700)
+        np.testing.assert_array_equal(removed(128), removed(DemographicEngine.CHUNK_ROWS))
+
+    def test_release_refills_from_tail_and_keeps_indexes_in_sync(self):
+        aggregates = PopulationAggregates(self.store)
+        roll = VoterRoll(self.store)
+        roll.slots()
+        capacity = self.store.capacity
+        tail_id = self.store.column('id')[-1]
+        self.store.view(4999).media_usage = {'radio': 5}
+
+        self.store.release(np.array([0, 10, 4999, 4998]))
+        self.assertEqual(len(self.store), 4996)
+        self.assertEqual(self.store.capacity, capacity)
+        self.assertNotIn(tail_id, self.store.column('id'))
+        self.engine.decline(self.store, 300)
+        self.engine.grow(self.store, 400)
+
+        aggregates.verify()
+        expected = [slot for slot in range(len(self.store)) if self.store.view(slot).has_voting_rights()]
+        self.assertEqual(roll.slots().tolist(), expected)
+
+    def test_vital_statistics_follow_config_rates(self):
+        self.engine.grow(self.store, 195000)
+        births, deaths = self.engine.apply_vital_statistics(self.store, months=12)
+        self.assertAlmostEqual(births / 200000, self.engine.birth_rate, delta=0.002)
+        self.assertAlmostEqual(deaths / 200000, self.engine.death_rate, delta=0.002)
+        self.assertEqual(len(self.store), 200000 + births - deaths)
+        self.assertTrue((self.store.column('age')[-births:] == 0).all())
+
+    def test_births_stop_at_the_given_cap(self):
+        births, deaths = self.engine.apply_vital_statistics(self.store, months=12, max_population=5000)
+        self.assertLessEqual(births, deaths)
+        self.assertLessEqual(len(self.store), 5000)
+
+        society = SocietySystem(20000, rng=np.random.default_rng(2))
+        society.max_population = 10000
+        births, _ = society._apply_vital_statistics()
+        self.assertEqual(births, 0)
+
+if __name__ == '__main__':
+    unittest.main()
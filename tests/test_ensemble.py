@@ -0,0 +1,32 @@
+import unittest
+import numpy as np
+
+from ensemble import EnsembleRunner, EnsembleResult, METRICS
+
+class TestEnsembleRunner(unittest.TestCase):
+    def test_replicas_are_reproducible_across_worker_counts(self):
+        def run(workers):
+            return EnsembleRunner(3, seed=11, workers=workers, months=4, initial_population=300).run()
+
+        serial, pooled = run(1), run(2)
+        self.assertEqual(serial.values.shape, (3, 4, len(METRICS)))
+        np.testing.assert_array_equal(serial.values, pooled.values)
+        self.assertEqual(len(set(serial.seeds)), 3)
+        # Distinct seeds give distinct trajectories
+        self.assertFalse(np.array_equal(serial.metric('gdp')[0], serial.metric('gdp')[1]))
+
+    def test_statistics_skip_months_without_referendums(self):
+        values = np.full((4, 2, len(METRICS)), np.nan)
+        support = METRICS.index('referendum_support')
+        values[:, 0, support] = [0.2, 0.4, 0.6, 0.8]
+        result = EnsembleResult(values, seeds=range(4))
+
+        self.assertAlmostEqual(result.mean('referendum_support')[0], 0.5)
+        self.assertTrue(np.isnan(result.mean('referendum_support')[1]))
+        lower, upper = result.confidence_band('referendum_support')
+        self.assertLess(lower[0], 0.5)
+        self.assertGreater(upper[0], 0.5)
+        self.assertAlmostEqual(result.quantiles('referendum_support', [0.5])[0, 0], 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 from datetime import datetime
 
@@ -18,6 +19,9 @@ import logging
 class TestSocietyIntegration(unittest.TestCase):
     def setUp(self):
         """Set up test environment with all major components"""
+        # The models draw from the global random module outside a seeded Simulation run
+        random.seed(1)
+
         # Configure logging for console only
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
@@ -0,0 +1,88 @@
+import unittest
+import numpy as np
+
+from models.citizen import CitizenUpdateEngine
+from models.kernels import ColumnKernel
+from models.media import MediaInfluenceEngine
+from models.population import PopulationStore, PopulationAggregates
+from models.rng import SimulationRNG
+from sharding import ShardedExecutor
+from simulation import Simulation
+
+NEWS_CYCLE = [{'sentiment': s} for s in (-0.6, 0.4, 0.7)]
+ECONOMY = {'gdp_growth': 0.02}
+POLICIES = ['ECONOMY', 'HEALTHCARE']
+SOCIAL = {'citizen_satisfaction': 0.5, 'social_cohesion': 0.6, 'media_trust': 0.4}
+
+class Halve(ColumnKernel):
+    """Draw-free kernel: halves happiness"""
+    COLUMNS = UPDATES = ('happiness',)
+
+    def run(self, columns, rng):
+        columns['happiness'] *= 0.5
+
+class TestForEachChunk(unittest.TestCase):
+    def population(self):
+        store = PopulationStore()
+        store.add_random(2000, np.random.default_rng(4))
+        return store, PopulationAggregates(store)
+
+    def engines(self):
+        streams = SimulationRNG(21, shard_size=256)
+        return (streams, CitizenUpdateEngine(streams.sharded('citizen_update')),
+                MediaInfluenceEngine(streams.sharded('media'), passes=2))
+
+    def test_fused_sweep_matches_separate_passes(self):
+        separate, _ = self.population()
+        _, update, media = self.engines()
+        update.apply(separate, ECONOMY, POLICIES, SOCIAL)
+        media.apply(separate, NEWS_CYCLE)
+
+        fused, aggregates = self.population()
+        _, update, media = self.engines()
+        fused.for_each_chunk([update.kernel(ECONOMY, POLICIES, SOCIAL), media.kernel(NEWS_CYCLE), Halve()])
+
+        aggregates.verify()  # Refreshed from the per-chunk totals
+        np.testing.assert_array_equal(fused.column('happiness'), separate.column('happiness') * 0.5)
+        for name in ('age', 'trust_in_institutions', 'trust_in_government', 'satisfaction_level'):
+            np.testing.assert_array_equal(fused.column(name), separate.column(name))
+
+    def test_chunks_must_match_sharded_streams(self):
+        store, _ = self.population()
+        _, update, _ = self.engines()
+        with self.assertRaises(ValueError):
+            store.for_each_chunk([update.kernel(ECONOMY, None, None)], chunk_size=512)
+        store.for_each_chunk([Halve()], chunk_size=300)  # Draw-free kernels take any chunk size
+
+    def test_executor_sweep_is_bit_identical_to_serial(self):
+        serial, _ = self.population()
+        _, update, media = self.engines()
+        serial.for_each_chunk([update.kernel(ECONOMY, POLICIES, SOCIAL), media.kernel(NEWS_CYCLE)])
+
+        parallel, aggregates = self.population()
+        streams, update, media = self.engines()
+        with ShardedExecutor(streams, 2) as executor:
+            executor.sweep(parallel, [update.kernel(ECONOMY, POLICIES, SOCIAL), media.kernel(NEWS_CYCLE)])
+            aggregates.verify()
+        for name in ('happiness', 'age', 'trust_in_government', 'satisfaction_level'):
+            np.testing.assert_array_equal(parallel.column(name), serial.column(name))
+
+class TestFusedSimulation(unittest.TestCase):
+    def run_simulation(self):
+        simulation = Simulation(seed=4, months=3, initial_population=1000, quiet=True, fused_sweep=True)
+        try:
+            history = simulation.run()
+            return history, simulation.society.store.column('trust_in_government').copy()
+        finally:
+            simulation.cleanup()
+
+    def test_fused_run_is_reproducible(self):
+        history, trust = self.run_simulation()
+        self.assertEqual(len(history), 3)
+        replay_history, replay_trust = self.run_simulation()
+        self.assertEqual(replay_history[-1]['gdp'], history[-1]['gdp'])
+        self.assertEqual(replay_history[-1]['overall_stability'], history[-1]['overall_stability'])
+        np.testing.assert_array_equal(replay_trust, trust)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import random
+import numpy as np
+
+from models.citizen import Citizen
+from models.media import MediaInfluenceEngine
+from models.population import PopulationStore
+
+class TestMediaInfluenceEngine(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.citizens = [Citizen(30, 'Female', 'Region_2') for _ in range(3000)]
+        self.news_cycle = [{'sentiment': s} for s in (-0.7, 0.6, -0.8, 0.2, 0.5)]
+
+    def test_matches_scalar_media_influence(self):
+        store = PopulationStore.from_citizens(self.citizens)
+        MediaInfluenceEngine(np.random.default_rng(3)).apply(store, self.news_cycle)
+        for citizen in self.citizens:
+            citizen.process_media_influence(self.news_cycle)
+
+        for name in ('trust_in_government', 'satisfaction_level'):
+            scalar = np.array([getattr(citizen, name) for citizen in self.citizens])
+            batched = store.column(name)
+            self.assertTrue(((batched >= 0) & (batched <= 100)).all())
+            stderr = np.sqrt(scalar.var() / len(scalar) + batched.var() / len(batched))
+            self.assertLess(abs(scalar.mean() - batched.mean()), 5 * stderr, name)
+
+    def test_double_pass_in_one_sweep(self):
+        single = PopulationStore.from_citizens(self.citizens)
+        double = PopulationStore.from_citizens(self.citizens)
+
+        engine = MediaInfluenceEngine(np.random.default_rng(11))
+        engine.apply(single, self.news_cycle)
+        engine.apply(single, self.news_cycle)
+        MediaInfluenceEngine(np.random.default_rng(11), passes=2).apply(double, self.news_cycle)
+
+        np.testing.assert_array_equal(single.column('trust_in_government'), double.column('trust_in_government'))
+        np.testing.assert_array_equal(single.column('satisfaction_level'), double.column('satisfaction_level'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import unittest
+import random
+import numpy as np
+
+from models.citizen import Citizen, CitizenshipStatus, CitizenUpdateEngine, Religion
+from models.population import PopulationStore, PopulationAggregates, VoterRoll, CitizenView
+from models.society import SocietySystem
+
+class TestPopulationStore(unittest.TestCase):
+    def setUp(self):
+        self.store = PopulationStore()
+        self.store.add_random(500, np.random.default_rng(1))
+
+    def test_columns_are_contiguous_arrays(self):
+        happiness = self.store.column('happiness')
+        self.assertEqual(len(happiness), 500)
+        self.assertEqual(happiness.dtype, np.float64)
+        self.assertTrue(happiness.flags['C_CONTIGUOUS'])
+        self.assertTrue(((happiness >= 40) & (happiness <= 80)).all())
+        self.assertEqual(len(set(self.store.column('id'))), 500, "Citizen ids should be unique")
+
+    def test_view_reads_and_writes_through_to_columns(self):
+        citizen = self.store.view(7)
+        citizen.happiness = 12.5
+        self.assertEqual(self.store.column('happiness')[7], 12.5)
+
+        # Existing Citizen methods operate on the proxy unchanged
+        citizen.update({'gdp_growth': 0.0}, None, None)
+        self.assertAlmostEqual(self.store.column('age')[7], citizen.age)
+        self.assertTrue(0 <= self.store.column('happiness')[7] <= 100)
+        self.assertEqual(citizen.media_usage, {})
+
+    def test_standalone_citizens_round_trip(self):
+        citizen = Citizen(40, 'Female', 'Region_3')
+        citizen.citizenship_status = CitizenshipStatus.PERMANENT_RESIDENT
+        citizen.media_usage = {'tv': 30}
+        slot = self.store.add_citizen(citizen)
+
+        view = self.store.view(slot)
+        self.assertIsInstance(view, CitizenView)
+        self.assertEqual(view.id, citizen.id)
+        self.assertEqual(view.happiness, citizen.happiness)
+        self.assertEqual(view.media_usage, {'tv': 30})
+        self.assertFalse(view.has_voting_rights())
+
+    def test_categorical_columns_are_coded(self):
+        self.assertEqual(self.store.column('religion').dtype, np.uint8)
+        citizen = self.store.view(4)
+        citizen.region = 'Capital'  # Unseen values extend the lookup table
+        citizen.employment_status = 'Employed'
+        self.assertEqual(citizen.region, 'Capital')
+        self.assertEqual(citizen.employment_status, 'Employed')
+        self.assertIsInstance(citizen.religion, Religion)
+        self.assertEqual(self.store.decoded('region')[4], 'Capital')
+        self.assertFalse(hasattr(Citizen(30, 'Male', 'Region_1'), '__dict__'))
+
+    def test_remove_compacts_rows(self):
+        removed_id = self.store.column('id')[3]
+        last_id = self.store.column('id')[-1]
+        self.store.remove(np.array([3]))
+        self.assertEqual(len(self.store), 499)
+        self.assertNotIn(removed_id, self.store.column('id'))
+        self.assertEqual(self.store.column('id')[-1], last_id)
+
+class TestCitizenUpdateEngine(unittest.TestCase):
+    def test_statistically_equivalent_to_scalar_update(self):
+        """Batched kernel and Citizen.update should produce the same distributions"""
+        random.seed(7)
+        citizens = [Citizen(40, 'Male', 'Region_1') for _ in range(4000)]
+        store = PopulationStore.from_citizens(citizens)
+        engine = CitizenUpdateEngine(np.random.default_rng(7))
+
+        economy = {'gdp_growth': 0.02}
+        policies = ['ECONOMY', 'SOCIAL_WELFARE', 'HEALTHCARE']
+        social_environment = {'citizen_satisfaction': 0.6, 'social_cohesion': 0.5, 'media_trust': 0.4}
+        for _ in range(6):
+            for citizen in citizens:
+                citizen.update(economy, policies, social_environment)
+            engine.apply(store, economy, policies, social_environment)
+
+        for name in ('happiness', 'socioeconomic_rating', 'trust_in_institutions',
+                     'economic_satisfaction', 'social_satisfaction', 'health'):
+            scalar = np.array([getattr(citizen, name) for citizen in citizens], dtype=float)
+            batched = store.column(name)
+            # Means within 5 standard errors, spreads within 10%
+            stderr = np.sqrt(scalar.var() / len(scalar) + batched.var() / len(batched)) + 1e-9
+            self.assertLess(abs(scalar.mean() - batched.mean()), 5 * stderr, name)
+            self.assertAlmostEqual(batched.std(), scalar.std(), delta=0.1 * scalar.std() + 1e-9, msg=name)
+        np.testing.assert_allclose(store.column('age'), [citizen.age for citizen in citizens])
+
+class TestPopulationAggregates(unittest.TestCase):
+    def test_aggregates_track_adds_removes_and_updates(self):
+        store = PopulationStore()
+        aggregates = PopulationAggregates(store)
+        rng = np.random.default_rng(2)
+        store.add_random(1000, rng)
+        store.remove_last(100)
+        store.remove(np.arange(0, 900, 7))
+        store.view(5).happiness = 99.0
+        store.view(6).age = 75
+        store.view(8).religion = store.view(9).religion
+        CitizenUpdateEngine(rng).apply(store, {'gdp_growth': 0.01}, ['HEALTHCARE'], {'media_trust': 0.5})
+
+        aggregates.verify()
+        self.assertAlmostEqual(aggregates.mean('happiness'), store.column('happiness').mean())
+        self.assertEqual(sum(aggregates.age_bands.values()), len(store))
+
+    def test_verify_detects_drift(self):
+        store = PopulationStore()
+        aggregates = PopulationAggregates(store)
+        store.add_random(10, np.random.default_rng(0))
+        store.column('happiness')[0] += 10  # Direct write without mark_updated
+        with self.assertRaises(RuntimeError):
+            aggregates.verify()
+
+class TestVoterRoll(unittest.TestCase):
+    def test_roll_matches_has_voting_rights(self):
+        store = PopulationStore()
+        rng = np.random.default_rng(3)
+        store.add_random(800, rng)
+        roll = VoterRoll(store)
+        roll.slots()  # Materialize so later changes patch the cached index
+        engine = CitizenUpdateEngine(rng)
+        for _ in range(24):  # Two years of ageing moves minors onto the roll
+            engine.apply(store, {'gdp_growth': 0.0}, None, None)
+        store.add_random(50, rng)
+        store.remove_last(20)
+        store.view(0).citizenship_status = CitizenshipStatus.TEMPORARY_RESIDENT
+        store.view(1).age = 10
+
+        expected = [slot for slot in range(len(store)) if store.view(slot).has_voting_rights()]
+        self.assertEqual(roll.slots().tolist(), expected)
+        self.assertEqual(len(roll), len(expected))
+        store.remove(np.array([2, 3]))
+        self.assertEqual(roll.slots().tolist(),
+                         [slot for slot in range(len(store)) if store.view(slot).has_voting_rights()])
+
+class TestSocietyColumns(unittest.TestCase):
+    def test_citizens_assignment_rebuilds_store(self):
+        society = SocietySystem(50)
+        kept = society.citizens[:3]
+        kept_ids = [citizen.id for citizen in kept]
+        society.citizens = kept
+        self.assertEqual(len(society.citizens), 3)
+        self.assertEqual([citizen.id for citizen in society.citizens], kept_ids)
+
+if __name__ == '__main__':
+    unittest.main()
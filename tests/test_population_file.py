@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from models.population import PopulationStore
+from models.population_file import (MappedColumnAllocator, create_population, has_population,
+                                    make_private, open_population)
+from models.society import SocietySystem
+from simulation import Simulation
+
+class TestPopulationFile(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'population')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_columns_grow_in_place_and_reopen(self):
+        store = create_population(self.path, capacity=100)
+        store.add_random(100, np.random.default_rng(1))
+        store.add_random(2000, np.random.default_rng(2))  # Past capacity: files are extended
+        self.assertIsInstance(store.columns['age'], np.memmap)
+        self.assertFalse(has_population(self.path))
+        store.allocator.sync(store)
+        self.assertTrue(has_population(self.path))
+
+        reopened = open_population(self.path)
+        self.assertEqual(len(reopened), 2100)
+        self.assertEqual(reopened._next_id, store._next_id)
+        for name in store.columns:
+            np.testing.assert_array_equal(reopened.column(name), store.column(name))
+
+    def test_private_writes_stay_out_of_the_files(self):
+        store = create_population(self.path, capacity=10)
+        store.add_random(10, np.random.default_rng(1))
+        store.allocator.sync(store)
+        original = store.column('happiness').copy()
+
+        make_private(store)
+        store.column('happiness')[:] = -1.0
+        store.add_random(50, np.random.default_rng(2))  # Growth moves the private store into memory
+        self.assertNotIsInstance(store.columns['happiness'], np.memmap)
+        np.testing.assert_array_equal(open_population(self.path).column('happiness'), original)
+
+    def test_society_restarts_from_its_population_file(self):
+        society = SocietySystem(500, rng=np.random.default_rng(3), population_file=self.path)
+        society.update_population()
+        society.sync_population_file()
+        restarted = SocietySystem(10, rng=np.random.default_rng(4), population_file=self.path)
+        self.assertEqual(len(restarted.store), len(society.store))
+        self.assertEqual(restarted.aggregates.mean('happiness'), society.aggregates.mean('happiness'))
+        np.testing.assert_array_equal(restarted.store.column('id'), society.store.column('id'))
+
+    def test_file_backed_run_matches_in_memory_run(self):
+        def run(population_file):
+            simulation = Simulation(seed=8, months=4, initial_population=2000, quiet=True,
+                                    population_file=population_file)
+            simulation.run()
+            simulation.cleanup()
+            return simulation
+        mapped, in_memory = run(self.path), run(None)
+        self.assertIsInstance(mapped.society.store.allocator, MappedColumnAllocator)
+        self.assertEqual(mapped.history[-1]['gdp'], in_memory.history[-1]['gdp'])
+        np.testing.assert_array_equal(mapped.society.store.column('happiness'),
+                                      in_memory.society.store.column('happiness'))
+        self.assertEqual(len(open_population(self.path)), len(in_memory.society.store))
+
+    def test_sharded_run_writes_its_population_file_back(self):
+        simulation = Simulation(seed=8, months=6, initial_population=3000, quiet=True, workers=2,
+                                population_file=self.path)
+        try:
+            simulation.run()
+        finally:
+            simulation.cleanup()
+        store = simulation.society.store
+        self.assertIsInstance(store.allocator, MappedColumnAllocator)
+        reopened = open_population(self.path)
+        self.assertEqual(len(reopened), len(store))
+        np.testing.assert_array_equal(reopened.column('happiness'), store.column('happiness'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from profiling import PhaseProfiler
+from simulation import Simulation
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_profiled(self, profiler, months=4):
+        simulation = Simulation(seed=5, months=months, initial_population=300, quiet=True, profiler=profiler)
+        try:
+            simulation.run()
+        finally:
+            simulation.cleanup()
+        return simulation
+
+    def test_every_phase_is_timed_per_month(self):
+        profiler = PhaseProfiler()
+        self.run_profiled(profiler)
+        totals = profiler.totals()
+        for phase in ('setup', 'update_population', 'news_cycle', 'apply_media', 'indicators'):
+            self.assertIn(phase, totals)
+        self.assertEqual(totals['update_population']['calls'], 4)
+        self.assertEqual(totals['setup']['calls'], 1)
+
+        months = {row['month'] for row in profiler.rows() if row['phase'] == 'news_cycle'}
+        self.assertEqual(months, {1, 2, 3, 4})
+        self.assertEqual(profiler.rows()[0]['month'], 'setup')
+
+    def test_exports(self):
+        profiler = PhaseProfiler(memory=True)
+        self.run_profiled(profiler, months=2)
+        self.assertGreater(profiler.totals()['setup']['peak_bytes'], 0)
+
+        table = os.path.join(self.directory.name, 'profile.csv')
+        collapsed = os.path.join(self.directory.name, 'profile.collapsed')
+        profiler.write_table(table)
+        profiler.write_collapsed(collapsed)
+        with open(table) as handle:
+            self.assertTrue(handle.readline().startswith('month,phase,wall_s'))
+        with open(collapsed) as handle:
+            lines = handle.read().splitlines()
+        self.assertIn('run;news_cycle;apply_media', [line.rsplit(' ', 1)[0] for line in lines])
+
+    def test_profiling_does_not_change_the_run(self):
+        plain = self.run_profiled(None)
+        profiled = self.run_profiled(PhaseProfiler())
+        self.assertEqual(plain.history[-1]['gdp'], profiled.history[-1]['gdp'])
+
+    def test_checkpoint_with_profiler(self):
+        simulation = Simulation(seed=5, months=2, initial_population=300, quiet=True, profiler=PhaseProfiler())
+        simulation.setup()
+        simulation.step(0)
+        path = os.path.join(self.directory.name, 'checkpoint')
+        simulation.checkpoint(path)
+        simulation.cleanup()
+
+        profiler = PhaseProfiler()
+        restored = Simulation(quiet=True, profiler=profiler).restore(path)
+        restored.run()
+        restored.cleanup()
+        self.assertEqual(profiler.totals()['update_population']['calls'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from recorder import TimeSeriesRecorder, flatten, read_series
+from simulation import Simulation
+
+class TestTimeSeriesRecorder(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'series')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_chunks_are_committed_as_they_fill(self):
+        recorder = TimeSeriesRecorder(self.path, chunk_rows=4)
+        for month in range(10):
+            recorder.append({'month': month, 'gdp': month * 1.5, 'crisis': month > 5})
+        self.assertEqual(len(read_series(self.path)['month']), 8)  # Two full chunks on disk
+        recorder.close()
+
+        series = read_series(self.path)
+        self.assertEqual(recorder.chunks, [4, 4, 2])
+        np.testing.assert_array_equal(series['month'], np.arange(10))
+        np.testing.assert_array_equal(series['gdp'], np.arange(10) * 1.5)
+        self.assertEqual(series['crisis'].dtype, np.bool_)
+        self.assertIsInstance(series['gdp'], np.memmap)
+        self.assertNotIsInstance(read_series(self.path, mmap=False)['gdp'], np.memmap)
+
+    def test_schema_is_fixed_by_the_first_record(self):
+        recorder = TimeSeriesRecorder(self.path)
+        recorder.append({'month': 1, 'gdp': 2.0})
+        recorder.append({'month': 2})  # Missing float: NaN
+        with self.assertRaises(ValueError):
+            recorder.append({'month': 3, 'gdp': 1.0, 'new': 1.0})
+        with self.assertRaises(ValueError):
+            recorder.append({'gdp': 1.0})  # Integers have no missing value
+        with self.assertRaises(TypeError):
+            recorder.append({'month': 3.5, 'gdp': 1.0})
+        recorder.close()
+        self.assertTrue(np.isnan(read_series(self.path)['gdp'][1]))
+
+        with self.assertRaises(TypeError):
+            TimeSeriesRecorder(os.path.join(self.directory.name, 'text')).append({'gdp': '1.00'})
+
+    def test_flatten(self):
+        self.assertEqual(flatten({'month': 1, 'state': {'economic': {'gdp': 2.0}, 'overall': 0.5}}),
+                         {'month': 1, 'state.economic.gdp': 2.0, 'state.overall': 0.5})
+
+    def test_simulation_records_every_month(self):
+        recorder = TimeSeriesRecorder(self.path, chunk_rows=4)
+        simulation = Simulation(seed=3, months=6, initial_population=300, quiet=True, recorder=recorder)
+        simulation.run()
+        simulation.cleanup()
+
+        series = read_series(self.path)
+        np.testing.assert_array_equal(series['month'], np.arange(1, 7))
+        np.testing.assert_array_equal(series['gdp'], [indicators['gdp'] for indicators in simulation.history])
+        for name in ('day', 'state.social.public_trust', 'economy.unemployment_rate', 'bank.exchange_rate'):
+            self.assertEqual(len(series[name]), 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import random
+import numpy as np
+
+from models.citizen import Citizen
+from models.legislative import Parliament
+from models.political_party import PoliticalParty, Ideology
+from models.population import PopulationStore
+from models.referendum import ReferendumSystem, ReferendumType, ReferendumStatus
+
+class TestBulkReferendumVoting(unittest.TestCase):
+    def setUp(self):
+        self.system = ReferendumSystem(Parliament(100), rng=np.random.default_rng(5))
+        self.referendum = self.system.propose_referendum(
+            "Education budget", "Increase the education budget", ReferendumType.NATIONAL
+        )
+        self.system.start_referendum(self.referendum)
+        random.seed(5)
+        self.citizens = [Citizen(40, 'Male', 'Region_1') for _ in range(5000)]
+        self.columns = {
+            name: PopulationStore.from_citizens(self.citizens).column(name)
+            for name in ReferendumSystem.VOTER_COLUMNS
+        }
+
+    def test_matches_per_voter_decisions(self):
+        coverage = {'support_ratio': 0.8}
+        party_positions = {PoliticalParty("Greens", Ideology.LEFT): 0.4}
+        ballots = [citizen.decide_referendum_vote(self.referendum, coverage, party_positions)
+                   for citizen in self.citizens]
+        expected_share = sum(bool(ballot) for ballot in ballots) / len(ballots)
+
+        votes_for, votes_against = self.system.cast_bulk(self.referendum, self.columns, coverage, party_positions)
+        self.assertEqual(votes_for + votes_against, len(self.citizens))
+        self.assertAlmostEqual(votes_for / len(self.citizens), expected_share, delta=0.03)
+        self.assertEqual(self.referendum.votes_for, votes_for)
+
+    def test_aligned_voters_follow_party_and_ballots_are_returned(self):
+        self.columns['political_ideology'][:] = 0.3
+        party_positions = {PoliticalParty("Union", Ideology.CENTER_RIGHT): -0.5}
+        votes_for, votes_against, ballots = self.system.cast_bulk(
+            self.referendum, self.columns, {}, party_positions, return_ballots=True
+        )
+        # A non-zero party position counts as support, exactly as in vote()
+        self.assertEqual(votes_for, len(self.citizens))
+        self.assertEqual(votes_against, 0)
+        self.assertTrue(ballots.all())
+
+    def test_inactive_referendum_records_nothing(self):
+        self.referendum.status = ReferendumStatus.PROPOSED
+        self.assertEqual(self.system.cast_bulk(self.referendum, self.columns, {}, {}), (0, 0))
+        self.assertEqual(self.system.cast_random_bulk(self.referendum, 1000), (0, 0))
+        self.assertEqual(self.referendum.votes_for + self.referendum.votes_against, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+
+from models.bank_national import MonetaryPolicy
+from recorder import TimeSeriesRecorder, read_series
+from scenarios import Austerity, BASELINE, Scenario, ScenarioRunner, SetMonetaryPolicy
+from simulation import Simulation
+
+def comparable(trajectory):
+    # NaN (no referendum that month) never equals itself
+    return [{name: None if value != value else value for name, value in indicators.items()}
+            for indicators in trajectory]
+
+class TestScenarioRunner(unittest.TestCase):
+    def setUp(self):
+        self.simulation = Simulation(seed=8, months=6, initial_population=400, quiet=True)
+        self.simulation.setup()
+        for month in range(3):
+            self.simulation.step(month)
+
+    def tearDown(self):
+        self.simulation.cleanup()
+
+    def test_branches_leave_the_parent_untouched_and_baseline_matches_it(self):
+        scenarios = [Scenario('austerity', [Austerity()]),
+                     Scenario('contraction', [SetMonetaryPolicy(MonetaryPolicy.CONTRACTIONARY)])]
+        results = ScenarioRunner(self.simulation, workers=2).run(scenarios, months=3)
+
+        self.assertEqual(len(self.simulation.history), 3)
+        self.assertEqual([indicators['month'] for indicators in results.trajectories['austerity']], [4, 5, 6])
+        self.simulation.run()
+        self.assertEqual(comparable(results.trajectories[BASELINE]), comparable(self.simulation.history[3:]))
+        if self.simulation.government is not None:
+            self.assertLess(results.diff('austerity', 'government_approval')[0], 0)
+
+    def test_checkpoint_fallback_matches_fork(self):
+        runner = ScenarioRunner(self.simulation, workers=1)
+        branches = [Scenario(BASELINE), Scenario('austerity', [Austerity()])]
+        restored, forked = runner._run_restored(branches, 2), runner._run_forked(branches, 2)
+        for branch in branches:
+            self.assertEqual(comparable(restored[branch.name]), comparable(forked[branch.name]))
+
+class TestScenarioRecorder(unittest.TestCase):
+    def test_branches_leave_the_parent_series_untouched(self):
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = TimeSeriesRecorder(directory, chunk_rows=1)
+            simulation = Simulation(seed=8, months=6, initial_population=400, quiet=True, recorder=recorder)
+            try:
+                simulation.setup()
+                for month in range(3):
+                    simulation.step(month)
+                ScenarioRunner(simulation, workers=2).run([Scenario('austerity', [Austerity()])], months=3)
+                self.assertEqual(read_series(directory)['month'].tolist(), [1, 2, 3])
+                self.assertEqual(len(recorder), 3)
+            finally:
+                simulation.cleanup()
+
+if __name__ == '__main__':
+    unittest.main()
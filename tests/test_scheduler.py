@@ -0,0 +1,103 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from config import DAYS_PER_MONTH
+from models.scheduler import EventScheduler, monthly_rate
+from simulation import Simulation
+
+class TestEventScheduler(unittest.TestCase):
+    def test_events_fire_in_time_then_priority_order(self):
+        scheduler = EventScheduler()
+        fired = []
+        scheduler.at(5, fired.append, 'late')
+        scheduler.at(2, fired.append, 'second', priority=1)
+        scheduler.at(2, fired.append, 'first', priority=0)
+        scheduler.every(3, fired.append, 'tick', start=1, priority=2)
+
+        self.assertEqual(scheduler.run_until(6), 5)
+        self.assertEqual(fired, ['tick', 'first', 'second', 'tick', 'late'])
+        self.assertEqual(scheduler.now, 6)
+
+    def test_cancelled_events_do_not_fire(self):
+        scheduler = EventScheduler()
+        fired = []
+        recurring = scheduler.every(1, fired.append, 'tick')
+        scheduler.at(2, recurring.cancel)
+        scheduler.run_until(10)
+        self.assertEqual(fired, ['tick', 'tick'])  # Day 2's tick is cancelled before it fires
+        self.assertEqual(len(scheduler), 0)
+
+    def test_skipped_events_keep_their_cadence(self):
+        scheduler = EventScheduler()
+        fired = []
+        scheduler.every(10, lambda: fired.append(('tick', scheduler.now)), start=5)
+        scheduler.at(12, lambda: fired.append(('once', scheduler.now)))
+        scheduler.at(40, lambda: fired.append(('later', scheduler.now)))
+        scheduler.run_until(10)
+        self.assertEqual(scheduler.skip_until(30), 2)
+        scheduler.run_until(50)
+        self.assertEqual(fired, [('tick', 5), ('once', 30), ('tick', 35), ('later', 40), ('tick', 45)])
+
+    def test_poisson_process_matches_monthly_probability(self):
+        random.seed(3)
+        scheduler = EventScheduler()
+        days = []
+        scheduler.poisson(monthly_rate(0.3, 30), lambda: days.append(scheduler.now))
+        scheduler.run_until(30 * 2000)
+        months_with_events = len({day // 30 for day in days})
+        self.assertAlmostEqual(months_with_events / 2000, 0.3, delta=0.04)
+
+    def test_skipped_processes_are_drawn_again(self):
+        random.seed(5)
+        scheduler = EventScheduler()
+        days = []
+        scheduler.poisson(1.0, lambda: days.append(scheduler.now))
+        scheduler.run_until(10)
+        pending = [entry[3] for entry in scheduler._queue if not entry[3].cancelled]
+        self.assertTrue(all(10 <= event.time < 30 for event in pending))
+        scheduler.skip_until(30)
+        self.assertTrue(all(event.cancelled for event in pending))
+        scheduler.run_until(60)
+        self.assertNotIn(30, days)  # Not all piled up on the boundary
+        self.assertFalse([day for day in days if 10 <= day <= 30])
+        self.assertTrue([day for day in days if day > 30])
+
+    def test_bernoulli_process_fires_at_most_once_per_period(self):
+        random.seed(3)
+        scheduler = EventScheduler()
+        days = []
+        scheduler.bernoulli(0.3, 30, lambda: days.append(scheduler.now))
+        scheduler.run_until(30 * 2000)
+        self.assertEqual(len(days), len(set(days)))
+        self.assertTrue(all(day % 30 == 0 for day in days))
+        self.assertAlmostEqual(len(days) / 2000, 0.3, delta=0.03)
+
+class PhaseLog:
+    """Stands in for a PhaseProfiler to record the handlers that ran"""
+    def __init__(self):
+        self.phases = []
+
+    def call(self, name, handler, *args):
+        self.phases.append(name)
+        return handler(*args)
+
+class TestSimulationSchedule(unittest.TestCase):
+    def test_dissolution_skips_the_rest_of_the_month(self):
+        simulation = Simulation(seed=3, months=2, initial_population=200, quiet=True)
+        try:
+            simulation.setup()
+            log = simulation.scheduler.profiler = PhaseLog()
+            with patch.object(simulation.government, 'check_dissolution', return_value=True):
+                simulation.scheduler.run_until(DAYS_PER_MONTH)
+            # Everything ordered after the government waits for the next month
+            self.assertEqual(log.phases[-1], 'update_government')
+            self.assertIn('update_economy', log.phases)
+            self.assertIsNone(simulation.government)
+            self.assertTrue(all(entry[0] >= DAYS_PER_MONTH for entry in simulation.scheduler._queue
+                                if not entry[3].cancelled))
+        finally:
+            simulation.cleanup()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+
+from models.citizen import CitizenUpdateEngine
+from models.legislative import Parliament
+from models.media import MediaInfluenceEngine
+from models.political_party import PoliticalParty, Ideology
+from models.population import PopulationStore, PopulationAggregates, VoterRoll
+from models.referendum import ReferendumSystem, ReferendumType
+from models.rng import SimulationRNG
+from sharding import ShardedExecutor
+
+NEWS_CYCLE = [{'sentiment': s} for s in (-0.6, 0.4, 0.7)]
+ECONOMY = {'gdp_growth': 0.02}
+POLICIES = ['ECONOMY', 'HEALTHCARE']
+SOCIAL = {'citizen_satisfaction': 0.5, 'social_cohesion': 0.6, 'media_trust': 0.4}
+
+class TestShardedExecutor(unittest.TestCase):
+    def run_month(self, workers):
+        """Population update, media and one referendum, serially or on `workers` processes"""
+        streams = SimulationRNG(21, shard_size=256)
+        store = PopulationStore()
+        store.add_random(2000, np.random.default_rng(4))
+        aggregates = PopulationAggregates(store)
+        roll = VoterRoll(store)
+        update = CitizenUpdateEngine(streams.sharded('citizen_update'))
+        media = MediaInfluenceEngine(streams.sharded('media'), passes=2)
+        system = ReferendumSystem(Parliament(100), rng=streams.sharded('referendum'))
+        referendum = system.propose_referendum("Budget", "Budget", ReferendumType.NATIONAL)
+        system.start_referendum(referendum)
+        positions = {PoliticalParty("Greens", Ideology.LEFT): 0.0}
+
+        if workers == 1:
+            update.apply(store, ECONOMY, POLICIES, SOCIAL)
+            media.apply(store, NEWS_CYCLE)
+            votes = system.cast_bulk(referendum, {name: store.column(name)[roll.slots()]
+                                                  for name in ReferendumSystem.VOTER_COLUMNS},
+                                     {'support_ratio': 0.7}, positions)
+        else:
+            with ShardedExecutor(streams, workers) as executor:
+                executor.update_citizens(store, update, ECONOMY, POLICIES, SOCIAL)
+                executor.apply_media(store, media, NEWS_CYCLE)
+                votes = executor.cast_bulk(system, referendum, store, roll.slots(),
+                                           {'support_ratio': 0.7}, positions)
+                store.add_random(10, np.random.default_rng(1))  # Growth reallocates shared columns
+        aggregates.verify()
+        return store, votes
+
+    def test_parallel_run_is_bit_identical_to_serial(self):
+        serial, serial_votes = self.run_month(1)
+        parallel, parallel_votes = self.run_month(2)
+        self.assertEqual(parallel_votes, serial_votes)
+        for name in ('happiness', 'age', 'trust_in_government', 'satisfaction_level'):
+            np.testing.assert_array_equal(parallel.column(name)[:len(serial)], serial.column(name))
+
+if __name__ == '__main__':
+    unittest.main()
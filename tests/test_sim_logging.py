@@ -0,0 +1,58 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import unittest
+
+from sim_logging import LogPipeline
+
+class FormattedIn:
+    """Log argument that records which thread turned it into text"""
+    def __init__(self):
+        self.threads = []
+
+    def __str__(self):
+        self.threads.append(threading.current_thread())
+        return "value"
+
+class TestLogPipeline(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'log')
+        self.logger = logging.getLogger('tests.sim_logging')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_messages_are_formatted_by_the_writer_thread(self):
+        pipeline = LogPipeline([self.logger], level=logging.INFO, path=self.path, console=False)
+        argument = FormattedIn()
+        self.logger.info("Lazy %s", argument)
+        self.logger.debug("Filtered %s", argument)  # Below the level: never formatted
+        pipeline.close()
+
+        self.assertEqual(len(argument.threads), 1)
+        self.assertIsNot(argument.threads[0], threading.current_thread())
+        with open(self.path) as handle:
+            lines = handle.read().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith("INFO - Lazy value"))
+        self.assertNotIn(pipeline.handler, self.logger.handlers)
+
+    def test_json_lines_with_context(self):
+        day = [0]
+        pipeline = LogPipeline([self.logger], level=logging.DEBUG, path=self.path, console=False,
+                               json_lines=True, flush_every=1000, context=lambda: {'day': day[0]})
+        for day[0] in range(3):
+            self.logger.debug("Month %d", day[0])
+        pipeline.close()  # Flushes the buffered records
+
+        with open(self.path) as handle:
+            entries = [json.loads(line) for line in handle]
+        self.assertEqual([entry['day'] for entry in entries], [0, 1, 2])
+        self.assertEqual(entries[2]['message'], "Month 2")
+        self.assertEqual(entries[0]['level'], 'DEBUG')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -60,5 +60,15 @@ class TestSocietySystem(unittest.TestCase):
         finally:
             random.random = original_random
 
+    def test_demographic_snapshot_cached_per_tick(self):
+        snapshot = self.society.get_demographic_snapshot()
+        self.assertIs(self.society.get_demographic_snapshot(), snapshot)
+        self.assertEqual(snapshot.population, len(self.society.citizens))
+        self.assertEqual(sum(snapshot.age_bands.values()), snapshot.population)
+        self.assertEqual(snapshot.religious_groups, len({c.religion for c in self.society.citizens}))
+
+        self.society.update_population()
+        self.assertIsNot(self.society.get_demographic_snapshot(), snapshot)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
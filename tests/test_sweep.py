@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+import config
+import models.demographics as demographics
+from models.legislative import Parliament
+from sweep import ParameterSweep, config_overrides, grid, latin_hypercube
+
+class TestConfigOverrides(unittest.TestCase):
+    def test_overrides_reach_star_imported_globals_and_are_restored(self):
+        original = demographics.BIRTH_RATE
+        with config_overrides(BIRTH_RATE=0.5):
+            self.assertEqual(demographics.BIRTH_RATE, 0.5)
+            self.assertEqual(config.BIRTH_RATE, 0.5)
+            self.assertEqual(demographics.DemographicEngine(np.random.default_rng(0)).birth_rate, 0.5)
+        self.assertEqual(demographics.BIRTH_RATE, original)
+        self.assertEqual(config.BIRTH_RATE, original)
+
+        with self.assertRaises(ValueError):
+            with config_overrides(NOT_A_PARAMETER=1):
+                pass
+
+    def test_parameters_no_function_reads_are_rejected(self):
+        # MAX_PARTY_MEMBERS is defined in config but never read
+        with self.assertRaises(ValueError):
+            with config_overrides(MAX_PARTY_MEMBERS=10):
+                pass
+        # Simulation sets DEBUG_MODE from its debug_mode argument
+        with self.assertRaises(ValueError):
+            with config_overrides(DEBUG_MODE=True):
+                pass
+        with config_overrides(PARLIAMENT_TOTAL_SEATS=400, PARLIAMENT_QUORUM=0.6, ECONOMIC_CRISIS_THRESHOLD=0.0):
+            self.assertEqual(Parliament(100).quorum_percentage, 0.6)
+
+class TestParameterSweep(unittest.TestCase):
+    def test_designs(self):
+        self.assertEqual(len(grid({'BIRTH_RATE': [0.01, 0.02], 'DEATH_RATE': [0.005, 0.01, 0.02]})), 6)
+        points = latin_hypercube({'BIRTH_RATE': (0.0, 0.1), 'PARLIAMENT_TOTAL_SEATS': (200, 400)}, 5, seed=1)
+        # One sample per stratum
+        strata = sorted(int(point['BIRTH_RATE'] / 0.02) for point in points)
+        self.assertEqual(strata, [0, 1, 2, 3, 4])
+        self.assertTrue(all(isinstance(point['PARLIAMENT_TOTAL_SEATS'], int) for point in points))
+
+    def test_swept_parameters_change_outcomes(self):
+        points = latin_hypercube({'BIRTH_RATE': (0.0, 1.2), 'PARLIAMENT_TOTAL_SEATS': (200, 600)}, 3, seed=2)
+        rows = ParameterSweep(points, replicas=1, seed=4, months=3, initial_population=200, workers=1).run()
+        self.assertEqual(len({row['population'] for row in rows}), 3)
+
+    def test_quorum_and_crisis_thresholds_change_outcomes(self):
+        points = [{'PARLIAMENT_QUORUM': 0.5, 'ECONOMIC_CRISIS_THRESHOLD': -2.0},
+                  {'PARLIAMENT_QUORUM': 1.5, 'ECONOMIC_CRISIS_THRESHOLD': 2.0}]
+        rows = ParameterSweep(points, replicas=1, seed=4, months=3, initial_population=200, workers=1).run()
+        self.assertEqual([row['crisis_months'] for row in rows], [0.0, 3.0])
+        self.assertNotEqual(rows[0]['mean_overall_stability'], rows[1]['mean_overall_stability'])
+
+    def test_cached_points_are_not_recomputed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = os.path.join(directory, 'sweep.jsonl')
+
+            def sweep(points):
+                return ParameterSweep(points, replicas=2, seed=4, months=3, initial_population=200,
+                                      workers=1, cache=cache).run()
+
+            first = sweep(grid({'BIRTH_RATE': [0.01, 0.2]}))
+            self.assertEqual(len(first), 4)
+            self.assertEqual({row['BIRTH_RATE'] for row in first}, {0.01, 0.2})
+            with open(cache) as handle:
+                self.assertEqual(len(handle.readlines()), 4)
+
+            second = sweep(grid({'BIRTH_RATE': [0.01, 0.2, 0.3]}))
+            for cached, computed in zip(second, first):
+                self.assertEqual(cached['gdp'], computed['gdp'])
+                self.assertEqual(cached['population'], computed['population'])
+            with open(cache) as handle:
+                self.assertEqual(len(handle.readlines()), 6)  # Only the new point ran
+
+if __name__ == '__main__':
+    unittest.main()